@@ -1,4 +1,4 @@
-﻿from fastapi import APIRouter
+﻿from fastapi import APIRouter, Depends
 
 from app.api.routes import (
     card_router,
@@ -9,8 +9,10 @@ from app.api.routes import (
     user_router,
     list_router,
 )
+from app.core.limiter import limiter
 
-api_router = APIRouter()
+# Limite padrão (token bucket por usuário/IP) em todas as rotas da API
+api_router = APIRouter(dependencies=[Depends(limiter.limit())])
 
 api_router.include_router(user_router.router, prefix="/users", tags=["Users"])
 api_router.include_router(project_router.router, prefix="/projects", tags=["Projects"])
@@ -3,6 +3,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import NoResultFound
 
 from app.core.deps import get_current_user, get_session
+from app.core.limiter import limiter
 from app.rules.card import CardRules
 from app.schemas.card_schema import (
     CardDependenciesResponse,
@@ -14,6 +15,7 @@ from app.schemas.card_schema import (
     CardSchemaUp,
     CardSearchResult,
 )
+from app.schemas.serializers import card_to_json, json_response
 from app.schemas.user_schema import UserSchema
 
 router = APIRouter()
@@ -41,6 +43,7 @@ async def create_card(
 
 
 @router.get("/search", response_model=list[CardSearchResult])
+@limiter.cost(5)
 async def search_cards(
     q: str = Query(..., description="Search by card title or number"),
     project_id: int = Query(None, description="Filter by project (optional)"),
@@ -67,7 +70,7 @@ async def get_card_by_id(
 
     try:
         card = await rules.get_card_by_id(card_id)
-        return card
+        return json_response(card_to_json(card))
     except NoResultFound:
         raise HTTPException(
             status_code=404, detail=f"Card id={card_id} not found."
@@ -4,13 +4,18 @@ from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.deps import get_current_user, get_session
+from app.core.limiter import limiter, range_cost
 from app.rules.dashboard import DashboardRules
 from app.schemas.dashboard_schema import (
     BurndownResponse,
+    CfdResponse,
+    ForecastResponse,
     MyCardsResponse,
     MyDayResponse,
     PendingApprovalsResponse,
     ProjectStatsResponse,
+    ThroughputResponse,
+    TimeDistributionResponse,
 )
 from app.schemas.user_schema import UserSchema
 
@@ -69,6 +74,7 @@ async def project_stats(
 
 
 @router.get("/project/{project_id}/burndown", response_model=BurndownResponse)
+@limiter.cost(range_cost)
 async def project_burndown(
     project_id: int,
     start: date = Query(..., description="Data de início do período (YYYY-MM-DD)"),
@@ -82,3 +88,81 @@ async def project_burndown(
     """
     rules = DashboardRules(db)
     return await rules.get_burndown(project_id, start, end)
+
+
+@router.get("/project/{project_id}/cfd", response_model=CfdResponse)
+@limiter.cost(range_cost)
+async def project_cfd(
+    project_id: int,
+    start: date = Query(..., description="Data de início do período (YYYY-MM-DD)"),
+    end: date = Query(..., description="Data de fim do período (YYYY-MM-DD)"),
+    current_user: UserSchema = Depends(get_current_user),
+    db: AsyncSession = Depends(get_session),
+):
+    """
+    Retorna o cumulative flow diagram de um período: cards por lista no fim de
+    cada dia, reconstruído a partir dos eventos "moved" de card_history.
+    """
+    rules = DashboardRules(db)
+    return await rules.get_cfd(project_id, start, end)
+
+
+@router.get(
+    "/project/{project_id}/time-distribution", response_model=TimeDistributionResponse
+)
+@limiter.cost(range_cost)
+async def project_time_distribution(
+    project_id: int,
+    start: date = Query(..., description="Data de início do período (YYYY-MM-DD)"),
+    end: date = Query(..., description="Data de fim do período (YYYY-MM-DD)"),
+    tag_id: int | None = Query(None, description="Filtra por tag (opcional)"),
+    category_id: int | None = Query(None, description="Filtra por categoria (opcional)"),
+    buckets: int = Query(10, ge=1, le=100, description="Quantidade de buckets do histograma"),
+    current_user: UserSchema = Depends(get_current_user),
+    db: AsyncSession = Depends(get_session),
+):
+    """
+    Retorna percentis (p50/p85/p95) e histograma de lead time e cycle time dos
+    cards concluídos no período.
+    """
+    rules = DashboardRules(db)
+    return await rules.get_time_distribution(
+        project_id, start, end, tag_id=tag_id, category_id=category_id, buckets=buckets
+    )
+
+
+@router.get("/project/{project_id}/throughput", response_model=ThroughputResponse)
+async def project_throughput(
+    project_id: int,
+    weeks: int = Query(12, ge=1, le=104, description="Quantidade de semanas (incluindo a atual)"),
+    current_user: UserSchema = Depends(get_current_user),
+    db: AsyncSession = Depends(get_session),
+):
+    """
+    Retorna o throughput semanal do projeto: cards e story points concluídos
+    por semana ISO nas últimas ``weeks`` semanas.
+    """
+    rules = DashboardRules(db)
+    return await rules.get_throughput(project_id, weeks)
+
+
+@router.get("/project/{project_id}/forecast", response_model=ForecastResponse)
+@limiter.cost(5)
+async def project_forecast(
+    project_id: int,
+    cards: int | None = Query(
+        None, ge=0, description="Quantidade de cards (padrão: backlog fora da lista final)"
+    ),
+    history_days: int = Query(90, ge=7, le=730, description="Dias de histórico amostrados"),
+    trials: int = Query(10_000, ge=100, le=20_000, description="Quantidade de simulações"),
+    current_user: UserSchema = Depends(get_current_user),
+    db: AsyncSession = Depends(get_session),
+):
+    """
+    Previsão Monte Carlo de quando os cards serão concluídos, reamostrando o
+    throughput diário histórico. Retorna as datas p50/p85/p95.
+    """
+    rules = DashboardRules(db)
+    return await rules.get_forecast(
+        project_id, cards=cards, history_days=history_days, trials=trials
+    )
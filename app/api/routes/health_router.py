@@ -0,0 +1,26 @@
+from fastapi import APIRouter, Request, Response, status
+
+from app.core.health import check_readiness, uptime_seconds
+from app.db.conection import Session, engine
+from app.schemas.health_schema import HealthResponse, ReadinessResponse
+
+# Fora de /api: sem autenticação e sem rate limit, para o balanceador
+router = APIRouter()
+
+
+@router.get("/health", response_model=HealthResponse)
+async def health():
+    """Liveness: o processo responde. Não faz I/O."""
+    return HealthResponse(status="ok", uptime_seconds=uptime_seconds())
+
+
+@router.get("/ready", response_model=ReadinessResponse)
+async def ready(request: Request, response: Response):
+    """
+    Readiness: 200 se o worker pode receber tráfego, 503 caso contrário
+    (aquecendo, banco lento/fora ou pool saturado), com o tempo de cada checagem.
+    """
+    result = await check_readiness(request.app.state, engine, Session)
+    if result.status != "ready":
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    return result
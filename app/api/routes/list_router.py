@@ -4,6 +4,7 @@ from sqlalchemy.exc import NoResultFound
 
 from app.schemas.list_schema import ListSchema, ListSchemaSlim, ListSchemaUp
 from app.schemas.card_schema import CardPageResponse
+from app.schemas.serializers import card_page_to_json, json_response, list_slim_to_json
 from app.core.deps import get_session, get_current_user
 from app.rules.list import ListRules
 from app.schemas.user_schema import UserSchema
@@ -18,7 +19,8 @@ async def get_lists(
     current_user: UserSchema = Depends(get_current_user),
 ):
     rules = ListRules(db)
-    return await rules.get_lists_slim(project_id)
+    lists = await rules.get_lists_slim(project_id)
+    return json_response([list_slim_to_json(lst) for lst in lists])
 
 
 @router.get("/{list_id}/cards", response_model=CardPageResponse)
@@ -31,7 +33,8 @@ async def get_cards_for_list(
     current_user: UserSchema = Depends(get_current_user),
 ):
     rules = ListRules(db)
-    return await rules.get_cards_for_list_paginated(list_id, page, limit)
+    page_data = await rules.get_cards_for_list_paginated(list_id, page, limit)
+    return json_response(card_page_to_json(page_data))
 
 
 @router.post("/", response_model=ListSchema, status_code=status.HTTP_201_CREATED)
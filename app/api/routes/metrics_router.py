@@ -0,0 +1,12 @@
+from fastapi import APIRouter, Response
+
+from app.core.metrics import CONTENT_TYPE, render
+
+# Fora de /api, como /health e /ready: lido pelo Prometheus de cada worker
+router = APIRouter()
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Métricas do processo no formato texto do Prometheus."""
+    return Response(render(), media_type=CONTENT_TYPE)
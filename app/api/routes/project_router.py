@@ -11,8 +11,14 @@ from app.schemas.project_schema import (
     ProjectSchemaUp,
 )
 from app.schemas.tag_schema import TagSchema
-from app.schemas.project_user_schema import ProjectUserSchemaBase, ProjectMemberSearchItem, UpdateMemberRoleRequest
+from app.schemas.project_user_schema import (
+    ProjectMemberSearchItem,
+    ProjectUserSchemaBase,
+    UpdateMemberRoleRequest,
+    UpdateProjectUsersResponse,
+)
 from app.core.deps import get_current_user, get_session
+from app.core.limiter import limiter
 from app.rules.project import ProjectRules
 from app.schemas.user_schema import UserSchema
 
@@ -125,6 +131,7 @@ async def update_project_member_role(
 
 
 @router.get("/{project_id}/members/search", response_model=list[ProjectMemberSearchItem])
+@limiter.cost(5)
 async def search_project_members(
     project_id: int,
     q: str = Query(min_length=1),
@@ -162,7 +169,7 @@ async def get_project_tags(
     return await rules.get_project_tags(project_id, search=q)
 
 
-@router.put("/{project_id}/users")
+@router.put("/{project_id}/users", response_model=UpdateProjectUsersResponse)
 async def update_project_users(
     project_id: int,
     users: list[ProjectUserSchemaBase],
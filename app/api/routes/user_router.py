@@ -1,5 +1,5 @@
 ﻿from datetime import datetime, timedelta, timezone
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.limiter import limiter
@@ -9,6 +9,7 @@ from pydantic import BaseModel as PydanticBaseModel
 from app.core.configs import settings
 from app.schemas.user_schema import (
     ForgotPasswordRequest,
+    MessageResponse,
     ResetPasswordRequest,
     UserSchemaCreate,
     UserSchemaUp,
@@ -27,10 +28,12 @@ from app.db.models.user_notes_model import UserNotesModel
 router = APIRouter()
 
 
-@router.post("/login", response_model=TokenData)
-@limiter.limit("10/minute")
+@router.post(
+    "/login",
+    response_model=TokenData,
+    dependencies=[Depends(limiter.limit("10/minute", scope="login"))],
+)
 async def login(
-    request: Request,
     login_data: OAuth2PasswordRequestForm = Depends(),
     db_session: AsyncSession = Depends(get_session),
 ):
@@ -94,7 +97,7 @@ async def get_user(
     return user
 
 
-@router.get("/me/notes")
+@router.get("/me/notes", response_model=NotesBody)
 async def get_notes(
     db_session: AsyncSession = Depends(get_session),
     current_user: UserModel = Depends(get_current_user),
@@ -107,7 +110,7 @@ async def get_notes(
     return {"notes": notes_row.content if notes_row else ""}
 
 
-@router.put("/me/notes")
+@router.put("/me/notes", response_model=NotesBody)
 async def save_notes(
     body: NotesBody,
     db_session: AsyncSession = Depends(get_session),
@@ -126,10 +129,12 @@ async def save_notes(
     return {"notes": body.notes}
 
 
-@router.post("/forgot-password")
-@limiter.limit("3/minute")
+@router.post(
+    "/forgot-password",
+    response_model=MessageResponse,
+    dependencies=[Depends(limiter.limit("3/minute", scope="forgot-password"))],
+)
 async def forgot_password(
-    request: Request,
     data: ForgotPasswordRequest,
     db_session: AsyncSession = Depends(get_session),
 ):
@@ -140,7 +145,7 @@ async def forgot_password(
     }
 
 
-@router.post("/reset-password")
+@router.post("/reset-password", response_model=MessageResponse)
 async def reset_password(
     data: ResetPasswordRequest,
     db_session: AsyncSession = Depends(get_session),
@@ -14,7 +14,7 @@ from pydantic import EmailStr
 
 from app.db.models.user_model import UserModel
 from app.core.configs import settings
-from app.core.security import verification_password
+from app.core.security import verification_password_async
 
 oaut2_schema = OAuth2PasswordBearer(tokenUrl=f"{settings.API_STR}/users/login")
 
@@ -35,7 +35,7 @@ class TokenService:
 
             if not user:
                 return None
-            if not verification_password(password, user.password):
+            if not await verification_password_async(password, user.password):
                 return None
 
             return user
@@ -21,6 +21,14 @@ class Settings(BaseSettings):
     EMAIL: str = config("EMAIL")
     EMAIL_PASSWORD: str = config("EMAIL_PASSWORD")
 
+    # Envio de e-mails pela outbox: transporte "smtp", "console" ou "file"
+    EMAIL_TRANSPORT: str = config("EMAIL_TRANSPORT", default="smtp")
+    EMAIL_FILE_DIR: str = config("EMAIL_FILE_DIR", default="sent_emails")
+    EMAIL_WORKER_ENABLED: bool = config("EMAIL_WORKER_ENABLED", default=True, cast=bool)
+    EMAIL_POLL_SECONDS: int = config("EMAIL_POLL_SECONDS", default=5, cast=int)
+    EMAIL_BATCH_SIZE: int = config("EMAIL_BATCH_SIZE", default=50, cast=int)
+    EMAIL_MAX_ATTEMPTS: int = config("EMAIL_MAX_ATTEMPTS", default=5, cast=int)
+
     FRONT_URL: str = config("FRONT_URL")
     """
     import secrets
@@ -31,6 +39,61 @@ class Settings(BaseSettings):
 
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 7
 
+    # Rate limiting (token bucket): limite padrão por usuário/IP e backend
+    # "memory" (por worker, LRU) ou "database" (compartilhado entre workers)
+    RATE_LIMIT_ENABLED: bool = config("RATE_LIMIT_ENABLED", default=True, cast=bool)
+    RATE_LIMIT_DEFAULT: str = config("RATE_LIMIT_DEFAULT", default="120/minute")
+    RATE_LIMIT_BACKEND: str = config("RATE_LIMIT_BACKEND", default="memory")
+    RATE_LIMIT_MAX_BUCKETS: int = config("RATE_LIMIT_MAX_BUCKETS", default=10_000, cast=int)
+    # Intervalo da limpeza dos baldes parados no backend "database"
+    RATE_LIMIT_PRUNE_MINUTES: int = config("RATE_LIMIT_PRUNE_MINUTES", default=60, cast=int)
+
+    # Compressão das respostas (ver benchmarks/bench_compression.py)
+    COMPRESSION_MIN_SIZE: int = config("COMPRESSION_MIN_SIZE", default=1024, cast=int)
+    COMPRESSION_GZIP_LEVEL: int = config("COMPRESSION_GZIP_LEVEL", default=5, cast=int)
+    COMPRESSION_BROTLI_QUALITY: int = config("COMPRESSION_BROTLI_QUALITY", default=4, cast=int)
+
+    # Threads dedicadas ao bcrypt (0 = min(4, CPUs))
+    PASSWORD_HASH_WORKERS: int = config("PASSWORD_HASH_WORKERS", default=0, cast=int)
+
+    # Estratégia do burndown: "python" (varredura no app), "sql" (série no Postgres)
+    # ou "snapshot" (fotos diárias em project_snapshots)
+    BURNDOWN_STRATEGY: str = config("BURNDOWN_STRATEGY", default="python")
+
+    # Validade do throughput em cache em cada worker (as conclusões de outros
+    # workers só aparecem depois desse prazo)
+    THROUGHPUT_CACHE_SECONDS: float = config("THROUGHPUT_CACHE_SECONDS", default=60, cast=float)
+
+    # Pool de conexões do SQLAlchemy (por worker)
+    DB_POOL_SIZE: int = config("DB_POOL_SIZE", default=5, cast=int)
+    DB_MAX_OVERFLOW: int = config("DB_MAX_OVERFLOW", default=10, cast=int)
+
+    # /ready: tempo máximo das checagens e uso do pool a partir do qual o worker sai do balanceador
+    READY_TIMEOUT_SECONDS: float = config("READY_TIMEOUT_SECONDS", default=1.0, cast=float)
+    READY_MAX_POOL_USAGE: float = config("READY_MAX_POOL_USAGE", default=0.9, cast=float)
+
+    # /metrics no formato do Prometheus (middleware + hooks de consulta no engine)
+    METRICS_ENABLED: bool = config("METRICS_ENABLED", default=True, cast=bool)
+    # Loga possível N+1: mesmo formato de consulta repetido N vezes numa requisição (0 desliga)
+    DB_QUERY_REPEAT_THRESHOLD: int = config("DB_QUERY_REPEAT_THRESHOLD", default=5, cast=int)
+
+    # Log de consultas lentas (0 desliga) e EXPLAIN (ANALYZE, BUFFERS) de uma
+    # amostra delas; o EXPLAIN fica ligado por padrão só com TEST_MODE
+    SLOW_QUERY_MS: float = config("SLOW_QUERY_MS", default=500, cast=float)
+    SLOW_QUERY_EXPLAIN: bool = config(
+        "SLOW_QUERY_EXPLAIN", default=config("TEST_MODE", default=False, cast=bool), cast=bool
+    )
+    SLOW_QUERY_EXPLAIN_SAMPLE: float = config("SLOW_QUERY_EXPLAIN_SAMPLE", default=0.2, cast=float)
+
+    # Aquecimento do worker no startup (pool, mappers e consultas quentes)
+    WARMUP_ENABLED: bool = config("WARMUP_ENABLED", default=True, cast=bool)
+    WARMUP_CONNECTIONS: int = config("WARMUP_CONNECTIONS", default=5, cast=int)
+    WARMUP_TIMEOUT_SECONDS: float = config("WARMUP_TIMEOUT_SECONDS", default=30, cast=float)
+
+    # Job em processo que grava a foto diária de cada projeto
+    SNAPSHOT_JOB_ENABLED: bool = config("SNAPSHOT_JOB_ENABLED", default=True, cast=bool)
+    SNAPSHOT_INTERVAL_MINUTES: int = config("SNAPSHOT_INTERVAL_MINUTES", default=60, cast=int)
+
     @property
     def DB_URL(self) -> str:
         return config("DB_URL_TEST") if self.TEST_MODE else config("DB_URL")
@@ -17,6 +17,11 @@ class TokenData(BaseModel):
     username: Optional[str] = None
 
 
+def current_user_query(user_id: int):
+    """Consulta do usuário autenticado (também executada no aquecimento do worker)."""
+    return select(UserModel).filter(UserModel.id == user_id)
+
+
 async def get_session() -> Generator:
     session: AsyncSession = Session()
 
@@ -52,7 +57,7 @@ async def get_current_user(
         raise credention_exception
 
     async with db as session:
-        query = select(UserModel).filter(UserModel.id == int(token_data.username))
+        query = current_user_query(int(token_data.username))
         result = await session.execute(query)
         user: UserModel = result.scalars().unique().one_or_none()
 
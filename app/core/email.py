@@ -1,18 +1,103 @@
-﻿import smtplib
+﻿import asyncio
+import logging
+from abc import ABC, abstractmethod
+import smtplib
+from datetime import datetime
 from email.mime.text import MIMEText
+from pathlib import Path
 
 from app.core.configs import settings
 
+logger = logging.getLogger(__name__)
 
-def send_email(to: str, subject: str, body: str):
-    from_address = settings.EMAIL
-    password = settings.EMAIL_PASSWORD
+SMTP_HOST = "smtp.gmail.com"
+SMTP_PORT = 465
 
+
+def build_message(to: str, subject: str, body: str) -> MIMEText:
     msg = MIMEText(body)
     msg["Subject"] = subject
-    msg["From"] = from_address
+    msg["From"] = settings.EMAIL
     msg["To"] = to
+    return msg
+
+
+class EmailTransport(ABC):
+    """
+    Transporte usado pelo worker da outbox. open()/close() delimitam um lote:
+    a conexão aberta em open() é reaproveitada por todos os send() do lote.
+    """
+
+    async def open(self) -> None:
+        pass
+
+    @abstractmethod
+    async def send(self, to: str, subject: str, body: str) -> None:
+        ...
+
+    async def close(self) -> None:
+        pass
+
+
+class SmtpTransport(EmailTransport):
+    """SMTP (SSL) com uma conexão por lote; as chamadas bloqueantes rodam em thread."""
+
+    def __init__(self, host: str = SMTP_HOST, port: int = SMTP_PORT):
+        self.host = host
+        self.port = port
+        self._server: smtplib.SMTP_SSL | None = None
+
+    def _connect(self) -> smtplib.SMTP_SSL:
+        server = smtplib.SMTP_SSL(self.host, self.port, timeout=30)
+        server.login(settings.EMAIL, settings.EMAIL_PASSWORD)
+        return server
+
+    async def open(self) -> None:
+        self._server = await asyncio.to_thread(self._connect)
+
+    async def send(self, to: str, subject: str, body: str) -> None:
+        msg = build_message(to, subject, body)
+        try:
+            await asyncio.to_thread(self._server.send_message, msg)
+        except smtplib.SMTPServerDisconnected:
+            # Conexão derrubada pelo servidor no meio do lote: reconecta uma vez
+            self._server = await asyncio.to_thread(self._connect)
+            await asyncio.to_thread(self._server.send_message, msg)
+
+    async def close(self) -> None:
+        if self._server is not None:
+            server, self._server = self._server, None
+            try:
+                await asyncio.to_thread(server.quit)
+            except smtplib.SMTPException:
+                pass
+
+
+class ConsoleTransport(EmailTransport):
+    """Apenas registra o e-mail no log (desenvolvimento local)."""
+
+    async def send(self, to: str, subject: str, body: str) -> None:
+        logger.info("Email to %s: %s\n%s", to, subject, body)
+
+
+class FileTransport(EmailTransport):
+    """Grava cada e-mail como um arquivo .eml em ``directory`` (testes e desenvolvimento)."""
+
+    def __init__(self, directory: str | Path):
+        self.directory = Path(directory)
+
+    async def open(self) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    async def send(self, to: str, subject: str, body: str) -> None:
+        name = f"{datetime.utcnow():%Y%m%dT%H%M%S%f}-{to}.eml"
+        (self.directory / name).write_text(build_message(to, subject, body).as_string())
+
 
-    with smtplib.SMTP_SSL("smtp.gmail.com", 465) as server:
-        server.login(from_address, password)
-        server.send_message(msg)
+def get_transport() -> EmailTransport:
+    """Transporte configurado em EMAIL_TRANSPORT."""
+    if settings.EMAIL_TRANSPORT == "console":
+        return ConsoleTransport()
+    if settings.EMAIL_TRANSPORT == "file":
+        return FileTransport(settings.EMAIL_FILE_DIR)
+    return SmtpTransport()
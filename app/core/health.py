@@ -0,0 +1,89 @@
+import asyncio
+import time
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.configs import settings
+from app.core.security import hash_pool_stats
+from app.rules.email_outbox import EmailOutboxRules
+from app.schemas.health_schema import (
+    DependencyCheck,
+    HashPoolCheck,
+    OutboxCheck,
+    PoolCheck,
+    ReadinessResponse,
+)
+
+_STARTED = time.monotonic()
+
+
+def uptime_seconds() -> float:
+    return round(time.monotonic() - _STARTED, 1)
+
+
+async def _timed(awaitable, timeout: float) -> tuple[bool, float, object, str | None]:
+    """Executa com limite de tempo; retorna (ok, ms, valor, erro)."""
+    started = time.perf_counter()
+    try:
+        value = await asyncio.wait_for(awaitable, timeout)
+    except asyncio.TimeoutError:
+        return False, _ms(started), None, "timeout"
+    except Exception as exc:
+        return False, _ms(started), None, type(exc).__name__
+    return True, _ms(started), value, None
+
+
+def _ms(started: float) -> float:
+    return round((time.perf_counter() - started) * 1000, 2)
+
+
+def pool_check(engine: AsyncEngine, capacity: int, max_usage: float) -> PoolCheck:
+    """Conexões em uso no pool deste worker em relação a pool_size + max_overflow."""
+    checked_out = engine.pool.checkedout()
+    usage = round(checked_out / capacity, 2) if capacity else 1.0
+    return PoolCheck(
+        ok=usage < max_usage, checked_out=checked_out, capacity=capacity, usage=usage
+    )
+
+
+async def _ping(engine: AsyncEngine) -> None:
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+
+
+async def _outbox_backlog(session_factory) -> int:
+    async with session_factory() as session:
+        return await EmailOutboxRules(session).count_pending()
+
+
+async def check_readiness(state, engine: AsyncEngine, session_factory) -> ReadinessResponse:
+    """
+    Prontidão do worker: aquecimento concluído, banco respondendo dentro de
+    READY_TIMEOUT_SECONDS e pool abaixo de READY_MAX_POOL_USAGE. A fila da
+    outbox e o pool do bcrypt são informativos (não tiram o worker do ar).
+    """
+    started = time.perf_counter()
+    timeout = settings.READY_TIMEOUT_SECONDS
+    # O pool é lido antes das checagens, que também pegam conexões dele
+    pool = pool_check(
+        engine, settings.DB_POOL_SIZE + settings.DB_MAX_OVERFLOW, settings.READY_MAX_POOL_USAGE
+    )
+    (db_ok, db_ms, _, db_error), (outbox_ok, outbox_ms, pending, outbox_error) = (
+        await asyncio.gather(
+            _timed(_ping(engine), timeout),
+            _timed(_outbox_backlog(session_factory), timeout),
+        )
+    )
+
+    warmed_up = bool(getattr(state, "ready", False))
+    ready = warmed_up and db_ok and pool.ok
+    return ReadinessResponse(
+        status="ready" if ready else "not_ready",
+        warmed_up=warmed_up,
+        database=DependencyCheck(ok=db_ok, ms=db_ms, error=db_error),
+        pool=pool,
+        email_outbox=OutboxCheck(ok=outbox_ok, ms=outbox_ms, error=outbox_error, pending=pending),
+        password_hashing=HashPoolCheck(**hash_pool_stats()),
+        ms=_ms(started),
+    )
@@ -1,4 +1,207 @@
-from slowapi import Limiter
-from slowapi.util import get_remote_address
+"""
+Rate limiting por token bucket.
 
-limiter = Limiter(key_func=get_remote_address)
+Cada chave (usuário autenticado ou, sem token, o IP) tem um balde com
+``capacity`` fichas que se recompõe continuamente a ``capacity`` por período.
+Uma requisição consome o custo da rota (1 por padrão, ver RateLimiter.cost);
+sem fichas suficientes a resposta é 429 com Retry-After.
+
+Backends:
+- MemoryBackend: baldes em memória com despejo LRU (memória limitada), por worker;
+- DatabaseBackend: baldes na tabela rate_limit_buckets, um único orçamento
+  compartilhado por todos os workers (RATE_LIMIT_BACKEND=database). Baldes
+  parados há mais que o maior período (um dia) já estariam cheios e são
+  apagados periodicamente (DatabaseBackend.prune, job em app/main.py).
+"""
+import time
+from collections import OrderedDict
+from datetime import date
+from typing import Callable
+
+from fastapi import HTTPException, Request, status
+from jose import JWTError, jwt
+from sqlalchemy import text
+
+from app.core.configs import settings
+
+_PERIODS = {"second": 1, "minute": 60, "hour": 3600, "day": 86400}
+# Sem uso por um período inteiro o balde volta à capacidade: apagar equivale a recriar
+_IDLE_BUCKET_SECONDS = max(_PERIODS.values())
+
+
+def parse_rate(rate: str) -> tuple[int, float]:
+    """Converte "10/minute" em (capacidade, fichas por segundo)."""
+    amount, _, period = rate.partition("/")
+    capacity = int(amount)
+    return capacity, capacity / _PERIODS[period.strip().rstrip("s")]
+
+
+class MemoryBackend:
+    def __init__(self, max_buckets: int = 10_000, clock: Callable[[], float] = time.monotonic):
+        self.max_buckets = max_buckets
+        self.clock = clock
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+
+    async def consume(self, key: str, cost: int, capacity: int, refill: float) -> float:
+        """Consome ``cost`` fichas. Retorna 0 se permitido, senão os segundos de espera."""
+        now = self.clock()
+        tokens, updated = self._buckets.pop(key, (capacity, now))
+        tokens = min(capacity, tokens + (now - updated) * refill)
+
+        wait = 0.0
+        if tokens >= cost:
+            tokens -= cost
+        else:
+            wait = (cost - tokens) / refill
+
+        self._buckets[key] = (tokens, now)
+        if len(self._buckets) > self.max_buckets:
+            # Despeja o balde usado há mais tempo (já estaria quase cheio)
+            self._buckets.popitem(last=False)
+        return wait
+
+
+class DatabaseBackend:
+    """Baldes no Postgres, atualizados atomicamente em uma única instrução."""
+
+    # Fichas disponíveis agora: as restantes mais a recomposição desde updatedAt
+    _AVAILABLE = (
+        "LEAST(CAST(:capacity AS double precision), b.tokens"
+        ' + CAST(EXTRACT(EPOCH FROM clock_timestamp() - b."updatedAt") AS double precision)'
+        " * CAST(:refill AS double precision))"
+    )
+    _CONSUME = text(
+        f"""
+        INSERT INTO rate_limit_buckets AS b (key, tokens, "updatedAt")
+        VALUES (
+            :key,
+            CAST(:capacity AS double precision) - CAST(:cost AS double precision),
+            clock_timestamp()
+        )
+        ON CONFLICT (key) DO UPDATE SET
+            tokens = {_AVAILABLE} - CAST(:cost AS double precision),
+            "updatedAt" = clock_timestamp()
+        WHERE {_AVAILABLE} >= CAST(:cost AS double precision)
+        RETURNING b.tokens
+        """
+    )
+
+    _PRUNE = text(
+        """
+        DELETE FROM rate_limit_buckets
+        WHERE "updatedAt" < clock_timestamp() - make_interval(secs => :idle)
+        """
+    )
+
+    def __init__(self, session_factory):
+        self.session_factory = session_factory
+
+    async def consume(self, key: str, cost: int, capacity: int, refill: float) -> float:
+        async with self.session_factory() as session:
+            row = (
+                await session.execute(
+                    self._CONSUME,
+                    {"key": key, "cost": cost, "capacity": capacity, "refill": refill},
+                )
+            ).first()
+            await session.commit()
+        # Sem linha: o WHERE barrou a atualização por falta de fichas
+        return 0.0 if row is not None else cost / refill
+
+    async def prune(self, idle_seconds: float = _IDLE_BUCKET_SECONDS) -> int:
+        """Apaga os baldes sem uso há ``idle_seconds``. Retorna quantos foram apagados."""
+        async with self.session_factory() as session:
+            result = await session.execute(self._PRUNE, {"idle": idle_seconds})
+            await session.commit()
+        return result.rowcount
+
+
+class RateLimiter:
+    def __init__(self, backend, default_rate: str):
+        self.backend = backend
+        self.default_rate = default_rate
+
+    @staticmethod
+    def cost(value: int | Callable[[Request], int]):
+        """
+        Define o custo da rota no limite padrão: um inteiro ou uma função que
+        recebe o Request (ex.: proporcional ao período consultado).
+        """
+
+        def decorator(func):
+            func.__rate_limit_cost__ = value
+            return func
+
+        return decorator
+
+    def limit(self, rate: str | None = None, scope: str | None = None):
+        """
+        Dependência do FastAPI que aplica o limite.
+
+        Sem ``scope`` usa o balde padrão da chave, cobrando o custo da rota; com
+        ``scope`` usa um balde próprio (ex.: login), sempre com custo 1.
+        """
+        capacity, refill = parse_rate(rate or self.default_rate)
+
+        async def dependency(request: Request) -> None:
+            if not settings.RATE_LIMIT_ENABLED:
+                return
+            if scope is None:
+                route = request.scope.get("route")
+                value = getattr(getattr(route, "endpoint", None), "__rate_limit_cost__", 1)
+                cost = value(request) if callable(value) else value
+                key = f"default:{request_key(request)}"
+            else:
+                cost = 1
+                key = f"{scope}:{request_key(request)}"
+
+            # Custo acima da capacidade nunca passaria: limita à capacidade
+            wait = await self.backend.consume(key, min(cost, capacity), capacity, refill)
+            if wait > 0:
+                raise HTTPException(
+                    status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                    detail="Rate limit exceeded. Try again later.",
+                    headers={"Retry-After": str(max(1, round(wait)))},
+                )
+
+        return dependency
+
+
+def request_key(request: Request) -> str:
+    """Usuário do token Bearer (assinatura verificada) ou, sem token válido, o IP."""
+    authorization = request.headers.get("authorization", "")
+    scheme, _, token = authorization.partition(" ")
+    if scheme.lower() == "bearer" and token:
+        try:
+            payload = jwt.decode(
+                token,
+                settings.JWT_SECRET,
+                algorithms=[settings.ALGORITHM],
+                options={"verify_aud": False},
+            )
+            if payload.get("sub"):
+                return f"user:{payload['sub']}"
+        except JWTError:
+            pass
+    return f"ip:{request.client.host if request.client else 'unknown'}"
+
+
+def range_cost(request: Request) -> int:
+    """Custo de rotas com período start/end: 1 + 1 a cada 30 dias consultados."""
+    try:
+        start = date.fromisoformat(request.query_params["start"])
+        end = date.fromisoformat(request.query_params["end"])
+    except (KeyError, ValueError):
+        return 1
+    return 1 + max((end - start).days, 0) // 30
+
+
+def _build_backend():
+    if settings.RATE_LIMIT_BACKEND == "database":
+        from app.db.conection import Session
+
+        return DatabaseBackend(Session)
+    return MemoryBackend(max_buckets=settings.RATE_LIMIT_MAX_BUCKETS)
+
+
+limiter = RateLimiter(_build_backend(), settings.RATE_LIMIT_DEFAULT)
@@ -0,0 +1,393 @@
+"""
+Métricas da API no formato texto do Prometheus (GET /metrics).
+
+Registro mínimo, sem dependências: contadores, gauges e histogramas com
+labels, renderizados no formato de exposição 0.0.4. Os valores são por
+processo: com vários workers, cada um expõe os seus (o Prometheus agrega).
+
+- ``MetricsMiddleware``: latência por rota (template, não a URL), requisições
+  em andamento, status e consultas/tempo de banco por requisição;
+- ``instrument_engine``: hooks de cursor do SQLAlchemy (contagem e duração de
+  cada consulta) e gauges do pool;
+- ``TimedAsyncQueuePool``: pool que mede a espera por uma conexão;
+- ``CACHE_LOOKUPS``: acertos/erros dos caches em processo (hit ratio =
+  hits / (hits + misses));
+- ``query_budget``: limite de consultas de um bloco (testes de N+1).
+"""
+import collections
+import logging
+import re
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Callable, Iterator
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.configs import settings
+from app.core.security import hash_pool_stats
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Buckets em segundos: requisições HTTP e consultas/espera do pool
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+COUNT_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 100)
+
+
+class Registry:
+    def __init__(self):
+        self.metrics: list["_Metric"] = []
+
+    def register(self, metric: "_Metric") -> None:
+        self.metrics.append(metric)
+
+    def render(self) -> str:
+        lines = []
+        for metric in self.metrics:
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for name, labels, value in metric.samples():
+                lines.append(f"{name}{_labels(labels)} {_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, help: str, labels: tuple[str, ...] = (), registry=REGISTRY):
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self._values: dict[tuple[str, ...], object] = {}
+        registry.register(self)
+
+    def _labeled(self, values: tuple[str, ...]) -> list[tuple[str, str]]:
+        return list(zip(self.labels, values))
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def value(self, *labels: str) -> float:
+        return self._values.get(labels, 0.0)
+
+    def samples(self):
+        for labels, value in self._values.items():
+            yield self.name, self._labeled(labels), value
+
+
+class Gauge(_Metric):
+    """Gauge com valor mantido pela aplicação ou lido na coleta (``collect``)."""
+
+    kind = "gauge"
+
+    def __init__(self, *args, collect: Callable[[], dict | float] | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.collect = collect
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def dec(self, *labels: str, amount: float = 1.0) -> None:
+        self.inc(*labels, amount=-amount)
+
+    def value(self, *labels: str) -> float:
+        return self._values.get(labels, 0.0)
+
+    def samples(self):
+        values = self._values
+        if self.collect is not None:
+            collected = self.collect()
+            values = collected if isinstance(collected, dict) else {(): collected}
+        for labels, value in values.items():
+            yield self.name, self._labeled(labels), value
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, *args, buckets: tuple[float, ...] = LATENCY_BUCKETS, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, *labels: str) -> None:
+        state = self._values.get(labels)
+        if state is None:
+            # Contagem por bucket (não cumulativa; o último é o +Inf), soma, total
+            state = self._values[labels] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+        state[0][bisect_left(self.buckets, value)] += 1
+        state[1] += value
+        state[2] += 1
+
+    def count(self, *labels: str) -> int:
+        state = self._values.get(labels)
+        return state[2] if state else 0
+
+    def sum(self, *labels: str) -> float:
+        state = self._values.get(labels)
+        return state[1] if state else 0.0
+
+    def samples(self):
+        for labels, (counts, total, count) in self._values.items():
+            labeled = self._labeled(labels)
+            cumulative = 0
+            for bound, n in zip((*self.buckets, float("inf")), counts):
+                cumulative += n
+                yield f"{self.name}_bucket", [*labeled, ("le", _value(bound))], cumulative
+            yield f"{self.name}_sum", labeled, total
+            yield f"{self.name}_count", labeled, count
+
+
+def _labels(labels: list[tuple[str, str]]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels) + "}"
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+# ── Métricas da aplicação ─────────────────────────────────────────────────────
+
+HTTP_REQUESTS = Counter(
+    "http_requests_total", "Requisições HTTP por rota e status.", ("method", "route", "status")
+)
+HTTP_LATENCY = Histogram(
+    "http_request_duration_seconds", "Latência das requisições HTTP por rota.", ("method", "route")
+)
+HTTP_IN_PROGRESS = Gauge(
+    "http_requests_in_progress", "Requisições HTTP em andamento.", ("method",)
+)
+DB_QUERIES = Counter("db_queries_total", "Consultas executadas no banco.")
+DB_QUERY_DURATION = Histogram(
+    "db_query_duration_seconds", "Duração de cada consulta no banco.", buckets=QUERY_BUCKETS
+)
+DB_REQUEST_QUERIES = Histogram(
+    "db_queries_per_request", "Consultas ao banco por requisição HTTP.", ("route",),
+    buckets=COUNT_BUCKETS,
+)
+DB_REQUEST_DURATION = Histogram(
+    "db_time_per_request_seconds", "Tempo total no banco por requisição HTTP.", ("route",),
+)
+DB_POOL_WAIT = Histogram(
+    "db_pool_wait_seconds",
+    "Espera por uma conexão do pool (inclui abrir conexão nova).",
+    buckets=QUERY_BUCKETS,
+)
+DB_POOL_CHECKED_OUT = Gauge("db_pool_checked_out", "Conexões do pool em uso.")
+DB_POOL_CAPACITY = Gauge(
+    "db_pool_capacity", "pool_size + max_overflow do pool.",
+    collect=lambda: settings.DB_POOL_SIZE + settings.DB_MAX_OVERFLOW,
+)
+CACHE_LOOKUPS = Counter(
+    "cache_lookups_total", "Consultas aos caches em processo.", ("cache", "result")
+)
+PASSWORD_HASH_QUEUE = Gauge(
+    "password_hash_queued", "Chamadas do bcrypt aguardando uma thread.",
+    collect=lambda: hash_pool_stats()["queued"],
+)
+
+
+def record_cache(cache: str, hit: bool) -> None:
+    CACHE_LOOKUPS.inc(cache, "hit" if hit else "miss")
+
+
+# ── Estatísticas por requisição ───────────────────────────────────────────────
+
+
+@dataclass
+class RequestStats:
+    queries: int = 0
+    db_seconds: float = 0.0
+    # Consultas por formato (statement_shape): o mesmo formato repetido
+    # várias vezes na requisição é o sinal de um N+1
+    statements: collections.Counter = field(default_factory=collections.Counter)
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        """Formatos executados ``threshold`` vezes ou mais, do mais repetido ao menos."""
+        return [(shape, n) for shape, n in self.statements.most_common() if n >= threshold]
+
+
+_request_stats: ContextVar[RequestStats | None] = ContextVar("request_stats", default=None)
+
+_PLACEHOLDER = re.compile(r"\$\d+|%\(\w+\)s|\?")
+_PLACEHOLDER_LIST = re.compile(r"\?(?:\s*,\s*\?)+")
+
+
+def statement_shape(statement: str) -> str:
+    """SQL sem espaços extras e com os parâmetros (e listas de IN) trocados por ``?``."""
+    shape = _PLACEHOLDER.sub("?", " ".join(statement.split()))
+    return _PLACEHOLDER_LIST.sub("?, ...", shape)
+
+
+def current_request_stats() -> RequestStats | None:
+    """Estatísticas da requisição em andamento (None fora do MetricsMiddleware)."""
+    return _request_stats.get()
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+@contextmanager
+def query_budget(max_queries: int) -> Iterator[RequestStats]:
+    """
+    Conta as consultas do bloco (engine instrumentado) e falha se passarem de
+    ``max_queries``, listando os formatos executados::
+
+        with query_budget(3):
+            await ListRules(session).get_cards_for_list_paginated(list_id)
+    """
+    parent = _request_stats.get()
+    stats = RequestStats()
+    token = _request_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _request_stats.reset(token)
+        if parent is not None:
+            parent.queries += stats.queries
+            parent.db_seconds += stats.db_seconds
+            parent.statements.update(stats.statements)
+    if stats.queries > max_queries:
+        shapes = "\n".join(f"  {n}x {shape}" for shape, n in stats.statements.most_common())
+        raise QueryBudgetExceeded(
+            f"{stats.queries} queries (budget: {max_queries}):\n{shapes}"
+        )
+
+
+class MetricsMiddleware:
+    """
+    Mede cada requisição HTTP. O label ``route`` é o template da rota
+    (``/api/cards/{card_id}``); caminhos sem rota viram ``unmatched`` para não
+    criar uma série por URL.
+
+    Com ``query_header`` (fora de produção), a resposta leva ``X-DB-Queries``
+    e ``X-DB-Time-Ms``; com ``repeat_threshold``, formatos de consulta
+    repetidos esse número de vezes na mesma requisição vão para o log (N+1).
+
+    Deve ser o middleware mais externo, para incluir o tempo dos demais.
+    """
+
+    def __init__(self, app: ASGIApp, query_header: bool = False, repeat_threshold: int = 0):
+        self.app = app
+        self.query_header = query_header
+        self.repeat_threshold = repeat_threshold
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+        stats = RequestStats()
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if self.query_header:
+                    # Respostas em streaming: só as consultas feitas até aqui
+                    headers = MutableHeaders(scope=message)
+                    headers["X-DB-Queries"] = str(stats.queries)
+                    headers["X-DB-Time-Ms"] = f"{stats.db_seconds * 1000:.1f}"
+            await send(message)
+
+        token = _request_stats.set(stats)
+        HTTP_IN_PROGRESS.inc(method)
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - started
+            HTTP_IN_PROGRESS.dec(method)
+            _request_stats.reset(token)
+            route = _route_label(scope)
+            HTTP_REQUESTS.inc(method, route, str(status_code))
+            HTTP_LATENCY.observe(elapsed, method, route)
+            DB_REQUEST_QUERIES.observe(stats.queries, route)
+            DB_REQUEST_DURATION.observe(stats.db_seconds, route)
+            if self.repeat_threshold and (repeated := stats.repeated(self.repeat_threshold)):
+                logger.warning(
+                    "Possible N+1 in %s %s (%d queries): %s",
+                    method,
+                    route,
+                    stats.queries,
+                    "; ".join(f"{n}x {shape[:200]}" for shape, n in repeated),
+                )
+
+
+def _route_label(scope: Scope) -> str:
+    # Rotas de include_router: scope["route"] é a rota original (sem os
+    # prefixos); o template completo fica no contexto efetivo do FastAPI
+    context = scope.get("fastapi", {}).get("effective_route_context")
+    path = getattr(context, "path_format", None) or getattr(scope.get("route"), "path", None)
+    return path or "unmatched"
+
+
+# ── Banco ─────────────────────────────────────────────────────────────────────
+
+
+class TimedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """Pool assíncrono padrão que registra o tempo de cada checkout em DB_POOL_WAIT."""
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            DB_POOL_WAIT.observe(time.perf_counter() - started)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    # Uma consulta por vez em cada conexão: basta o início da última
+    conn.info["query_started"] = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["query_started"]
+    DB_QUERIES.inc()
+    DB_QUERY_DURATION.observe(elapsed)
+    stats = _request_stats.get()
+    if stats is not None:
+        stats.queries += 1
+        stats.db_seconds += elapsed
+        stats.statements[statement_shape(statement)] += 1
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """Liga os hooks de consulta e os gauges do pool ao ``engine``."""
+    sync_engine = engine.sync_engine
+    if not event.contains(sync_engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+    DB_POOL_CHECKED_OUT.collect = lambda: engine.pool.checkedout()
+
+
+def render() -> str:
+    return REGISTRY.render()
@@ -0,0 +1,219 @@
+import zlib
+from functools import partial
+
+import anyio.to_thread
+import brotli
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+_SECURITY_HEADERS = {
+    "X-Content-Type-Options": "nosniff",
+    "X-Frame-Options": "DENY",
+    "X-XSS-Protection": "1; mode=block",
+    "Referrer-Policy": "strict-origin-when-cross-origin",
+}
+_HSTS = "max-age=31536000; includeSubDomains"
+
+# Tipos já comprimidos ou que não podem ser bufferizados (SSE, gRPC)
+_EXCLUDED_CONTENT_TYPES = frozenset({
+    "application/grpc",
+    "application/gzip",
+    "application/x-gzip",
+    "application/zip",
+    "audio/*",
+    "font/woff",
+    "font/woff2",
+    "image/avif",
+    "image/gif",
+    "image/jpeg",
+    "image/png",
+    "image/webp",
+    "text/event-stream",
+    "video/*",
+})
+
+
+class SecurityHeadersMiddleware:
+    """
+    Adiciona os cabeçalhos de segurança a todas as respostas HTTP.
+
+    Middleware ASGI puro: os cabeçalhos são inseridos na mensagem
+    ``http.response.start`` e o corpo passa adiante sem buffer, então respostas
+    em streaming (exportações, SSE) seguem pedaço a pedaço. Diferente do
+    BaseHTTPMiddleware, não cria task nem memory stream por requisição.
+    """
+
+    def __init__(self, app: ASGIApp, hsts: bool = False):
+        self.app = app
+        self.headers = dict(_SECURITY_HEADERS)
+        if hsts:
+            self.headers["Strict-Transport-Security"] = _HSTS
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                for name, value in self.headers.items():
+                    headers[name] = value
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
+
+
+class _GzipStream:
+    def __init__(self, level: int):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, body: bytes, more_body: bool) -> bytes:
+        # Z_SYNC_FLUSH a cada pedaço mantém o streaming; Z_FINISH encerra o stream
+        flush_mode = zlib.Z_SYNC_FLUSH if more_body else zlib.Z_FINISH
+        return self._compressor.compress(body) + self._compressor.flush(flush_mode)
+
+
+class _BrotliStream:
+    def __init__(self, quality: int):
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, body: bytes, more_body: bool) -> bytes:
+        data = self._compressor.process(body)
+        return data + (self._compressor.flush() if more_body else self._compressor.finish())
+
+
+class _CompressionResponder:
+    """
+    ``send`` de uma resposta: segura o http.response.start até o primeiro pedaço
+    do corpo e só então decide se comprime (tamanho, tipo, Content-Encoding).
+    """
+
+    # Blocos grandes são comprimidos em thread para não travar o event loop
+    thread_minimum_size = 128 * 1024
+
+    def __init__(self, send: Send, encoding: str | None, make_stream, minimum_size: int):
+        self.send = send
+        self.encoding = encoding
+        self.make_stream = make_stream
+        self.minimum_size = minimum_size
+        self.start: Message | None = None
+        self.stream = None
+        self.passthrough = False
+
+    async def __call__(self, message: Message) -> None:
+        kind = message["type"]
+        if kind == "http.response.start":
+            headers = Headers(raw=message["headers"])
+            media_type = headers.get("content-type", "").partition(";")[0].strip().lower()
+            self.passthrough = (
+                "content-encoding" in headers
+                or message["status"] == 206
+                or media_type in _EXCLUDED_CONTENT_TYPES
+                or media_type.partition("/")[0] + "/*" in _EXCLUDED_CONTENT_TYPES
+                or media_type.startswith("application/grpc+")
+            )
+            if self.passthrough:
+                await self.send(message)
+            else:
+                self.start = message
+        elif kind == "http.response.body" and not self.passthrough:
+            await self._send_body(message)
+        else:
+            # pathsend (arquivo servido pelo servidor) segue sem compressão
+            if self.start is not None:
+                start, self.start = self.start, None
+                await self.send(start)
+            await self.send(message)
+
+    async def _send_body(self, message: Message) -> None:
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if self.start is not None:
+            start, self.start = self.start, None
+            if len(body) < self.minimum_size and not more_body:
+                await self.send(start)
+                await self.send(message)
+                return
+            headers = MutableHeaders(raw=start["headers"])
+            headers.add_vary_header("Accept-Encoding")
+            if self.encoding is not None:
+                self.stream = self.make_stream()
+                headers["Content-Encoding"] = self.encoding
+                body = await self._compress(body, more_body)
+                if more_body or start.get("trailers", False):
+                    del headers["Content-Length"]
+                else:
+                    headers["Content-Length"] = str(len(body))
+            await self.send(start)
+        elif self.stream is not None:
+            body = await self._compress(body, more_body)
+        await self.send({**message, "body": body})
+
+    async def _compress(self, body: bytes, more_body: bool) -> bytes:
+        if len(body) >= self.thread_minimum_size:
+            return await anyio.to_thread.run_sync(self.stream.compress, body, more_body)
+        return self.stream.compress(body, more_body)
+
+
+class CompressionMiddleware:
+    """
+    Compressão negociada pelo Accept-Encoding: brotli ou gzip.
+
+    Respostas menores que ``minimum_size``, já codificadas, parciais (206) ou de
+    tipos já comprimidos (imagens, SSE, ...) passam sem alteração. Respostas em
+    streaming são comprimidas pedaço a pedaço. Usa só a interface ASGI e o
+    zlib/brotli, sem depender dos responders internos do GZipMiddleware. Níveis padrão escolhidos com
+    benchmarks/bench_compression.py.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 5,
+        brotli_quality: int = 4,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding == "br":
+            make_stream = partial(_BrotliStream, self.brotli_quality)
+        else:
+            make_stream = partial(_GzipStream, self.gzip_level)
+        responder = _CompressionResponder(send, encoding, make_stream, self.minimum_size)
+        await self.app(scope, receive, responder)
+
+
+def negotiate_encoding(accept_encoding: str) -> str | None:
+    """Escolhe "br" ou "gzip" a partir do Accept-Encoding (respeitando q=0)."""
+    accepted: dict[str, float] = {}
+    for item in accept_encoding.lower().split(","):
+        name, _, params = item.strip().partition(";")
+        q = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if name:
+            accepted[name] = q
+
+    wildcard = accepted.get("*", 0.0)
+    candidates = ["br", "gzip"]
+    scored = [(accepted.get(c, wildcard), c) for c in candidates]
+    scored = [(q, c) for q, c in scored if q > 0]
+    if not scored:
+        return None
+    # Maior q vence; no empate, a ordem de preferência (br antes de gzip)
+    return max(scored, key=lambda item: (item[0], -candidates.index(item[1])))[1]
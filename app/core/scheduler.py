@@ -0,0 +1,44 @@
+import asyncio
+import logging
+from typing import Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+
+class PeriodicJob:
+    """
+    Executa uma corrotina em intervalo fixo dentro do event loop da aplicação.
+
+    A primeira execução acontece logo no start(); falhas são registradas no log
+    e não interrompem as execuções seguintes.
+    """
+
+    def __init__(self, name: str, interval_seconds: float, func: Callable[[], Awaitable]):
+        self.name = name
+        self.interval_seconds = interval_seconds
+        self.func = func
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name=self.name)
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.func()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Scheduled job %s failed", self.name)
+            await asyncio.sleep(self.interval_seconds)
@@ -1,7 +1,23 @@
-﻿from passlib.context import CryptContext
+﻿import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from passlib.context import CryptContext
+
+from app.core.configs import settings
 
 CRIPTO = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# bcrypt releases the GIL while hashing, so a small thread pool keeps it off
+# the event loop. The semaphore bounds how many hashes run at the same time;
+# callers beyond that wait on it, which is what the queue depth measures.
+_HASH_WORKERS = settings.PASSWORD_HASH_WORKERS or min(4, os.cpu_count() or 1)
+_hash_executor = ThreadPoolExecutor(max_workers=_HASH_WORKERS, thread_name_prefix="bcrypt")
+_hash_slots: asyncio.Semaphore | None = None
+_hash_slots_loop: asyncio.AbstractEventLoop | None = None
+_queued = 0
+_running = 0
+
 
 def verification_password(password: str, hash_password: str) -> bool:
     """
@@ -25,3 +41,47 @@ def verification_password(password: str, hash_password: str) -> bool:
 def generator_hash_password(password: str):
     """Generates and returns the bcrypt hash of the given password."""
     return CRIPTO.hash(password)
+
+
+async def verification_password_async(password: str, hash_password: str) -> bool:
+    """verification_password executed in the bcrypt worker pool."""
+    return await _run_in_hash_pool(verification_password, password, hash_password)
+
+
+async def generator_hash_password_async(password: str) -> str:
+    """generator_hash_password executed in the bcrypt worker pool."""
+    return await _run_in_hash_pool(generator_hash_password, password)
+
+
+def hash_pool_stats() -> dict[str, int]:
+    """
+    Current state of the bcrypt pool: ``queued`` calls waiting for a worker
+    (queue depth), ``running`` calls being hashed and the pool size.
+    """
+    return {"queued": _queued, "running": _running, "workers": _HASH_WORKERS}
+
+
+def _get_hash_slots() -> asyncio.Semaphore:
+    global _hash_slots, _hash_slots_loop
+    loop = asyncio.get_running_loop()
+    if _hash_slots is None or _hash_slots_loop is not loop:
+        _hash_slots, _hash_slots_loop = asyncio.Semaphore(_HASH_WORKERS), loop
+    return _hash_slots
+
+
+async def _run_in_hash_pool(func, *args):
+    # Counters are only touched on the event loop thread
+    global _queued, _running
+    slots = _get_hash_slots()
+    _queued += 1
+    try:
+        await slots.acquire()
+    finally:
+        _queued -= 1
+
+    _running += 1
+    try:
+        return await asyncio.get_running_loop().run_in_executor(_hash_executor, func, *args)
+    finally:
+        _running -= 1
+        slots.release()
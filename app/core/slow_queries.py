@@ -0,0 +1,171 @@
+"""
+Log de consultas lentas com captura de plano (EXPLAIN).
+
+Toda consulta acima de ``SLOW_QUERY_MS`` gera uma linha JSON no logger
+``app.core.slow_queries`` com o SQL, os parâmetros mascarados (strings e
+bytes viram ``<str len=N>``; números, datas e None ficam), a duração e o
+método de app/rules que a disparou (ex.: ``CardRules.search_cards``).
+
+Com ``SLOW_QUERY_EXPLAIN`` ligado (padrão apenas com TEST_MODE), uma fração
+``SLOW_QUERY_EXPLAIN_SAMPLE`` das consultas lentas é reexecutada com
+``EXPLAIN (ANALYZE, BUFFERS)`` em outra conexão do pool, em background e
+dentro de uma transação desfeita ao final; o plano vai na mesma linha do log.
+Comandos que alteram dados ou travam linhas (``FOR UPDATE``/``FOR SHARE``)
+recebem só ``EXPLAIN`` (sem executar). No máximo um EXPLAIN roda por vez em
+cada worker.
+"""
+import asyncio
+import json
+import logging
+import os
+import random
+import re
+import sys
+import time
+from datetime import date, datetime
+
+import greenlet
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.metrics import Counter
+
+logger = logging.getLogger(__name__)
+
+SLOW_QUERIES = Counter("db_slow_queries_total", "Consultas acima de SLOW_QUERY_MS.")
+
+_RULES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "rules")
+_EXPLAIN_TIMEOUT_MS = 10_000
+_LOCKING_CLAUSE = re.compile(r"\bFOR\s+(?:NO\s+KEY\s+UPDATE|UPDATE|KEY\s+SHARE|SHARE)\b", re.IGNORECASE)
+
+
+def redact(parameters):
+    """Parâmetros da consulta sem o conteúdo de strings e bytes (e-mails, hashes, buscas)."""
+    if isinstance(parameters, dict):
+        return {k: _redact_value(v) for k, v in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [redact(p) if isinstance(p, (list, tuple, dict)) else _redact_value(p) for p in parameters]
+    return _redact_value(parameters)
+
+
+def _redact_value(value):
+    if value is None or isinstance(value, (bool, int, float)):
+        return value
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (str, bytes)):
+        return f"<{type(value).__name__} len={len(value)}>"
+    return f"<{type(value).__name__}>"
+
+
+def calling_rule() -> str | None:
+    """
+    Primeiro método de app/rules na pilha. As consultas do engine assíncrono
+    rodam em um greenlet filho: a pilha da corrotina fica no greenlet pai.
+    """
+    frame = sys._getframe()
+    current = greenlet.getcurrent()
+    while True:
+        while frame is not None:
+            if frame.f_code.co_filename.startswith(_RULES_DIR):
+                return frame.f_code.co_qualname
+            frame = frame.f_back
+        current = current.parent
+        if current is None:
+            return None
+        frame = current.gr_frame
+
+
+def can_analyze(statement: str, context) -> bool:
+    """
+    Se a consulta pode ser reexecutada com ANALYZE: leituras (inclusive WITH)
+    sem cláusula de trava. SQL textual (text()/exec_driver_sql) não traz o
+    tipo do comando no contexto, então só SELECT simples é aceito.
+    """
+    if context.isinsert or context.isupdate or context.isdelete:
+        return False
+    if _LOCKING_CLAUSE.search(statement):
+        return False
+    if context.is_text:
+        return statement.lstrip().upper().startswith("SELECT")
+    return True
+
+
+class SlowQueryLog:
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        threshold_ms: float,
+        explain: bool = False,
+        sample_rate: float = 1.0,
+    ):
+        self.engine = engine
+        self.threshold = threshold_ms / 1000
+        self.explain = explain
+        self.sample_rate = sample_rate
+        self._explaining = False
+        self._tasks: set[asyncio.Task] = set()
+
+    def before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info["slow_query_started"] = time.perf_counter()
+
+    def after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["slow_query_started"]
+        if elapsed < self.threshold or statement.lstrip().upper().startswith("EXPLAIN"):
+            return
+        SLOW_QUERIES.inc()
+        record = {
+            "event": "slow_query",
+            "ms": round(elapsed * 1000, 1),
+            "rule": calling_rule(),
+            "statement": " ".join(statement.split()),
+            "parameters": redact(parameters),
+        }
+        loop = self._explain_loop(executemany)
+        if loop is None:
+            self._log(record)
+            return
+        self._explaining = True
+        analyze = can_analyze(statement, context)
+        task = loop.create_task(self._explain(record, statement, parameters, analyze))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _explain_loop(self, executemany: bool) -> asyncio.AbstractEventLoop | None:
+        """Event loop onde agendar o EXPLAIN, ou None se esta consulta não for amostrada."""
+        if not self.explain or executemany or self._explaining:
+            return None
+        if random.random() >= self.sample_rate:
+            return None
+        try:
+            return asyncio.get_running_loop()
+        except RuntimeError:  # engine síncrono (scripts)
+            return None
+
+    async def _explain(self, record: dict, statement: str, parameters, analyze: bool) -> None:
+        # ANALYZE reexecuta a consulta: só para leituras sem trava
+        options = "ANALYZE, BUFFERS, FORMAT JSON" if analyze else "FORMAT JSON"
+        try:
+            async with self.engine.connect() as conn:
+                await conn.exec_driver_sql(f"SET LOCAL statement_timeout = {_EXPLAIN_TIMEOUT_MS}")
+                result = await conn.exec_driver_sql(f"EXPLAIN ({options}) {statement}", parameters)
+                plan = result.scalar()
+            record["plan"] = json.loads(plan) if isinstance(plan, str) else plan
+        except Exception as exc:
+            record["plan_error"] = type(exc).__name__
+        finally:
+            self._explaining = False
+        self._log(record)
+
+    def _log(self, record: dict) -> None:
+        logger.warning(json.dumps(record, default=str, ensure_ascii=False))
+
+
+def instrument_slow_queries(
+    engine: AsyncEngine, threshold_ms: float, explain: bool = False, sample_rate: float = 1.0
+) -> SlowQueryLog:
+    """Liga o log de consultas lentas ao ``engine``."""
+    slow_log = SlowQueryLog(engine, threshold_ms, explain, sample_rate)
+    event.listen(engine.sync_engine, "before_cursor_execute", slow_log.before_cursor_execute)
+    event.listen(engine.sync_engine, "after_cursor_execute", slow_log.after_cursor_execute)
+    return slow_log
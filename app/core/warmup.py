@@ -0,0 +1,76 @@
+import asyncio
+import logging
+import time
+from contextlib import AsyncExitStack
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import configure_mappers
+
+from app.core.deps import current_user_query
+from app.rules.dashboard import DashboardRules
+from app.rules.list import ListRules
+
+logger = logging.getLogger(__name__)
+
+# Id inexistente: as consultas quentes rodam inteiras, mas sem retornar linhas
+_NO_ID = -1
+
+
+async def open_pool_connections(engine: AsyncEngine, count: int) -> int:
+    """
+    Abre até ``count`` conexões ao mesmo tempo (limitado ao pool_size) e as
+    devolve ao pool, que as mantém abertas para as primeiras requisições.
+    """
+    count = min(count, engine.pool.size())
+    async with AsyncExitStack() as stack:
+        conns = await asyncio.gather(
+            *(stack.enter_async_context(engine.connect()) for _ in range(count))
+        )
+        await asyncio.gather(*(conn.execute(text("SELECT 1")) for conn in conns))
+    return count
+
+
+async def warm_up(engine: AsyncEngine, session_factory, connections: int) -> float:
+    """
+    Prepara o worker antes do primeiro tráfego: configura os mappers, abre as
+    conexões do pool e executa uma vez as consultas quentes (usuário autenticado,
+    listas, página de cards e my-cards), o que deixa o SQL já compilado no cache
+    do SQLAlchemy. Retorna a duração em segundos.
+    """
+    started = time.perf_counter()
+    configure_mappers()
+    await open_pool_connections(engine, connections)
+
+    async with session_factory() as session:
+        await session.execute(current_user_query(_NO_ID))
+        lists = ListRules(session)
+        await lists.get_lists_slim(_NO_ID)
+        await lists.get_cards_for_list_paginated(_NO_ID)
+        await DashboardRules(session).get_my_cards(_NO_ID)
+        await session.rollback()
+
+    return time.perf_counter() - started
+
+
+async def warm_up_until_ready(
+    state, engine: AsyncEngine, session_factory, connections: int, max_delay: float = 30
+) -> None:
+    """
+    Repete warm_up (backoff exponencial) até conseguir e só então marca
+    ``state.ready = True``. Um banco indisponível no boot apenas atrasa a prontidão.
+    """
+    delay = 1.0
+    while True:
+        try:
+            elapsed = await warm_up(engine, session_factory, connections)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("Warm-up failed; retrying in %.0fs", delay)
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, max_delay)
+        else:
+            state.ready = True
+            logger.info("Warm-up finished in %.3fs", elapsed)
+            return
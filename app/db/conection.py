@@ -2,12 +2,29 @@
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine, AsyncSession
 
 from app.core.configs import settings
+from app.core.metrics import TimedAsyncQueuePool, instrument_engine
+from app.core.slow_queries import instrument_slow_queries
 
 engine: AsyncEngine = create_async_engine(
     settings.DB_URL,
+    poolclass=TimedAsyncQueuePool,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
     connect_args={"statement_cache_size": 0},
 )
 
+# Contagem e duração das consultas para o /metrics
+if settings.METRICS_ENABLED:
+    instrument_engine(engine)
+
+if settings.SLOW_QUERY_MS > 0:
+    instrument_slow_queries(
+        engine,
+        settings.SLOW_QUERY_MS,
+        explain=settings.SLOW_QUERY_EXPLAIN,
+        sample_rate=settings.SLOW_QUERY_EXPLAIN_SAMPLE,
+    )
+
 Session: AsyncSession = sessionmaker(
     autocommit=False,
     autoflush=False,
@@ -4,9 +4,13 @@ from app.db.models.card_dependency_model import CardDependencyModel
 from app.db.models.card_history_model import CardHistoryModel
 from app.db.models.card_model import CardModel
 from app.db.models.comment_model import CommentModel
+from app.db.models.email_outbox_model import EmailOutboxModel
 from app.db.models.list_model import ListModel
 from app.db.models.project_model import ProjectModel
+from app.db.models.project_snapshot_model import ProjectSnapshotModel
+from app.db.models.project_stats_model import ProjectStatsModel
 from app.db.models.project_user_model import ProjectUserModel
+from app.db.models.rate_limit_bucket_model import RateLimitBucketModel
 from app.db.models.role_model import RoleModel
 from app.db.models.tag_card_model import TagCardModel
 from app.db.models.tag_model import TagModel
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, func
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Index, func
 from sqlalchemy.orm import relationship
 
 from app.core.configs import settings
@@ -12,11 +12,16 @@ class CardHistoryModel(settings.DBBaseModel):
       action     – what changed  (e.g. "moved", "assigned", "due_date_changed")
       old_value  – previous value as string (e.g. list name or user name)
       new_value  – new value as string
+      old_list_id / new_list_id – list ids of a "moved" action (null on
+                   older rows, which only carry the list names)
       user_id    – who made the change
       created_at – when it happened
     """
 
     __tablename__ = "card_history"
+    __table_args__ = (
+        Index("ix_card_history_action_created_at", "action", "createdAt"),
+    )
 
     id = Column("id", Integer, primary_key=True, autoincrement=True)
     card_id = Column(
@@ -30,6 +35,8 @@ class CardHistoryModel(settings.DBBaseModel):
     action = Column("action", String(50), nullable=False)
     old_value = Column("oldValue", String(255), nullable=True)
     new_value = Column("newValue", String(255), nullable=True)
+    old_list_id = Column("oldListId", Integer, nullable=True)
+    new_list_id = Column("newListId", Integer, nullable=True)
     created_at = Column("createdAt", DateTime, server_default=func.now())
 
     # relationships
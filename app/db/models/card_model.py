@@ -19,7 +19,7 @@ class CardModel(settings.DBBaseModel):
     date = Column("date", DateTime, nullable=True)
     start_date = Column("startDate", DateTime, nullable=True)
     end_date = Column("endDate", DateTime, nullable=True)
-    completed_at = Column("completedAt", DateTime, nullable=True)
+    completed_at = Column("completedAt", DateTime, nullable=True, index=True)
     priority = Column("priority", Integer, nullable=True)
     description = Column("description", String(1000), nullable=True)
     planned_hours = Column("plannedHours", Integer, nullable=True)
@@ -0,0 +1,35 @@
+from sqlalchemy import Column, DateTime, Index, Integer, String, Text, func
+
+from app.core.configs import settings
+
+
+class EmailOutboxModel(settings.DBBaseModel):
+    """
+    Fila de e-mails a enviar (outbox).
+
+    As regras apenas inserem a linha, na mesma transação da operação que gerou
+    o e-mail; o envio fica com o worker em segundo plano (ver EmailOutboxRules):
+      status          – "pending", "sent" ou "failed" (tentativas esgotadas)
+      attempts        – tentativas de envio já feitas
+      next_attempt_at – quando a linha volta a ser elegível (backoff)
+      last_error      – erro da última tentativa
+      body            – apagado (NULL) depois do envio: pode conter links com token
+    """
+
+    __tablename__ = "email_outbox"
+    __table_args__ = (
+        Index("ix_email_outbox_status_next_attempt", "status", "nextAttemptAt"),
+    )
+
+    id = Column("id", Integer, primary_key=True, autoincrement=True)
+    to = Column("to", String(255), nullable=False)
+    subject = Column("subject", String(255), nullable=False)
+    body = Column("body", Text, nullable=True)
+    status = Column("status", String(20), nullable=False, default="pending")
+    attempts = Column("attempts", Integer, nullable=False, default=0)
+    next_attempt_at = Column(
+        "nextAttemptAt", DateTime, nullable=False, server_default=func.now()
+    )
+    last_error = Column("lastError", String(500), nullable=True)
+    created_at = Column("createdAt", DateTime, server_default=func.now())
+    sent_at = Column("sentAt", DateTime, nullable=True)
@@ -0,0 +1,48 @@
+from sqlalchemy import (
+    JSON,
+    Column,
+    Date,
+    DateTime,
+    ForeignKey,
+    Integer,
+    UniqueConstraint,
+    func,
+)
+
+from app.core.configs import settings
+
+
+class ProjectSnapshotModel(settings.DBBaseModel):
+    """
+    Foto diária do estado de um projeto (uma linha por projeto por dia).
+
+    Gravada pelo job agendado em app/core/scheduler.py; a linha do dia corrente
+    é sobrescrita a cada execução, então ao virar o dia ela reflete o estado
+    final daquele dia:
+      remaining_points – soma de story_points (ou 1) dos cards não concluídos
+      total_points     – soma de story_points (ou 1) de todos os cards
+      open_cards / closed_cards – contagem por completed_at
+      by_list          – {list_id: contagem de cards}
+    """
+
+    __tablename__ = "project_snapshots"
+    __table_args__ = (
+        UniqueConstraint("projectId", "day", name="uq_project_snapshot_day"),
+    )
+
+    id = Column("id", Integer, primary_key=True, autoincrement=True)
+    project_id = Column(
+        "projectId",
+        Integer,
+        ForeignKey("projects.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    day = Column("day", Date, nullable=False)
+    remaining_points = Column("remainingPoints", Integer, nullable=False, default=0)
+    total_points = Column("totalPoints", Integer, nullable=False, default=0)
+    open_cards = Column("openCards", Integer, nullable=False, default=0)
+    closed_cards = Column("closedCards", Integer, nullable=False, default=0)
+    by_list = Column("byList", JSON, nullable=False, default=dict)
+    created_at = Column(
+        "createdAt", DateTime, server_default=func.now(), onupdate=func.now()
+    )
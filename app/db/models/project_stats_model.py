@@ -0,0 +1,35 @@
+from sqlalchemy import JSON, Column, DateTime, Float, ForeignKey, Integer, func
+
+from app.core.configs import settings
+
+
+class ProjectStatsModel(settings.DBBaseModel):
+    """
+    Estatísticas materializadas de um projeto (uma linha por projeto).
+
+    Mantida incrementalmente pelas escritas de CardRules e recalculada por
+    completo nas escritas de ListRules (ver app/rules/project_stats.py):
+      by_list     – {list_id: {"name", "is_final", "order", "count"}}
+      by_priority – {priority | "none": count}
+      by_tag      – {tag_id: {"name", "count"}}
+      lead_time_* / cycle_time_* – soma (em dias) e quantidade para as médias
+    """
+
+    __tablename__ = "project_stats"
+
+    project_id = Column(
+        "projectId",
+        Integer,
+        ForeignKey("projects.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    by_list = Column("byList", JSON, nullable=False, default=dict)
+    by_priority = Column("byPriority", JSON, nullable=False, default=dict)
+    by_tag = Column("byTag", JSON, nullable=False, default=dict)
+    lead_time_sum = Column("leadTimeSum", Float, nullable=False, default=0)
+    lead_time_count = Column("leadTimeCount", Integer, nullable=False, default=0)
+    cycle_time_sum = Column("cycleTimeSum", Float, nullable=False, default=0)
+    cycle_time_count = Column("cycleTimeCount", Integer, nullable=False, default=0)
+    updated_at = Column(
+        "updatedAt", DateTime, server_default=func.now(), onupdate=func.now()
+    )
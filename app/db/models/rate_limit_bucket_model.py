@@ -0,0 +1,21 @@
+from sqlalchemy import Column, DateTime, Float, String, func
+
+from app.core.configs import settings
+
+
+class RateLimitBucketModel(settings.DBBaseModel):
+    """
+    Token bucket compartilhado entre workers (RATE_LIMIT_BACKEND=database).
+
+    Atualizado por uma única instrução INSERT ... ON CONFLICT em
+    app/core/limiter.py:
+      key        – escopo + usuário ou IP (ex.: "login:ip:10.0.0.1")
+      tokens     – fichas restantes na última atualização
+      updated_at – momento da última atualização (base da recomposição)
+    """
+
+    __tablename__ = "rate_limit_buckets"
+
+    key = Column("key", String(255), primary_key=True)
+    tokens = Column("tokens", Float, nullable=False)
+    updated_at = Column("updatedAt", DateTime, nullable=False, server_default=func.now())
@@ -1,4 +1,8 @@
-﻿from sqlalchemy.ext.asyncio import AsyncSession
+﻿from pathlib import Path
+
+from alembic import command
+from alembic.config import Config
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text
 from sqlalchemy.future import select
 
@@ -22,6 +26,16 @@ def _guard_against_production() -> None:
         )
 
 
+ALEMBIC_INI = Path(__file__).resolve().parent.parent / "alembic.ini"
+
+
+def _upgrade_head(sync_conn) -> None:
+    """Aplica as migrações do Alembic na conexão recebida (ver migrations/env.py)."""
+    config = Config(str(ALEMBIC_INI))
+    config.attributes["connection"] = sync_conn
+    command.upgrade(config, "head")
+
+
 async def create_tables() -> None:
     import app.db.models.__all_models
 
@@ -34,7 +48,7 @@ async def create_tables() -> None:
         await conn.run_sync(
             lambda sync_conn: sync_conn.execute(text("CREATE SCHEMA public"))
         )
-        await conn.run_sync(settings.DBBaseModel.metadata.create_all)
+        await conn.run_sync(_upgrade_head)
 
     print("Tabelas criadas com sucesso")
 
@@ -1,70 +1,108 @@
-﻿import os
+﻿import asyncio
+import os
+from contextlib import asynccontextmanager
+from datetime import datetime
 
-from fastapi import FastAPI, Request
+from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
-from sqlalchemy import text
-from starlette.middleware.base import BaseHTTPMiddleware
-from slowapi import _rate_limit_exceeded_handler
-from slowapi.errors import RateLimitExceeded
 
 from app.core.configs import settings
-from app.core.limiter import limiter
+from app.core.email import get_transport
+from app.core.limiter import DatabaseBackend, limiter
+from app.core.metrics import MetricsMiddleware
+from app.core.middleware import CompressionMiddleware, SecurityHeadersMiddleware
+from app.core.scheduler import PeriodicJob
+from app.core.warmup import warm_up_until_ready
 from app.api.api import api_router
-from app.db.conection import engine
+from app.api.routes import health_router, metrics_router
+from app.db.conection import Session, engine
+from app.rules.email_outbox import EmailOutboxRules
+from app.rules.snapshot import SnapshotRules
 
 IS_PRODUCTION = os.getenv("RENDER") is not None
 
 
+# ── Snapshots diários ──────────────────────────────────────────────────────────
+async def take_daily_snapshots():
+    # Dia em UTC, o mesmo fuso de created_at/completed_at
+    async with Session() as session:
+        await SnapshotRules(session).take_snapshots(datetime.utcnow().date())
+
+
+# ── Baldes do rate limit ───────────────────────────────────────────────────────
+async def prune_rate_limit_buckets():
+    await limiter.backend.prune()
+
+
+# ── Outbox de e-mails ──────────────────────────────────────────────────────────
+async def send_outbox_emails():
+    async with Session() as session:
+        await EmailOutboxRules(session).send_all_pending(
+            app.state.email_transport, settings.EMAIL_BATCH_SIZE
+        )
+
+
+# ── Ciclo de vida: aquecimento e jobs em background ────────────────────────────
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    app.state.ready = not settings.WARMUP_ENABLED
+    warmup = None
+    if settings.WARMUP_ENABLED:
+        warmup = asyncio.create_task(
+            warm_up_until_ready(app.state, engine, Session, settings.WARMUP_CONNECTIONS)
+        )
+        # Aguarda o aquecimento antes de aceitar conexões; se o banco demorar,
+        # segue em background e a prontidão (app.state.ready) vira depois
+        await asyncio.wait({warmup}, timeout=settings.WARMUP_TIMEOUT_SECONDS)
+
+    jobs = []
+    if settings.SNAPSHOT_JOB_ENABLED:
+        jobs.append(PeriodicJob(
+            "project-snapshots",
+            settings.SNAPSHOT_INTERVAL_MINUTES * 60,
+            take_daily_snapshots,
+        ))
+    if isinstance(limiter.backend, DatabaseBackend):
+        jobs.append(PeriodicJob(
+            "rate-limit-prune",
+            settings.RATE_LIMIT_PRUNE_MINUTES * 60,
+            prune_rate_limit_buckets,
+        ))
+    if settings.EMAIL_WORKER_ENABLED:
+        app.state.email_transport = get_transport()
+        jobs.append(PeriodicJob(
+            "email-outbox", settings.EMAIL_POLL_SECONDS, send_outbox_emails
+        ))
+    for job in jobs:
+        job.start()
+
+    yield
+
+    if warmup is not None and not warmup.done():
+        warmup.cancel()
+    for job in jobs:
+        await job.stop()
+
+
+# Sem default_response_class: com ele o FastAPI deixa de gravar o response_model
+# direto em bytes (dump_json) e volta ao dict + json.dumps. Ver
+# benchmarks/bench_serialization.py.
 app = FastAPI(
     title="TCC API",
     docs_url=None if IS_PRODUCTION else "/docs",
     redoc_url=None if IS_PRODUCTION else "/redoc",
     openapi_url=None if IS_PRODUCTION else "/openapi.json",
+    lifespan=lifespan,
 )
 
-# ── Rate limiting ──────────────────────────────────────────────────────────────
-app.state.limiter = limiter
-app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
-
-
 # ── Security headers ───────────────────────────────────────────────────────────
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        response = await call_next(request)
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["X-XSS-Protection"] = "1; mode=block"
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-        if IS_PRODUCTION:
-            response.headers["Strict-Transport-Security"] = (
-                "max-age=31536000; includeSubDomains"
-            )
-        return response
-
-
-app.add_middleware(SecurityHeadersMiddleware)
-
-
-@app.on_event("startup")
-async def create_new_tables():
-    async with engine.begin() as conn:
-        await conn.run_sync(settings.DBBaseModel.metadata.create_all)
-        await conn.execute(
-            text('ALTER TABLE cards ADD COLUMN IF NOT EXISTS "completedAt" TIMESTAMP')
-        )
-        await conn.execute(
-            text(
-                'ALTER TABLE lists ADD COLUMN IF NOT EXISTS "isFinal"'
-                " BOOLEAN NOT NULL DEFAULT FALSE"
-            )
-        )
-        await conn.execute(
-            text('ALTER TABLE cards ADD COLUMN IF NOT EXISTS "sortOrder" INTEGER')
-        )
-
+app.add_middleware(SecurityHeadersMiddleware, hsts=IS_PRODUCTION)
 
 app.include_router(api_router, prefix=settings.API_STR)
+app.include_router(health_router.router, tags=["Health"])
+if settings.METRICS_ENABLED:
+    app.include_router(metrics_router.router, tags=["Health"])
 
 origins = [
     "http://localhost:3000",
@@ -80,10 +118,22 @@ app.add_middleware(
     allow_headers=["Authorization", "Content-Type"],
 )
 
-# @app.get("health-check")
-# def health_check():
-#     return True
+# ── Compressão (gzip/brotli) ───────────────────────────────────────────────────
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.COMPRESSION_MIN_SIZE,
+    gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+    brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
+)
 
+# ── Métricas (mais externo: mede também os demais middlewares) ─────────────────
+# Fora de produção, cada resposta informa X-DB-Queries / X-DB-Time-Ms
+if settings.METRICS_ENABLED:
+    app.add_middleware(
+        MetricsMiddleware,
+        query_header=not IS_PRODUCTION,
+        repeat_threshold=settings.DB_QUERY_REPEAT_THRESHOLD,
+    )
 
 # if __name__ == "__main__":
 #     import uvicorn
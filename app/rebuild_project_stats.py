@@ -0,0 +1,42 @@
+"""
+Reconstrói a tabela project_stats a partir dos cards (correção de divergências).
+
+Uso (a partir do diretório Back-end/):
+    python -m app.rebuild_project_stats              # todos os projetos
+    python -m app.rebuild_project_stats --project 12 # apenas um projeto
+"""
+import argparse
+import asyncio
+
+from sqlalchemy import select
+
+import app.db.models.__all_models  # noqa: F401
+from app.db.conection import Session, engine
+from app.db.models.project_model import ProjectModel
+from app.rules.project_stats import ProjectStatsRules
+
+
+async def run(project_id: int | None = None) -> None:
+    async with Session() as session:
+        if project_id is not None:
+            project_ids = [project_id]
+        else:
+            project_ids = (await session.execute(select(ProjectModel.id))).scalars().all()
+
+        rules = ProjectStatsRules(session)
+        for pid in project_ids:
+            await rules.rebuild(pid)
+            # Commit por projeto: libera o lock da linha o quanto antes
+            await session.commit()
+            print(f"Project {pid}: stats rebuilt.")
+
+    await engine.dispose()
+    print(f"Done! {len(project_ids)} project(s) rebuilt.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rebuild materialized project stats.")
+    parser.add_argument("--project", type=int, default=None, help="Project id")
+    args = parser.parse_args()
+
+    asyncio.run(run(args.project))
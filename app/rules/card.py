@@ -17,6 +17,8 @@ from app.db.models.role_model import RoleModel
 from app.db.models.tag_card_model import TagCardModel
 from app.db.models.tag_model import TagModel
 from app.db.models.task_card_model import TaskCardModel
+from app.rules.dashboard import invalidate_throughput
+from app.rules.project_stats import CardStatsEntry, ProjectStatsRules
 from app.schemas.card_schema import (
     CardDependenciesResponse,
     CardDependencyItem,
@@ -31,6 +33,7 @@ from app.schemas.list_schema import ListSchemaProject
 class CardRules:
     def __init__(self, db_session: AsyncSession):
         self.db_session = db_session
+        self.stats_rules = ProjectStatsRules(db_session)
 
     async def add_card(self, list_id: int, card_data: CardSchemaBase, user_id: int | None = None) -> int:
         """
@@ -82,6 +85,9 @@ class CardRules:
                     user_id=user_id,
                 )
             )
+            await self.stats_rules.apply_card_change(
+                project_id, None, self._stats_entry(new_card, list_obj)
+            )
             await self.db_session.commit()
             await self.db_session.refresh(new_card)
             return new_card.id
@@ -123,6 +129,19 @@ class CardRules:
             NoResultFound: If the card does not exist.
         """
         card = await self._get_card_or_404(card_id)
+        project_id: int | None = None
+        stats_list = None
+        moved_event = None
+
+        # Snapshot of the card's contribution to the materialized project stats
+        old_list_id, old_priority, old_completed_at, old_story_points = (
+            card.list_id,
+            card.priority,
+            card.completed_at,
+            card.story_points,
+        )
+        old_tags = {tc.tagId: tc.tag.name if tc.tag else None for tc in card.tag_cards}
+        new_tags = old_tags
 
         # --- Detect list change for audit log and completed_at ---
         if data.list_id is not None and data.list_id != card.list_id:
@@ -137,19 +156,23 @@ class CardRules:
             new_list = new_list_result.scalars().unique().one_or_none()
 
             if new_list:
+                project_id = new_list.project_id
+                stats_list = new_list
+
                 # Set completed_at when entering the final list; clear it when leaving
                 card.completed_at = datetime.utcnow() if new_list.is_final else None
 
                 # Record in history
-                self.db_session.add(
-                    CardHistoryModel(
-                        card_id=card.id,
-                        action="moved",
-                        old_value=old_list.name if old_list else str(card.list_id),
-                        new_value=new_list.name,
-                        user_id=user_id,
-                    )
+                moved_event = CardHistoryModel(
+                    card_id=card.id,
+                    action="moved",
+                    old_value=old_list.name if old_list else str(card.list_id),
+                    new_value=new_list.name,
+                    old_list_id=old_list_id,
+                    new_list_id=new_list.id,
+                    user_id=user_id,
                 )
+                self.db_session.add(moved_event)
 
         # --- Audit Log: edited (title changed) ---
         if data.title is not None and data.title != card.title:
@@ -246,6 +269,7 @@ class CardRules:
             )
             card_list = list_result.scalars().unique().one_or_none()
             project_id = card_list.project_id if card_list else None
+            new_tags = {}
 
             # Delete all existing tag_cards for this card and re-create
             await self.db_session.execute(
@@ -255,6 +279,7 @@ class CardRules:
             seen_tag_ids: set[int] = set()
             for tag_data in data.tag_cards:
                 tag_id: int | None = None
+                tag_name: str | None = tag_data.name
 
                 if tag_data.name and project_id:
                     # Name takes priority: find existing tag or create a new one.
@@ -269,6 +294,7 @@ class CardRules:
 
                     if existing_tag:
                         tag_id = existing_tag.id
+                        tag_name = existing_tag.name
                     else:
                         new_tag_model = TagModel(
                             name=tag_data.name, projectId=project_id
@@ -285,6 +311,7 @@ class CardRules:
 
                 if tag_id is not None and tag_id not in seen_tag_ids:
                     seen_tag_ids.add(tag_id)
+                    new_tags[tag_id] = tag_name
                     self.db_session.add(
                         TagCardModel(tagId=tag_id, cardId=card.id)
                     )
@@ -359,7 +386,49 @@ class CardRules:
                     )
                 )
 
+        # --- Materialized project stats ---
+        if (
+            card.list_id != old_list_id
+            or card.priority != old_priority
+            or new_tags != old_tags
+        ):
+            await self.db_session.flush()
+            if project_id is None:
+                project_id = await self._get_project_id(card.list_id)
+
+            # completed_at only changes on a move. The flushed "moved" event belongs
+            # to the new state: the old cycle time must not start at it.
+            completion_changed = card.completed_at != old_completed_at
+            first_moved = first_moved_before = None
+            if completion_changed and old_completed_at is not None:
+                first_moved_before = await self._first_moved_at(card.id, exclude=moved_event)
+            if completion_changed and card.completed_at is not None:
+                first_moved = await self._first_moved_at(card.id)
+
+            before = CardStatsEntry(
+                list_id=old_list_id,
+                priority=old_priority,
+                tags=old_tags,
+                lead_days=_days_between(card.created_at, old_completed_at),
+                cycle_days=_days_between(first_moved_before, old_completed_at),
+            )
+            after = self._stats_entry(card, stats_list, new_tags, first_moved)
+            if not completion_changed:
+                # lead/cycle contributions cancel out
+                after.lead_days = after.cycle_days = None
+                before.lead_days = before.cycle_days = None
+            await self.stats_rules.apply_card_change(project_id, before, after)
+
+        # Cached throughput depends on completions and on points of completed cards
+        throughput_changed = card.completed_at != old_completed_at or (
+            card.completed_at is not None and card.story_points != old_story_points
+        )
+        if throughput_changed and project_id is None:
+            project_id = await self._get_project_id(card.list_id)
+
         await self.db_session.commit()
+        if throughput_changed:
+            invalidate_throughput(project_id)
         await self.db_session.refresh(card)
         return card
 
@@ -413,9 +482,22 @@ class CardRules:
         await self._check_delete_permission(card_id, user_id)
         card = await self._get_card_or_404(card_id)
 
+        project_id = await self._get_project_id(card.list_id)
+        first_moved = (
+            await self._first_moved_at(card.id) if card.completed_at is not None else None
+        )
+        tags = {tc.tagId: tc.tag.name if tc.tag else None for tc in card.tag_cards}
+        entry = self._stats_entry(card, tags=tags, first_moved=first_moved)
+
+        completed = card.completed_at is not None
         await self.db_session.delete(card)
+        # Flushed first: an unmaterialized project is rebuilt without the card
+        await self.db_session.flush()
+        await self.stats_rules.apply_card_change(project_id, entry, None)
 
         await self.db_session.commit()
+        if completed:
+            invalidate_throughput(project_id)
 
     async def search_cards(self, q: str, project_id: int | None) -> list[CardSearchResult]:
         """
@@ -552,3 +634,51 @@ class CardRules:
         if not card:
             raise NoResultFound(f"Card id={card_id} not found.")
         return card
+
+    async def _get_project_id(self, list_id: int) -> int | None:
+        result = await self.db_session.execute(
+            select(ListModel.project_id).where(ListModel.id == list_id)
+        )
+        return result.scalar_one_or_none()
+
+    async def _first_moved_at(
+        self, card_id: int, exclude: CardHistoryModel | None = None
+    ) -> datetime | None:
+        """
+        Timestamp of the card's first "moved" event (start of its cycle time).
+
+        ``exclude`` leaves out an event already flushed in this transaction.
+        """
+        stmt = select(func.min(CardHistoryModel.created_at)).where(
+            CardHistoryModel.card_id == card_id,
+            CardHistoryModel.action == "moved",
+        )
+        if exclude is not None:
+            stmt = stmt.where(CardHistoryModel.id != exclude.id)
+        result = await self.db_session.execute(stmt)
+        return result.scalar()
+
+    @staticmethod
+    def _stats_entry(
+        card: CardModel,
+        list_obj: ListModel | None = None,
+        tags: dict[int, str | None] | None = None,
+        first_moved: datetime | None = None,
+    ) -> CardStatsEntry:
+        """Builds the card's contribution to the materialized project stats."""
+        return CardStatsEntry(
+            list_id=card.list_id,
+            list_name=list_obj.name if list_obj else None,
+            list_is_final=list_obj.is_final if list_obj else None,
+            list_order=list_obj.order if list_obj else None,
+            priority=card.priority,
+            tags=tags or {},
+            lead_days=_days_between(card.created_at, card.completed_at),
+            cycle_days=_days_between(first_moved, card.completed_at),
+        )
+
+
+def _days_between(start: datetime | None, end: datetime | None) -> float | None:
+    if start is None or end is None:
+        return None
+    return (end - start).total_seconds() / 86400
@@ -1,28 +1,47 @@
+import asyncio
+import math
+from bisect import bisect_right
+from collections import Counter
 from datetime import date, datetime, time, timedelta
+from itertools import accumulate
+from time import monotonic
 
-from sqlalchemy import func, select
+import numpy as np
+from sqlalchemy import Date, cast, func, literal, literal_column, select, union_all
+from sqlalchemy.dialects.postgresql import array
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.core.configs import settings
+from app.core.metrics import record_cache
 from app.db.models.approver_model import ApproverModel
 from app.db.models.card_history_model import CardHistoryModel
 from app.db.models.card_model import CardModel
 from app.db.models.list_model import ListModel
 from app.db.models.project_model import ProjectModel
 from app.db.models.tag_card_model import TagCardModel
-from app.db.models.tag_model import TagModel
+from app.rules.project_stats import ProjectStatsRules
+from app.rules.snapshot import SnapshotRules
+from app.schemas.category_schema import CategorySchema
 from app.schemas.dashboard_schema import (
     BurndownPoint,
     BurndownResponse,
+    CfdListSeries,
+    CfdResponse,
     DashboardCardSchema,
-    ListDistribution,
+    DurationDistribution,
+    ForecastResponse,
+    HistogramBucket,
     MyCardsResponse,
     MyDayResponse,
     PendingApprovalsResponse,
-    PriorityDistribution,
     ProjectStatsResponse,
-    TagDistribution,
+    ThroughputResponse,
+    ThroughputWeek,
+    TimeDistributionResponse,
 )
+from app.schemas.serializers import construct
+from app.schemas.user_schema import UserSchemaBase
 
 
 class DashboardRules:
@@ -160,112 +179,11 @@ class DashboardRules:
         - contagem de cards por prioridade
         - contagem de cards por tag
         - tempo médio de conclusão em dias (completed_at - created_at)
-        """
-        # 1. Cards por lista (preserva a ordem das colunas)
-        by_list_stmt = (
-            select(
-                ListModel.name,
-                ListModel.is_final,
-                func.count(CardModel.id).label("cnt"),
-            )
-            .join(CardModel, CardModel.list_id == ListModel.id)
-            .where(ListModel.project_id == project_id)
-            .group_by(ListModel.id, ListModel.name, ListModel.is_final, ListModel.order)
-            .order_by(ListModel.order)
-        )
-        by_list_rows = (await self.db_session.execute(by_list_stmt)).all()
-
-        # 2. Cards por prioridade
-        by_priority_stmt = (
-            select(CardModel.priority, func.count(CardModel.id).label("cnt"))
-            .join(ListModel, ListModel.id == CardModel.list_id)
-            .where(ListModel.project_id == project_id)
-            .group_by(CardModel.priority)
-            .order_by(CardModel.priority)
-        )
-        by_priority_rows = (await self.db_session.execute(by_priority_stmt)).all()
-
-        # 3. Cards por tag
-        by_tag_stmt = (
-            select(TagModel.name, func.count(TagCardModel.cardId).label("cnt"))
-            .join(TagCardModel, TagCardModel.tagId == TagModel.id)
-            .join(CardModel, CardModel.id == TagCardModel.cardId)
-            .join(ListModel, ListModel.id == CardModel.list_id)
-            .where(ListModel.project_id == project_id)
-            .group_by(TagModel.id, TagModel.name)
-            .order_by(func.count(TagCardModel.cardId).desc())
-        )
-        by_tag_rows = (await self.db_session.execute(by_tag_stmt)).all()
-
-        # 4. Lead Time: avg(completed_at - created_at) em dias
-        lead_stmt = (
-            select(
-                func.avg(
-                    func.extract(
-                        "epoch", CardModel.completed_at - CardModel.created_at
-                    )
-                    / 86400
-                )
-            )
-            .join(ListModel, ListModel.id == CardModel.list_id)
-            .where(
-                ListModel.project_id == project_id,
-                CardModel.completed_at.isnot(None),
-                CardModel.created_at.isnot(None),
-            )
-        )
-        lead_raw = (await self.db_session.execute(lead_stmt)).scalar()
-        lead_time = round(float(lead_raw), 1) if lead_raw is not None else None
 
-        # 5. Cycle Time: avg(completed_at - primeiro "moved") em dias
-        first_moved_subq = (
-            select(
-                CardHistoryModel.card_id,
-                func.min(CardHistoryModel.created_at).label("first_moved"),
-            )
-            .where(CardHistoryModel.action == "moved")
-            .group_by(CardHistoryModel.card_id)
-            .subquery()
-        )
-        cycle_stmt = (
-            select(
-                func.avg(
-                    func.extract(
-                        "epoch",
-                        CardModel.completed_at - first_moved_subq.c.first_moved,
-                    )
-                    / 86400
-                )
-            )
-            .join(ListModel, ListModel.id == CardModel.list_id)
-            .join(first_moved_subq, first_moved_subq.c.card_id == CardModel.id)
-            .where(
-                ListModel.project_id == project_id,
-                CardModel.completed_at.isnot(None),
-            )
-        )
-        cycle_raw = (await self.db_session.execute(cycle_stmt)).scalar()
-        cycle_time = round(float(cycle_raw), 1) if cycle_raw is not None else None
-
-        total = sum(r.cnt for r in by_list_rows)
-
-        return ProjectStatsResponse(
-            total_cards=total,
-            by_list=[
-                ListDistribution(list_name=r.name, is_final=r.is_final, count=r.cnt)
-                for r in by_list_rows
-            ],
-            by_priority=[
-                PriorityDistribution(priority=r.priority, count=r.cnt)
-                for r in by_priority_rows
-            ],
-            by_tag=[
-                TagDistribution(tag_name=r.name, count=r.cnt)
-                for r in by_tag_rows
-            ],
-            lead_time_days=lead_time,
-            cycle_time_days=cycle_time,
-        )
+        Lê a linha materializada em project_stats (ver ProjectStatsRules); sem
+        ela, agrega a partir dos cards sem gravar.
+        """
+        return await ProjectStatsRules(self.db_session).get_stats(project_id)
 
     async def get_burndown(
         self, project_id: int, start: date, end: date
@@ -278,38 +196,154 @@ class DashboardRules:
             - foram criados até o fim do dia D  (created_at <= D 23:59:59)
             - ainda não estavam concluídos no fim do dia D
               (completed_at IS NULL OR completed_at > D 23:59:59)
+
+        A série é calculada no app (varredura de eventos), com
+        BURNDOWN_STRATEGY=sql inteiramente no Postgres (ver _get_burndown_sql) ou,
+        com BURNDOWN_STRATEGY=snapshot, lida das fotos diárias em project_snapshots.
         """
-        # Busca todos os cards do projeto com os campos necessários
+        if settings.BURNDOWN_STRATEGY == "sql":
+            return await self._get_burndown_sql(project_id, start, end)
+        if settings.BURNDOWN_STRATEGY == "snapshot":
+            return await self._get_burndown_snapshot(project_id, start, end)
+
+        rows = await self._get_burndown_cards(project_id)
+
+        # Total de story points (ou contagem) no período
+        total = sum(r.story_points if r.story_points else 1 for r in rows)
+
+        return self._build_burndown(start, end, total, _remaining_series(rows, start, end))
+
+    async def _get_burndown_cards(self, project_id: int) -> list:
+        """Busca todos os cards do projeto com os campos necessários ao burndown."""
         stmt = (
             select(CardModel.created_at, CardModel.completed_at, CardModel.story_points)
             .join(ListModel, ListModel.id == CardModel.list_id)
             .where(ListModel.project_id == project_id)
         )
-        rows = (await self.db_session.execute(stmt)).all()
+        return (await self.db_session.execute(stmt)).all()
 
-        # Total de story points (ou contagem) no período
+    async def _get_burndown_snapshot(
+        self, project_id: int, start: date, end: date
+    ) -> BurndownResponse:
+        """
+        Burndown a partir das fotos diárias (O(dias) linhas lidas).
+
+        Dias sem foto (anteriores à ativação do job, ou o dia corrente antes da
+        primeira execução) são reconstruídos a partir dos cards, como na
+        estratégia "python". O total vem sempre dos cards atuais, como nas
+        outras estratégias, para não variar com a janela consultada.
+        """
+        snapshots = await SnapshotRules(self.db_session).get_snapshots(project_id, start, end)
+        by_day = {s.day: s for s in snapshots}
+        days = [start + timedelta(days=i) for i in range((end - start).days + 1)]
+
+        if all(d in by_day for d in days):
+            weight = func.coalesce(func.nullif(CardModel.story_points, 0), 1)
+            total = (
+                await self.db_session.execute(
+                    select(func.coalesce(func.sum(weight), 0))
+                    .join(ListModel, ListModel.id == CardModel.list_id)
+                    .where(ListModel.project_id == project_id)
+                )
+            ).scalar_one()
+            remaining = [by_day[d].remaining_points for d in days]
+            return self._build_burndown(start, end, int(total), remaining)
+
+        rows = await self._get_burndown_cards(project_id)
         total = sum(r.story_points if r.story_points else 1 for r in rows)
+        rebuilt = _remaining_series(rows, start, end)
+        remaining = [
+            by_day[d].remaining_points if d in by_day else rebuilt[i]
+            for i, d in enumerate(days)
+        ]
+        return self._build_burndown(start, end, total, remaining)
+
+    async def _get_burndown_sql(
+        self, project_id: int, start: date, end: date
+    ) -> BurndownResponse:
+        """
+        Mesmo cálculo de get_burndown, feito no banco: apenas uma linha por dia
+        trafega para o app.
+
+        Os eventos de criação (+peso) e conclusão (-peso) são agrupados por dia
+        (eventos anteriores ao período caem no primeiro dia), os dias vêm de
+        generate_series e remaining é a soma acumulada (janela) dos deltas.
+        """
+        weight = func.coalesce(func.nullif(CardModel.story_points, 0), 1)
+
+        project_cards = (
+            select(
+                CardModel.created_at.label("created_at"),
+                CardModel.completed_at.label("completed_at"),
+                weight.label("weight"),
+            )
+            .join(ListModel, ListModel.id == CardModel.list_id)
+            .where(ListModel.project_id == project_id)
+            .cte("project_cards")
+        )
+        # Cards concluídos antes (ou no instante) de serem criados nunca estiveram abertos
+        open_cards = (
+            select(project_cards)
+            .where(
+                project_cards.c.created_at.isnot(None),
+                (project_cards.c.completed_at.is_(None))
+                | (project_cards.c.completed_at > project_cards.c.created_at),
+            )
+            .cte("open_cards")
+        )
+        events = union_all(
+            select(
+                open_cards.c.created_at.label("ts"),
+                open_cards.c.weight.label("delta"),
+            ),
+            select(open_cards.c.completed_at, -open_cards.c.weight).where(
+                open_cards.c.completed_at.isnot(None)
+            ),
+        ).cte("events")
+
+        bucket = func.greatest(cast(events.c.ts, Date), start)
+        daily = (
+            select(bucket.label("day"), func.sum(events.c.delta).label("delta"))
+            .where(cast(events.c.ts, Date) <= end)
+            .group_by(bucket)
+            .cte("daily")
+        )
+        days = select(
+            cast(
+                func.generate_series(start, end, literal_column("interval '1 day'")),
+                Date,
+            ).label("day")
+        ).cte("days")
+        total = select(func.coalesce(func.sum(project_cards.c.weight), 0)).scalar_subquery()
 
+        stmt = (
+            select(
+                days.c.day,
+                func.sum(func.coalesce(daily.c.delta, 0))
+                .over(order_by=days.c.day)
+                .label("remaining"),
+                total.label("total"),
+            )
+            .select_from(days.outerjoin(daily, daily.c.day == days.c.day))
+            .order_by(days.c.day)
+        )
+        rows = (await self.db_session.execute(stmt)).all()
+
+        total_points = int(rows[0].total) if rows else 0
+        return self._build_burndown(
+            start, end, total_points, [int(r.remaining) for r in rows]
+        )
+
+    @staticmethod
+    def _build_burndown(
+        start: date, end: date, total: int, remaining: list[int]
+    ) -> BurndownResponse:
+        """Monta a resposta a partir da série diária de remaining (um valor por dia)."""
         days_count = (end - start).days + 1
         points: list[BurndownPoint] = []
 
         for i in range(days_count):
             day = start + timedelta(days=i)
-            day_end = datetime.combine(day, time.max)
-            day_start_dt = datetime.combine(start, time.min)
-
-            remaining = 0
-            for r in rows:
-                created = r.created_at
-                completed = r.completed_at
-                weight = r.story_points if r.story_points else 1
-
-                # Card existia neste dia?
-                if created is None or created > day_end:
-                    continue
-                # Card ainda estava aberto no fim deste dia?
-                if completed is None or completed > day_end:
-                    remaining += weight
 
             # Linha ideal: decresce linearmente do total (dia 0) até 0 (último dia)
             ideal = total * (1 - i / max(days_count - 1, 1))
@@ -317,7 +351,7 @@ class DashboardRules:
             points.append(
                 BurndownPoint(
                     date=day.strftime("%Y-%m-%d"),
-                    remaining=remaining,
+                    remaining=remaining[i],
                     ideal=round(ideal, 1),
                 )
             )
@@ -329,10 +363,323 @@ class DashboardRules:
             points=points,
         )
 
+    async def get_cfd(self, project_id: int, start: date, end: date) -> CfdResponse:
+        """
+        Cumulative flow diagram: quantidade de cards em cada lista no fim de cada
+        dia do intervalo [start, end].
+
+        Parte do estado atual (cards.listId) e desfaz, do mais recente para o mais
+        antigo, os eventos "moved" do histórico posteriores ao fim de cada dia, em
+        uma única varredura ordenada por createdAt (índice em (action, createdAt)).
+        Cards criados depois do fim do dia não são contados. Registros antigos do
+        histórico, sem oldListId, são resolvidos pelo nome da lista.
+        """
+        lists = (
+            await self.db_session.execute(
+                select(ListModel.id, ListModel.name, ListModel.is_final)
+                .where(ListModel.project_id == project_id)
+                .order_by(ListModel.order)
+            )
+        ).all()
+        cards = (
+            await self.db_session.execute(
+                select(CardModel.id, CardModel.list_id, CardModel.created_at)
+                .join(ListModel, ListModel.id == CardModel.list_id)
+                .where(ListModel.project_id == project_id)
+            )
+        ).all()
+        # Apenas movimentos que ainda precisam ser desfeitos para chegar ao fim de start
+        events = (
+            await self.db_session.execute(
+                select(
+                    CardHistoryModel.card_id,
+                    CardHistoryModel.old_list_id,
+                    CardHistoryModel.old_value,
+                    CardHistoryModel.created_at,
+                )
+                .join(CardModel, CardModel.id == CardHistoryModel.card_id)
+                .join(ListModel, ListModel.id == CardModel.list_id)
+                .where(
+                    ListModel.project_id == project_id,
+                    CardHistoryModel.action == "moved",
+                    CardHistoryModel.created_at > datetime.combine(start, time.max),
+                )
+                .order_by(CardHistoryModel.created_at.desc(), CardHistoryModel.id.desc())
+            )
+        ).all()
+
+        ids_by_name: dict[str, int] = {}
+        for lst in lists:
+            ids_by_name.setdefault(lst.name, lst.id)
+
+        moves: list[tuple[datetime, int, int]] = []
+        for e in events:
+            old_list_id = e.old_list_id
+            if old_list_id is None and e.old_value is not None:
+                old_list_id = ids_by_name.get(e.old_value)
+                # Sem a lista de origem, o registro guardava o id como texto
+                if old_list_id is None and e.old_value.isdigit():
+                    old_list_id = int(e.old_value)
+            if old_list_id is not None:
+                moves.append((e.created_at, e.card_id, old_list_id))
+
+        series = _cfd_series(cards, moves, start, end)
+        days_count = (end - start).days + 1
+        return CfdResponse(
+            start=start.strftime("%Y-%m-%d"),
+            end=end.strftime("%Y-%m-%d"),
+            dates=[
+                (start + timedelta(days=i)).strftime("%Y-%m-%d") for i in range(days_count)
+            ],
+            lists=[
+                CfdListSeries(
+                    list_id=lst.id,
+                    list_name=lst.name,
+                    is_final=lst.is_final,
+                    counts=[day.get(lst.id, 0) for day in series],
+                )
+                for lst in lists
+            ],
+        )
+
+    async def get_time_distribution(
+        self,
+        project_id: int,
+        start: date,
+        end: date,
+        tag_id: int | None = None,
+        category_id: int | None = None,
+        buckets: int = 10,
+    ) -> TimeDistributionResponse:
+        """
+        Distribuição de lead time e cycle time (em dias) dos cards concluídos em
+        [start, end], opcionalmente filtrados por tag e/ou categoria.
+
+        Tudo é calculado no Postgres: percentile_cont para p50/p85/p95 e
+        width_bucket para o histograma (entre o menor e o maior valor); apenas
+        os agregados trafegam para o app.
+        """
+        durations = _durations_cte(project_id, start, end, tag_id, category_id)
+        metrics = {"lead": durations.c.lead_days, "cycle": durations.c.cycle_days}
+
+        summary = (
+            await self.db_session.execute(
+                select(
+                    *(
+                        expr
+                        for name, col in metrics.items()
+                        for expr in (
+                            func.count(col).label(f"{name}_count"),
+                            func.percentile_cont(array(_PERCENTILES))
+                            .within_group(col)
+                            .label(f"{name}_pct"),
+                            func.min(col).label(f"{name}_min"),
+                            func.max(col).label(f"{name}_max"),
+                        )
+                    )
+                )
+            )
+        ).one()
+
+        # Histograma: um ramo do UNION ALL por métrica com amplitude > 0
+        branches = []
+        for name, col in metrics.items():
+            low, high = getattr(summary, f"{name}_min"), getattr(summary, f"{name}_max")
+            if low is None or high <= low:
+                continue
+            # width_bucket devolve buckets + 1 para o valor máximo: fica no último
+            bucket = func.least(func.width_bucket(col, low, high, buckets), buckets).label(
+                "bucket"
+            )
+            branches.append(
+                select(literal(name).label("kind"), bucket, func.count().label("cnt"))
+                .where(col.isnot(None))
+                .group_by(bucket)
+            )
+        counts: dict[tuple[str, int], int] = {}
+        if branches:
+            stmt = branches[0] if len(branches) == 1 else union_all(*branches)
+            for r in (await self.db_session.execute(stmt)).all():
+                counts[(r.kind, r.bucket)] = r.cnt
+
+        def distribution(name: str) -> DurationDistribution:
+            count = getattr(summary, f"{name}_count")
+            if not count:
+                return DurationDistribution(count=0, histogram=[])
+            p50, p85, p95 = (round(float(v), 1) for v in getattr(summary, f"{name}_pct"))
+            low = float(getattr(summary, f"{name}_min"))
+            high = float(getattr(summary, f"{name}_max"))
+            if high <= low:
+                histogram = [
+                    HistogramBucket(lower=round(low, 1), upper=round(high, 1), count=count)
+                ]
+            else:
+                width = (high - low) / buckets
+                histogram = [
+                    HistogramBucket(
+                        lower=round(low + i * width, 1),
+                        upper=round(low + (i + 1) * width, 1),
+                        count=counts.get((name, i + 1), 0),
+                    )
+                    for i in range(buckets)
+                ]
+            return DurationDistribution(
+                count=count, p50=p50, p85=p85, p95=p95, histogram=histogram
+            )
+
+        return TimeDistributionResponse(
+            start=start.strftime("%Y-%m-%d"),
+            end=end.strftime("%Y-%m-%d"),
+            lead_time=distribution("lead"),
+            cycle_time=distribution("cycle"),
+        )
+
+    async def get_throughput(self, project_id: int, weeks: int = 12) -> ThroughputResponse:
+        """
+        Throughput semanal: cards e story points concluídos por semana ISO, da
+        semana de ``weeks - 1`` semanas atrás até a atual, em uma única consulta
+        agrupada por date_trunc('week', completedAt).
+
+        O resultado fica em cache no processo por THROUGHPUT_CACHE_SECONDS ou
+        até a próxima conclusão de card do projeto neste worker (ver
+        invalidate_throughput); conclusões feitas em outros workers aparecem
+        quando o prazo vence.
+        """
+        today = datetime.utcnow().date()
+        first_week = today - timedelta(days=today.weekday(), weeks=weeks - 1)
+        key = (project_id, weeks, first_week)
+        entry = _throughput_cache.get(key)
+        cached = entry[1] if entry is not None and entry[0] > monotonic() else None
+        record_cache("throughput", cached is not None)
+        if cached is not None:
+            return cached
+
+        week = func.date_trunc(literal_column("'week'"), CardModel.completed_at)
+        stmt = (
+            select(
+                week.label("week"),
+                func.count(CardModel.id).label("cards"),
+                func.coalesce(func.sum(CardModel.story_points), 0).label("points"),
+            )
+            .join(ListModel, ListModel.id == CardModel.list_id)
+            .where(
+                ListModel.project_id == project_id,
+                CardModel.completed_at >= datetime.combine(first_week, time.min),
+            )
+            .group_by(week)
+        )
+        by_week = {
+            r.week.date(): r for r in (await self.db_session.execute(stmt)).all()
+        }
+
+        points: list[ThroughputWeek] = []
+        for i in range(weeks):
+            week_start = first_week + timedelta(weeks=i)
+            row = by_week.get(week_start)
+            iso_year, iso_week, _ = week_start.isocalendar()
+            points.append(
+                ThroughputWeek(
+                    week=f"{iso_year}-W{iso_week:02d}",
+                    week_start=week_start.strftime("%Y-%m-%d"),
+                    cards=row.cards if row else 0,
+                    story_points=int(row.points) if row else 0,
+                )
+            )
+
+        response = ThroughputResponse(
+            weeks=points,
+            avg_cards=round(sum(p.cards for p in points) / weeks, 1),
+            avg_story_points=round(sum(p.story_points for p in points) / weeks, 1),
+        )
+        if len(_throughput_cache) >= _THROUGHPUT_CACHE_SIZE:
+            _throughput_cache.clear()
+        _throughput_cache[key] = (monotonic() + settings.THROUGHPUT_CACHE_SECONDS, response)
+        return response
+
+    async def get_forecast(
+        self,
+        project_id: int,
+        cards: int | None = None,
+        history_days: int = 90,
+        trials: int = 10_000,
+        seed: int | None = None,
+    ) -> ForecastResponse:
+        """
+        Previsão Monte Carlo da data de conclusão de ``cards`` cards (padrão: os
+        cards do projeto fora da lista final).
+
+        Cada simulação sorteia, com reposição, o throughput diário dos últimos
+        ``history_days`` dias completos até somar a quantidade de cards. As
+        simulações rodam vetorizadas em NumPy (ver _simulate_completion_days),
+        fora do event loop e limitadas a _FORECAST_MAX_DRAWS sorteios: backlogs
+        grandes para o throughput reduzem ``trials`` (ver _forecast_plan).
+        """
+        project_cards = (
+            select(CardModel.id)
+            .join(ListModel, ListModel.id == CardModel.list_id)
+            .where(ListModel.project_id == project_id)
+        )
+        if cards is None:
+            cards = (
+                await self.db_session.execute(
+                    select(func.count()).select_from(
+                        project_cards.where(ListModel.is_final.is_(False)).subquery()
+                    )
+                )
+            ).scalar_one()
+
+        today = datetime.utcnow().date()
+        since = today - timedelta(days=history_days)
+        day = cast(CardModel.completed_at, Date)
+        daily = (
+            await self.db_session.execute(
+                select(day.label("day"), func.count(CardModel.id).label("cnt"))
+                .join(ListModel, ListModel.id == CardModel.list_id)
+                .where(
+                    ListModel.project_id == project_id,
+                    CardModel.completed_at >= datetime.combine(since, time.min),
+                    CardModel.completed_at < datetime.combine(today, time.min),
+                )
+                .group_by(day)
+            )
+        ).all()
+
+        samples = np.zeros(history_days, dtype=np.int64)
+        for r in daily:
+            samples[(r.day - since).days] = r.cnt
+
+        mean = float(samples.mean())
+        if cards and not mean:
+            # Sem conclusões no histórico: não há como prever
+            return ForecastResponse(
+                remaining_cards=cards,
+                trials=trials,
+                history_days=history_days,
+                avg_daily_throughput=0.0,
+            )
+
+        trials, horizon = _forecast_plan(cards, mean, trials)
+        response = ForecastResponse(
+            remaining_cards=cards,
+            trials=trials,
+            history_days=history_days,
+            avg_daily_throughput=round(mean, 2),
+        )
+        days = await asyncio.to_thread(
+            _simulate_completion_days, samples, cards, trials, np.random.default_rng(seed), horizon
+        )
+        for name, q in (("p50", 50), ("p85", 85), ("p95", 95)):
+            offset = int(np.percentile(days, q, method="higher"))
+            # Percentil além do horizonte simulado fica sem data
+            if offset <= horizon:
+                setattr(response, name, (today + timedelta(days=offset)).strftime("%Y-%m-%d"))
+        return response
+
     def _to_dashboard_card(self, card: CardModel) -> DashboardCardSchema:
+        # Sem validação: os dados vêm do banco e o FastAPI não revalida a instância
         lst: ListModel = card.list
         project: ProjectModel = lst.project
-        return DashboardCardSchema(
+        return DashboardCardSchema.model_construct(
             id=card.id,
             card_number=card.card_number,
             title=card.title,
@@ -343,6 +690,213 @@ class DashboardRules:
             list_name=lst.name,
             project_id=project.id,
             project_title=project.title,
-            user=card.user,
-            category=card.category,
+            user=construct(UserSchemaBase, card.user),
+            category=construct(CategorySchema, card.category),
+        )
+
+
+def _remaining_series(rows, start: date, end: date) -> list[int]:
+    """
+    Calcula remaining(D) para cada dia D em [start, end] por varredura de eventos.
+
+    Cada card aberto contribui com +peso no created_at e -peso no completed_at,
+    ou seja, conta nos dias em que created_at <= fim(D) < completed_at. Os
+    eventos são ordenados uma única vez e a soma acumulada é lida por busca
+    binária no fim de cada dia: O(cards log cards + dias), sem laço dias × cards.
+    """
+    events: list[tuple[datetime, int]] = []
+    for r in rows:
+        created = r.created_at
+        completed = r.completed_at
+        if created is None:
+            continue
+        # Concluído antes (ou no instante) de ser criado: nunca esteve aberto
+        if completed is not None and completed <= created:
+            continue
+        weight = r.story_points if r.story_points else 1
+        events.append((created, weight))
+        if completed is not None:
+            events.append((completed, -weight))
+
+    events.sort(key=lambda e: e[0])
+    times = [t for t, _ in events]
+    prefix = list(accumulate((delta for _, delta in events), initial=0))
+
+    days_count = (end - start).days + 1
+    return [
+        prefix[bisect_right(times, datetime.combine(start + timedelta(days=i), time.max))]
+        for i in range(days_count)
+    ]
+
+
+# Cache de get_throughput por (projeto, semanas, primeira semana), local ao
+# processo: cada entrada guarda (validade em monotonic(), resposta)
+_THROUGHPUT_CACHE_SIZE = 1024
+_throughput_cache: dict[tuple[int, int, date], tuple[float, ThroughputResponse]] = {}
+
+
+def invalidate_throughput(project_id: int) -> None:
+    """Descarta o throughput em cache do projeto (chamar após o commit)."""
+    for key in [k for k in _throughput_cache if k[0] == project_id]:
+        _throughput_cache.pop(key, None)
+
+
+# Simulação Monte Carlo: dias sorteados por bloco, horizonte máximo (~10 anos)
+# e teto de sorteios por previsão (~30 ms de CPU)
+_FORECAST_BLOCK_DAYS = 90
+_FORECAST_HORIZON_DAYS = 40 * _FORECAST_BLOCK_DAYS
+_FORECAST_MAX_DRAWS = 3_000_000
+_FORECAST_MIN_TRIALS = 500
+
+
+def _forecast_plan(cards: int, mean_throughput: float, trials: int) -> tuple[int, int]:
+    """
+    Simulações e horizonte (em dias) que cabem em _FORECAST_MAX_DRAWS.
+
+    O custo é simulações × dias simulados, e os dias crescem com cards /
+    throughput médio. Reserva o dobro da duração média para a cauda (p95) e
+    reduz ``trials`` até caber no teto, sem ficar abaixo de
+    _FORECAST_MIN_TRIALS; o horizonte usa o que sobra do teto.
+    """
+    if not cards:
+        return trials, _FORECAST_HORIZON_DAYS
+    needed = min(_FORECAST_HORIZON_DAYS, 2 * math.ceil(cards / mean_throughput))
+    trials = min(trials, max(_FORECAST_MIN_TRIALS, _FORECAST_MAX_DRAWS // max(needed, 1)))
+    return trials, min(_FORECAST_HORIZON_DAYS, _FORECAST_MAX_DRAWS // trials)
+
+
+def _simulate_completion_days(
+    samples: np.ndarray,
+    cards: int,
+    trials: int,
+    rng: np.random.Generator,
+    horizon: int = _FORECAST_HORIZON_DAYS,
+) -> np.ndarray:
+    """
+    Dias até concluir ``cards`` cards em cada uma das ``trials`` simulações.
+
+    Em vez de um laço por simulação, sorteia uma matriz (simulações ativas ×
+    bloco de dias) de throughputs diários, acumula por linha e localiza o
+    primeiro dia em que a soma alcança o restante. Só as simulações ainda não
+    concluídas seguem para o bloco seguinte. As que não terminam até o fim do
+    bloco que alcança ``horizon`` ficam com horizon + 1.
+    """
+    days = np.full(trials, horizon + 1, dtype=np.int64)
+    if cards <= 0:
+        days[:] = 0
+        return days
+
+    active = np.arange(trials)
+    remaining = np.full(trials, cards, dtype=np.int64)
+    elapsed = 0
+    while active.size and elapsed < horizon:
+        cum = rng.choice(samples, size=(active.size, _FORECAST_BLOCK_DAYS)).cumsum(axis=1)
+        hit = cum >= remaining[:, None]
+        finished = hit.any(axis=1)
+        days[active[finished]] = elapsed + hit[finished].argmax(axis=1) + 1
+        remaining = remaining[~finished] - cum[~finished, -1]
+        active = active[~finished]
+        elapsed += _FORECAST_BLOCK_DAYS
+    return days
+
+
+# Percentis devolvidos por get_time_distribution (um único percentile_cont com array)
+_PERCENTILES = [0.5, 0.85, 0.95]
+
+
+def _durations_cte(
+    project_id: int,
+    start: date,
+    end: date,
+    tag_id: int | None = None,
+    category_id: int | None = None,
+):
+    """
+    CTE com lead_days e cycle_days de cada card do projeto concluído em
+    [start, end]. cycle_days é nulo para cards que nunca foram movidos.
+    """
+    window_cards = (
+        select(
+            CardModel.id.label("card_id"),
+            CardModel.created_at.label("created_at"),
+            CardModel.completed_at.label("completed_at"),
+        )
+        .join(ListModel, ListModel.id == CardModel.list_id)
+        .where(
+            ListModel.project_id == project_id,
+            CardModel.completed_at >= datetime.combine(start, time.min),
+            CardModel.completed_at <= datetime.combine(end, time.max),
+        )
+    )
+    if tag_id is not None:
+        window_cards = window_cards.where(
+            CardModel.id.in_(select(TagCardModel.cardId).where(TagCardModel.tagId == tag_id))
+        )
+    if category_id is not None:
+        window_cards = window_cards.where(CardModel.category_id == category_id)
+    window_cards = window_cards.cte("window_cards")
+
+    first_moved = (
+        select(
+            CardHistoryModel.card_id.label("card_id"),
+            func.min(CardHistoryModel.created_at).label("first_moved"),
+        )
+        .join(window_cards, window_cards.c.card_id == CardHistoryModel.card_id)
+        .where(CardHistoryModel.action == "moved")
+        .group_by(CardHistoryModel.card_id)
+        .cte("first_moved")
+    )
+
+    return (
+        select(
+            window_cards.c.card_id,
+            (
+                func.extract("epoch", window_cards.c.completed_at - window_cards.c.created_at)
+                / 86400
+            ).label("lead_days"),
+            (
+                func.extract("epoch", window_cards.c.completed_at - first_moved.c.first_moved)
+                / 86400
+            ).label("cycle_days"),
         )
+        .outerjoin(first_moved, first_moved.c.card_id == window_cards.c.card_id)
+        .cte("durations")
+    )
+
+
+def _cfd_series(
+    cards, moves: list[tuple[datetime, int, int]], start: date, end: date
+) -> list[Counter]:
+    """
+    Contagem de cards por lista no fim de cada dia D em [start, end].
+
+    ``moves`` são tuplas (momento, card_id, lista de origem) em ordem decrescente.
+    A varredura vai do último dia para o primeiro: antes de ler o dia D, desfaz
+    os movimentos e remove as criações posteriores a fim(D). O(cards + eventos + dias).
+    """
+    position = {c.id: c.list_id for c in cards}
+    counts = Counter(position.values())
+    creations = sorted(
+        ((c.created_at, c.id) for c in cards if c.created_at is not None), reverse=True
+    )
+
+    days_count = (end - start).days + 1
+    series: list[Counter] = []
+    m = k = 0
+    for i in range(days_count - 1, -1, -1):
+        day_end = datetime.combine(start + timedelta(days=i), time.max)
+        # Movimentos antes de criações: um card é movido depois de criado
+        while m < len(moves) and moves[m][0] > day_end:
+            _, card_id, old_list_id = moves[m]
+            m += 1
+            if card_id in position:
+                counts[position[card_id]] -= 1
+                counts[old_list_id] += 1
+                position[card_id] = old_list_id
+        while k < len(creations) and creations[k][0] > day_end:
+            card_id = creations[k][1]
+            k += 1
+            counts[position.pop(card_id)] -= 1
+        series.append(+counts)
+    series.reverse()
+    return series
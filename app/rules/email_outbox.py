@@ -0,0 +1,111 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.configs import settings
+from app.core.email import EmailTransport
+from app.db.models.email_outbox_model import EmailOutboxModel
+
+# Backoff exponencial entre tentativas: 30s, 1min, 2min, ... até 1h
+_RETRY_BASE = timedelta(seconds=30)
+_RETRY_MAX = timedelta(hours=1)
+
+
+class EmailOutboxRules:
+    def __init__(self, db_session: AsyncSession):
+        self.db_session = db_session
+
+    def enqueue(self, to: str, subject: str, body: str) -> EmailOutboxModel:
+        """
+        Adiciona o e-mail à outbox na transação corrente, sem commit: ele só
+        fica visível ao worker quando a operação que o gerou for confirmada.
+        """
+        email = EmailOutboxModel(
+            to=to,
+            subject=subject,
+            body=body,
+            status="pending",
+            attempts=0,
+            next_attempt_at=datetime.utcnow(),
+        )
+        self.db_session.add(email)
+        return email
+
+    async def count_pending(self) -> int:
+        """Tamanho da fila: e-mails ainda pendentes (inclui os aguardando retry)."""
+        result = await self.db_session.execute(
+            select(func.count()).where(EmailOutboxModel.status == "pending")
+        )
+        return result.scalar()
+
+    async def send_pending(self, transport: EmailTransport, batch_size: int) -> int:
+        """
+        Envia um lote de e-mails pendentes com uma única conexão do transporte.
+        O corpo de cada e-mail enviado é apagado da outbox.
+
+        As linhas são travadas com FOR UPDATE SKIP LOCKED, então vários workers
+        podem rodar ao mesmo tempo sem enviar o mesmo e-mail. Falhas voltam para
+        a fila com backoff exponencial até EMAIL_MAX_ATTEMPTS. Faz commit.
+        Retorna o tamanho do lote.
+        """
+        now = datetime.utcnow()
+        result = await self.db_session.execute(
+            select(EmailOutboxModel)
+            .where(
+                EmailOutboxModel.status == "pending",
+                EmailOutboxModel.next_attempt_at <= now,
+            )
+            .order_by(EmailOutboxModel.id)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        emails = result.scalars().all()
+        if not emails:
+            await self.db_session.rollback()
+            return 0
+
+        try:
+            await transport.open()
+        except Exception as e:
+            for email in emails:
+                self._schedule_retry(email, e, now)
+        else:
+            try:
+                for email in emails:
+                    try:
+                        await transport.send(email.to, email.subject, email.body)
+                    except Exception as e:
+                        self._schedule_retry(email, e, now)
+                    else:
+                        email.attempts += 1
+                        email.status = "sent"
+                        email.sent_at = datetime.utcnow()
+                        email.last_error = None
+                        # O corpo pode ter links com token (reset de senha): não guardar após o envio
+                        email.body = None
+            finally:
+                await transport.close()
+
+        await self.db_session.commit()
+        return len(emails)
+
+    async def send_all_pending(self, transport: EmailTransport, batch_size: int) -> int:
+        """Envia lotes até esvaziar a fila de e-mails elegíveis. Retorna o total."""
+        total = 0
+        while True:
+            sent = await self.send_pending(transport, batch_size)
+            total += sent
+            if sent < batch_size:
+                return total
+
+    @staticmethod
+    def _schedule_retry(email: EmailOutboxModel, error: Exception, now: datetime) -> None:
+        email.attempts += 1
+        email.last_error = f"{type(error).__name__}: {error}"[:500]
+        if email.attempts >= settings.EMAIL_MAX_ATTEMPTS:
+            email.status = "failed"
+        else:
+            email.next_attempt_at = now + min(
+                _RETRY_BASE * 2 ** (email.attempts - 1), _RETRY_MAX
+            )
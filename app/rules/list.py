@@ -10,6 +10,8 @@ from app.db.models.list_model import ListModel
 from app.db.models.project_user_model import ProjectUserModel
 from app.db.models.role_model import RoleModel
 from app.db.models.tag_card_model import TagCardModel
+from app.rules.dashboard import invalidate_throughput
+from app.rules.project_stats import ProjectStatsRules
 from app.schemas.list_schema import ListSchemaUp
 
 # Roles allowed to create/update lists
@@ -157,7 +159,9 @@ class ListRules:
         self.db_session.add(new_list)
         await self.db_session.flush()
         await self._recalculate_final_list(project_id)
+        await ProjectStatsRules(self.db_session).rebuild(project_id)
         await self.db_session.commit()
+        invalidate_throughput(project_id)
         await self.db_session.refresh(new_list)
         return new_list
 
@@ -178,7 +182,9 @@ class ListRules:
             lst.order = data.order
         await self.db_session.flush()
         await self._recalculate_final_list(project_id)
+        await ProjectStatsRules(self.db_session).rebuild(project_id)
         await self.db_session.commit()
+        invalidate_throughput(project_id)
         await self.db_session.refresh(lst)
         return lst
 
@@ -256,4 +262,6 @@ class ListRules:
         await self.db_session.delete(lst)
         await self.db_session.flush()
         await self._recalculate_final_list(project_id)
+        await ProjectStatsRules(self.db_session).rebuild(project_id)
         await self.db_session.commit()
+        invalidate_throughput(project_id)
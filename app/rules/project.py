@@ -8,13 +8,15 @@ from fastapi.exceptions import HTTPException
 from fastapi import status
 
 from app.core.configs import settings
-from app.core.email import send_email
 from app.db.models.list_model import ListModel
 from app.db.models.project_model import ProjectModel
 from app.db.models.tag_model import TagModel
 from app.db.models.project_user_model import ProjectUserModel
 from app.db.models.role_model import RoleModel
 from app.db.models.user_model import UserModel
+from app.rules.dashboard import invalidate_throughput
+from app.rules.email_outbox import EmailOutboxRules
+from app.rules.project_stats import ProjectStatsRules
 
 from app.schemas.project_schema import (
     InviteUserResult,
@@ -227,7 +229,12 @@ class ProjectRules:
                 if lst.id not in received_ids:
                     await self.db_session.delete(lst)
 
+            await self.db_session.flush()
+            await ProjectStatsRules(self.db_session).rebuild(project_id)
+
         await self.db_session.commit()
+        if data.lists is not None:
+            invalidate_throughput(project_id)
         await self.db_session.refresh(project)
 
         return project
@@ -411,7 +418,7 @@ class ProjectRules:
                     )
             else:
                 front_url = settings.FRONT_URL
-                send_email(
+                EmailOutboxRules(self.db_session).enqueue(
                     to=email,
                     subject="You've been invited to the project management system",
                     body=(
@@ -0,0 +1,447 @@
+import json
+from dataclasses import dataclass, field
+
+from sqlalchemy import (
+    JSON,
+    Boolean,
+    Float,
+    Integer,
+    String,
+    cast,
+    func,
+    literal,
+    null,
+    select,
+    text,
+    union_all,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models.card_history_model import CardHistoryModel
+from app.db.models.card_model import CardModel
+from app.db.models.list_model import ListModel
+from app.db.models.project_stats_model import ProjectStatsModel
+from app.db.models.tag_card_model import TagCardModel
+from app.db.models.tag_model import TagModel
+from app.schemas.dashboard_schema import (
+    ListDistribution,
+    PriorityDistribution,
+    ProjectStatsResponse,
+    TagDistribution,
+)
+
+
+@dataclass
+class CardStatsEntry:
+    """
+    Contribuição de um card para as estatísticas do projeto.
+
+    Os metadados da lista e os nomes das tags só são necessários quando a
+    chave ainda não existe na linha materializada; sem eles a linha é
+    reconstruída.
+    """
+
+    list_id: int
+    list_name: str | None = None
+    list_is_final: bool | None = None
+    list_order: int | None = None
+    priority: int | None = None
+    tags: dict[int, str | None] = field(default_factory=dict)
+    lead_days: float | None = None
+    cycle_days: float | None = None
+
+
+def project_stats_stmt(project_id: int):
+    """
+    Monta uma única instrução com as cinco agregações das estatísticas do projeto.
+
+    Os cards do projeto são resolvidos uma vez na CTE ``project_cards`` e cada
+    agregação vira um ramo do UNION ALL, identificado pela coluna ``kind``:
+    - list / priority / tag: contagem de cards (``cnt``) por chave
+    - lead / cycle: quantidade (``cnt``) e soma em dias (``total_days``)
+    """
+    project_cards = (
+        select(
+            CardModel.id.label("card_id"),
+            CardModel.list_id.label("list_id"),
+            CardModel.priority.label("priority"),
+            CardModel.created_at.label("created_at"),
+            CardModel.completed_at.label("completed_at"),
+        )
+        .join(ListModel, ListModel.id == CardModel.list_id)
+        .where(ListModel.project_id == project_id)
+        .cte("project_cards")
+    )
+    first_moved = (
+        select(
+            CardHistoryModel.card_id.label("card_id"),
+            func.min(CardHistoryModel.created_at).label("first_moved"),
+        )
+        .join(project_cards, project_cards.c.card_id == CardHistoryModel.card_id)
+        .where(CardHistoryModel.action == "moved")
+        .group_by(CardHistoryModel.card_id)
+        .cte("first_moved")
+    )
+
+    no_int = cast(null(), Integer)
+    no_str = cast(null(), String)
+    no_bool = cast(null(), Boolean)
+    no_float = cast(null(), Float)
+    cnt = func.count(project_cards.c.card_id).label("cnt")
+
+    # 1. Cards por lista (sort_key preserva a ordem das colunas)
+    by_list = (
+        select(
+            literal("list").label("kind"),
+            ListModel.id.label("key"),
+            ListModel.name.label("label"),
+            ListModel.is_final.label("is_final"),
+            ListModel.order.label("sort_key"),
+            cnt,
+            no_float.label("total_days"),
+        )
+        .join(project_cards, project_cards.c.list_id == ListModel.id)
+        .group_by(ListModel.id, ListModel.name, ListModel.is_final, ListModel.order)
+    )
+
+    # 2. Cards por prioridade
+    by_priority = select(
+        literal("priority"),
+        project_cards.c.priority,
+        no_str,
+        no_bool,
+        no_int,
+        func.count(project_cards.c.card_id),
+        no_float,
+    ).group_by(project_cards.c.priority)
+
+    # 3. Cards por tag
+    by_tag = (
+        select(
+            literal("tag"),
+            TagModel.id,
+            TagModel.name,
+            no_bool,
+            no_int,
+            func.count(TagCardModel.cardId),
+            no_float,
+        )
+        .join(TagCardModel, TagCardModel.tagId == TagModel.id)
+        .join(project_cards, project_cards.c.card_id == TagCardModel.cardId)
+        .group_by(TagModel.id, TagModel.name)
+    )
+
+    # 4. Lead Time: completed_at - created_at
+    lead_days = (
+        func.extract("epoch", project_cards.c.completed_at - project_cards.c.created_at)
+        / 86400
+    )
+    lead = select(
+        literal("lead"),
+        no_int,
+        no_str,
+        no_bool,
+        no_int,
+        func.count(lead_days),
+        func.sum(lead_days),
+    )
+
+    # 5. Cycle Time: completed_at - primeiro "moved"
+    cycle_days = (
+        func.extract("epoch", project_cards.c.completed_at - first_moved.c.first_moved)
+        / 86400
+    )
+    cycle = select(
+        literal("cycle"),
+        no_int,
+        no_str,
+        no_bool,
+        no_int,
+        func.count(cycle_days),
+        func.sum(cycle_days),
+    ).join(first_moved, first_moved.c.card_id == project_cards.c.card_id)
+
+    return union_all(by_list, by_priority, by_tag, lead, cycle)
+
+
+# Soma um mapa de diferenças {chave: {"count": n, ...metadados}} ao mapa da
+# coluna: chaves novas recebem os metadados da diferença e chaves que chegam
+# a zero saem do mapa
+_MERGE_COUNTS = """(
+    SELECT CAST(COALESCE(jsonb_object_agg(k, v), '{{}}') AS json) FROM (
+        SELECT
+            COALESCE(cur.key, d.key) AS k,
+            COALESCE(cur.value, d.value) || jsonb_build_object(
+                'count',
+                COALESCE(CAST(cur.value ->> 'count' AS integer), 0)
+                + COALESCE(CAST(d.value ->> 'count' AS integer), 0)
+            ) AS v
+        FROM jsonb_each(CAST({column} AS jsonb)) AS cur
+        FULL JOIN jsonb_each(CAST(:{param} AS jsonb)) AS d ON d.key = cur.key
+    ) AS merged
+    WHERE CAST(v ->> 'count' AS integer) > 0
+)"""
+
+# Mesmo para o mapa {prioridade: contagem}
+_MERGE_PRIORITY = """(
+    SELECT CAST(COALESCE(jsonb_object_agg(k, n), '{}') AS json) FROM (
+        SELECT
+            COALESCE(cur.key, d.key) AS k,
+            COALESCE(CAST(cur.value AS integer), 0) + COALESCE(CAST(d.value AS integer), 0) AS n
+        FROM jsonb_each_text(CAST("byPriority" AS jsonb)) AS cur
+        FULL JOIN jsonb_each_text(CAST(:by_priority AS jsonb)) AS d ON d.key = cur.key
+    ) AS merged
+    WHERE n > 0
+)"""
+
+# Uma única instrução: a linha é travada só pelo próprio UPDATE e as somas usam
+# sempre a versão mais recente dela (READ COMMITTED reavalia o SET)
+_APPLY_DELTAS = text(
+    f"""
+    UPDATE project_stats SET
+        "byList" = {_MERGE_COUNTS.format(column='"byList"', param="by_list")},
+        "byPriority" = {_MERGE_PRIORITY},
+        "byTag" = {_MERGE_COUNTS.format(column='"byTag"', param="by_tag")},
+        "leadTimeSum" = "leadTimeSum" + :lead_time_sum,
+        "leadTimeCount" = "leadTimeCount" + :lead_time_count,
+        "cycleTimeSum" = "cycleTimeSum" + :cycle_time_sum,
+        "cycleTimeCount" = "cycleTimeCount" + :cycle_time_count,
+        "updatedAt" = now()
+    WHERE "projectId" = :project_id
+    RETURNING "byList" AS by_list, "byTag" AS by_tag
+    """
+).columns(by_list=JSON, by_tag=JSON)
+_METRIC_DELTAS = ("lead_time_sum", "lead_time_count", "cycle_time_sum", "cycle_time_count")
+
+
+class ProjectStatsRules:
+    def __init__(self, db_session: AsyncSession):
+        self.db_session = db_session
+
+    async def get_stats(self, project_id: int) -> ProjectStatsResponse:
+        """
+        Lê as estatísticas materializadas do projeto (uma linha).
+
+        Projeto ainda não materializado é agregado na hora, sem gravar: a linha
+        é criada pelas escritas (apply_card_change e rebuild).
+        """
+        result = await self.db_session.execute(
+            select(ProjectStatsModel).where(ProjectStatsModel.project_id == project_id)
+        )
+        row = result.scalar_one_or_none()
+
+        if row is not None:
+            values = self._values_from_model(row)
+        else:
+            values = await self._aggregate(project_id)
+
+        return self._to_response(values)
+
+    async def rebuild(self, project_id: int) -> dict:
+        """
+        Recalcula as estatísticas do projeto a partir dos cards e grava a linha
+        em project_stats (upsert). Usado nas escritas de listas, nas de cards de
+        projetos ainda não materializados e para corrigir divergências
+        (app/rebuild_project_stats.py). Não faz commit.
+
+        A linha do projeto é criada (se faltar) e travada antes de ler os
+        cards: diferenças de apply_card_change já gravadas entram na agregação
+        e as seguintes esperam o fim desta transação, sem serem sobrescritas.
+        """
+        await self._lock_row(project_id)
+        values = await self._aggregate(project_id)
+
+        columns = {getattr(ProjectStatsModel, key): value for key, value in values.items()}
+        stmt = pg_insert(ProjectStatsModel).values(
+            {ProjectStatsModel.project_id: project_id, **columns}
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[ProjectStatsModel.project_id],
+            set_={**columns, ProjectStatsModel.updated_at: func.now()},
+        )
+        await self.db_session.execute(stmt)
+        return values
+
+    async def apply_card_change(
+        self,
+        project_id: int,
+        before: CardStatsEntry | None,
+        after: CardStatsEntry | None,
+    ) -> None:
+        """
+        Aplica incrementalmente a mudança de um card: remove a contribuição
+        ``before`` e soma a contribuição ``after`` (None = card inexistente).
+
+        As diferenças são somadas pelo próprio UPDATE (``x = x + :delta``, ver
+        _APPLY_DELTAS), sem ler a linha antes: escritas concorrentes no mesmo
+        projeto não se sobrescrevem. Chamar depois do flush da mudança: sem a
+        linha do projeto, ou com chave nova sem metadados (ex.: tag informada
+        só por id), a linha é reconstruída a partir dos cards. Não faz commit.
+        """
+        if before == after:
+            return
+
+        deltas, incomplete = _entry_deltas(before, after)
+        params = {
+            "project_id": project_id,
+            "by_list": json.dumps(deltas["by_list"]),
+            "by_priority": json.dumps(deltas["by_priority"]),
+            "by_tag": json.dumps(deltas["by_tag"]),
+            **{key: deltas[key] for key in _METRIC_DELTAS},
+        }
+        row = (await self.db_session.execute(_APPLY_DELTAS, params)).first()
+        # Chave sem metadados que o UPDATE criou (não existia na linha)
+        if row is None or any(
+            "name" not in getattr(row, column).get(key, {"name": None}) for column, key in incomplete
+        ):
+            await self.rebuild(project_id)
+
+    async def _lock_row(self, project_id: int) -> None:
+        empty = {
+            getattr(ProjectStatsModel, key): value
+            for key, value in self._values_from_rows([]).items()
+        }
+        await self.db_session.execute(
+            pg_insert(ProjectStatsModel)
+            .values({ProjectStatsModel.project_id: project_id, **empty})
+            .on_conflict_do_nothing(index_elements=[ProjectStatsModel.project_id])
+        )
+        await self.db_session.execute(
+            select(ProjectStatsModel.project_id)
+            .where(ProjectStatsModel.project_id == project_id)
+            .with_for_update()
+        )
+
+    async def _aggregate(self, project_id: int) -> dict:
+        rows = (await self.db_session.execute(project_stats_stmt(project_id))).all()
+        return self._values_from_rows(rows)
+
+    @staticmethod
+    def _values_from_rows(rows) -> dict:
+        values = {
+            "by_list": {},
+            "by_priority": {},
+            "by_tag": {},
+            "lead_time_sum": 0.0,
+            "lead_time_count": 0,
+            "cycle_time_sum": 0.0,
+            "cycle_time_count": 0,
+        }
+        for r in rows:
+            if r.kind == "list":
+                values["by_list"][str(r.key)] = {
+                    "name": r.label,
+                    "is_final": r.is_final,
+                    "order": r.sort_key,
+                    "count": r.cnt,
+                }
+            elif r.kind == "priority":
+                values["by_priority"][_priority_key(r.key)] = r.cnt
+            elif r.kind == "tag":
+                values["by_tag"][str(r.key)] = {"name": r.label, "count": r.cnt}
+            elif r.kind in ("lead", "cycle"):
+                values[f"{r.kind}_time_sum"] = float(r.total_days or 0)
+                values[f"{r.kind}_time_count"] = r.cnt or 0
+        return values
+
+    @staticmethod
+    def _values_from_model(row: ProjectStatsModel) -> dict:
+        return {
+            "by_list": row.by_list or {},
+            "by_priority": row.by_priority or {},
+            "by_tag": row.by_tag or {},
+            "lead_time_sum": row.lead_time_sum or 0.0,
+            "lead_time_count": row.lead_time_count or 0,
+            "cycle_time_sum": row.cycle_time_sum or 0.0,
+            "cycle_time_count": row.cycle_time_count or 0,
+        }
+
+    @staticmethod
+    def _to_response(values: dict) -> ProjectStatsResponse:
+        by_list = sorted(
+            values["by_list"].values(),
+            key=lambda b: (b["order"] is None, b["order"] or 0),
+        )
+        by_priority = sorted(
+            (int(k), cnt) for k, cnt in values["by_priority"].items() if k != "none"
+        )
+        if "none" in values["by_priority"]:
+            by_priority.append((None, values["by_priority"]["none"]))
+        by_tag = sorted(values["by_tag"].values(), key=lambda b: -b["count"])
+
+        return ProjectStatsResponse(
+            total_cards=sum(b["count"] for b in by_list),
+            by_list=[
+                ListDistribution(list_name=b["name"], is_final=b["is_final"], count=b["count"])
+                for b in by_list
+            ],
+            by_priority=[
+                PriorityDistribution(priority=p, count=cnt) for p, cnt in by_priority
+            ],
+            by_tag=[
+                TagDistribution(tag_name=b["name"], count=b["count"]) for b in by_tag
+            ],
+            lead_time_days=_avg_days(values["lead_time_sum"], values["lead_time_count"]),
+            cycle_time_days=_avg_days(values["cycle_time_sum"], values["cycle_time_count"]),
+        )
+
+
+def _entry_deltas(
+    before: CardStatsEntry | None, after: CardStatsEntry | None
+) -> tuple[dict, list[tuple[str, str]]]:
+    """
+    Diferenças entre as contribuições ``before`` e ``after`` no formato de
+    _APPLY_DELTAS, e as chaves somadas sem metadados ((coluna, chave)): se
+    ainda não existirem na linha, ela precisa ser reconstruída.
+    """
+    deltas = {"by_list": {}, "by_priority": {}, "by_tag": {}, **dict.fromkeys(_METRIC_DELTAS, 0)}
+    missing: set[tuple[str, str]] = set()
+
+    for entry, sign in ((before, -1), (after, 1)):
+        if entry is None:
+            continue
+        key = str(entry.list_id)
+        bucket = deltas["by_list"].setdefault(key, {"count": 0})
+        bucket["count"] += sign
+        if entry.list_name is not None:
+            bucket.update(name=entry.list_name, is_final=bool(entry.list_is_final), order=entry.list_order)
+        elif sign > 0:
+            missing.add(("by_list", key))
+
+        key = _priority_key(entry.priority)
+        deltas["by_priority"][key] = deltas["by_priority"].get(key, 0) + sign
+
+        for tag_id, tag_name in entry.tags.items():
+            key = str(tag_id)
+            bucket = deltas["by_tag"].setdefault(key, {"count": 0})
+            bucket["count"] += sign
+            if tag_name is not None:
+                bucket["name"] = tag_name
+            elif sign > 0:
+                missing.add(("by_tag", key))
+
+        for metric, days in (("lead", entry.lead_days), ("cycle", entry.cycle_days)):
+            if days is not None:
+                deltas[f"{metric}_time_sum"] += sign * days
+                deltas[f"{metric}_time_count"] += sign
+
+    for column in ("by_list", "by_tag"):
+        deltas[column] = {k: v for k, v in deltas[column].items() if v["count"]}
+    deltas["by_priority"] = {k: n for k, n in deltas["by_priority"].items() if n}
+    # Só interessa a chave nova (com diferença positiva) ainda sem metadados
+    incomplete = [
+        (column, key) for column, key in sorted(missing)
+        if deltas[column].get(key, {}).get("count", 0) > 0 and "name" not in deltas[column][key]
+    ]
+    return deltas, incomplete
+
+
+def _priority_key(priority: int | None) -> str:
+    return "none" if priority is None else str(priority)
+
+
+def _avg_days(total: float, count: int) -> float | None:
+    if not count:
+        return None
+    return round(total / count, 1)
@@ -0,0 +1,104 @@
+from datetime import date
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models.card_model import CardModel
+from app.db.models.list_model import ListModel
+from app.db.models.project_snapshot_model import ProjectSnapshotModel
+
+# Chave do advisory lock que garante um único worker gravando snapshots por vez
+_SNAPSHOT_LOCK_KEY = 730_001
+
+
+class SnapshotRules:
+    def __init__(self, db_session: AsyncSession):
+        self.db_session = db_session
+
+    async def take_snapshots(self, day: date) -> int:
+        """
+        Grava (upsert) a foto de ``day`` de todos os projetos com cards.
+
+        O estado de todos os projetos é agregado em uma única consulta por
+        (projeto, lista). Se outro worker já estiver gravando, não faz nada.
+        Faz commit. Retorna a quantidade de projetos gravados.
+        """
+        locked = (
+            await self.db_session.execute(
+                select(func.pg_try_advisory_xact_lock(_SNAPSHOT_LOCK_KEY))
+            )
+        ).scalar()
+        if not locked:
+            await self.db_session.rollback()
+            return 0
+
+        weight = func.coalesce(func.nullif(CardModel.story_points, 0), 1)
+        stmt = (
+            select(
+                ListModel.project_id,
+                CardModel.list_id,
+                func.count(CardModel.id).label("cards"),
+                func.count(CardModel.completed_at).label("closed"),
+                func.coalesce(func.sum(weight), 0).label("points"),
+                func.coalesce(
+                    func.sum(weight).filter(CardModel.completed_at.is_(None)), 0
+                ).label("remaining"),
+            )
+            .join(ListModel, ListModel.id == CardModel.list_id)
+            .group_by(ListModel.project_id, CardModel.list_id)
+        )
+        rows = (await self.db_session.execute(stmt)).all()
+
+        snapshots: dict[int, dict] = {}
+        for r in rows:
+            snap = snapshots.setdefault(
+                r.project_id,
+                {
+                    "project_id": r.project_id,
+                    "day": day,
+                    "remaining_points": 0,
+                    "total_points": 0,
+                    "open_cards": 0,
+                    "closed_cards": 0,
+                    "by_list": {},
+                },
+            )
+            snap["remaining_points"] += int(r.remaining)
+            snap["total_points"] += int(r.points)
+            snap["open_cards"] += r.cards - r.closed
+            snap["closed_cards"] += r.closed
+            snap["by_list"][str(r.list_id)] = r.cards
+
+        if snapshots:
+            stmt = pg_insert(ProjectSnapshotModel)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[ProjectSnapshotModel.project_id, ProjectSnapshotModel.day],
+                set_={
+                    ProjectSnapshotModel.remaining_points: stmt.excluded.remainingPoints,
+                    ProjectSnapshotModel.total_points: stmt.excluded.totalPoints,
+                    ProjectSnapshotModel.open_cards: stmt.excluded.openCards,
+                    ProjectSnapshotModel.closed_cards: stmt.excluded.closedCards,
+                    ProjectSnapshotModel.by_list: stmt.excluded.byList,
+                    ProjectSnapshotModel.created_at: func.now(),
+                },
+            )
+            await self.db_session.execute(stmt, list(snapshots.values()))
+
+        await self.db_session.commit()
+        return len(snapshots)
+
+    async def get_snapshots(
+        self, project_id: int, start: date, end: date
+    ) -> list[ProjectSnapshotModel]:
+        """Retorna as fotos do projeto no intervalo [start, end], em ordem de dia."""
+        result = await self.db_session.execute(
+            select(ProjectSnapshotModel)
+            .where(
+                ProjectSnapshotModel.project_id == project_id,
+                ProjectSnapshotModel.day >= start,
+                ProjectSnapshotModel.day <= end,
+            )
+            .order_by(ProjectSnapshotModel.day)
+        )
+        return result.scalars().all()
@@ -6,11 +6,11 @@ from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
 
-from app.core.email import send_email
 from app.core.configs import settings
 from app.core.auth import TokenService
-from app.core.security import generator_hash_password
+from app.core.security import generator_hash_password_async
 from app.db.models.user_model import UserModel
+from app.rules.email_outbox import EmailOutboxRules
 from app.schemas.user_schema import TokenData, UserSchemaCreate, UserSchemaUp
 
 
@@ -97,7 +97,7 @@ class UserRules:
             lastName=user_data.last_name,
             email=user_data.email,
             username=username,
-            password=generator_hash_password(user_data.password),
+            password=await generator_hash_password_async(user_data.password),
             isAdmin=user_data.is_admin,
         )
 
@@ -169,7 +169,7 @@ class UserRules:
         if data.email is not None:
             user.email = data.email
         if data.password is not None:
-            user.password = generator_hash_password(data.password)
+            user.password = await generator_hash_password_async(data.password)
         if data.is_admin is not None:
             user.isAdmin = data.is_admin
 
@@ -258,11 +258,12 @@ class UserRules:
 
         front_url = settings.FRONT_URL
         reset_link = f"{front_url}/login/change-password/{reset_token}"
-        send_email(
+        EmailOutboxRules(self.db_session).enqueue(
             to=email,
             subject="Password Reset",
             body=f"Click the link to reset your password: {reset_link}",
         )
+        await self.db_session.commit()
 
     async def reset_password_with_token(self, token: str, new_password: str):
         try:
@@ -277,5 +278,5 @@ class UserRules:
         if not user:
             raise HTTPException(status_code=404, detail="User not found.")
 
-        user.password = generator_hash_password(new_password)
+        user.password = await generator_hash_password_async(new_password)
         await self.db_session.commit()
@@ -73,3 +73,61 @@ class BurndownResponse(CustomBaseModel):
     end: str
     total: int
     points: list[BurndownPoint]
+
+
+class CfdListSeries(CustomBaseModel):
+    list_id: int
+    list_name: str
+    is_final: bool
+    counts: list[int]  # cards na lista no fim de cada dia (alinhado a CfdResponse.dates)
+
+
+class CfdResponse(CustomBaseModel):
+    start: str
+    end: str
+    dates: list[str]  # "YYYY-MM-DD"
+    lists: list[CfdListSeries]
+
+
+class HistogramBucket(CustomBaseModel):
+    lower: float  # dias (inclusivo)
+    upper: float  # dias (exclusivo, exceto no último bucket)
+    count: int
+
+
+class DurationDistribution(CustomBaseModel):
+    count: int
+    p50: Optional[float] = None
+    p85: Optional[float] = None
+    p95: Optional[float] = None
+    histogram: list[HistogramBucket]
+
+
+class TimeDistributionResponse(CustomBaseModel):
+    start: str
+    end: str
+    lead_time: DurationDistribution   # completed_at - created_at
+    cycle_time: DurationDistribution  # completed_at - primeiro "moved"
+
+
+class ThroughputWeek(CustomBaseModel):
+    week: str          # semana ISO, "YYYY-Www"
+    week_start: str    # segunda-feira da semana, "YYYY-MM-DD"
+    cards: int         # cards concluídos na semana
+    story_points: int  # soma dos story points concluídos na semana
+
+
+class ThroughputResponse(CustomBaseModel):
+    weeks: list[ThroughputWeek]
+    avg_cards: float
+    avg_story_points: float  # velocity média no período
+
+
+class ForecastResponse(CustomBaseModel):
+    remaining_cards: int            # cards a concluir (backlog fora da lista final)
+    trials: int                     # simulações Monte Carlo executadas
+    history_days: int               # dias de histórico de throughput amostrados
+    avg_daily_throughput: float
+    p50: Optional[str] = None       # data "YYYY-MM-DD" com 50% de chance de conclusão
+    p85: Optional[str] = None
+    p95: Optional[str] = None
@@ -0,0 +1,41 @@
+from typing import Optional
+
+from app.schemas.base import CustomBaseModel
+
+
+class HealthResponse(CustomBaseModel):
+    status: str
+    uptime_seconds: float
+
+
+class DependencyCheck(CustomBaseModel):
+    ok: bool
+    ms: Optional[float] = None
+    error: Optional[str] = None
+
+
+class PoolCheck(CustomBaseModel):
+    ok: bool
+    checked_out: int
+    capacity: int
+    usage: float
+
+
+class OutboxCheck(DependencyCheck):
+    pending: Optional[int] = None
+
+
+class HashPoolCheck(CustomBaseModel):
+    queued: int
+    running: int
+    workers: int
+
+
+class ReadinessResponse(CustomBaseModel):
+    status: str  # "ready" ou "not_ready"
+    warmed_up: bool
+    database: DependencyCheck
+    pool: PoolCheck
+    email_outbox: OutboxCheck
+    password_hashing: HashPoolCheck
+    ms: float
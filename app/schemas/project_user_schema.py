@@ -27,3 +27,7 @@ class ProjectMemberSearchItem(CustomBaseModel):
 
 class UpdateMemberRoleRequest(CustomBaseModel):
     role: str
+
+
+class UpdateProjectUsersResponse(CustomBaseModel):
+    detail: str
@@ -0,0 +1,118 @@
+"""
+Serializadores pré-compilados das rotas de leitura mais usadas.
+
+``row_mapper(Schema)`` percorre os campos do schema uma única vez e devolve
+uma função que converte um objeto ORM direto no dict JSON do schema (chaves
+camelCase, relacionamentos aninhados), sem a validação campo a campo do
+``from_attributes``. O resultado é o mesmo de
+``Schema.model_validate(obj).model_dump(mode="json", by_alias=True)``
+(ver test_serializers.py), e ``json_response`` grava esse dict em bytes com
+o núcleo Rust do pydantic. ``construct`` faz o mesmo para quem precisa de uma
+instância do schema (o FastAPI não revalida instâncias do response_model).
+
+Use apenas com dados vindos do banco: nada é validado ou convertido.
+"""
+import types
+import typing
+from functools import cache
+from typing import Any, Callable
+
+from fastapi import Response
+from pydantic import BaseModel
+from pydantic_core import PydanticUndefined, to_json
+
+from app.schemas.card_schema import CardSchema
+from app.schemas.list_schema import ListSchemaSlim
+
+RowMapper = Callable[[Any], dict]
+
+_MISSING = object()
+
+
+def _nested_model(annotation) -> tuple[type[BaseModel] | None, bool]:
+    """Retorna (schema aninhado, é lista) de uma anotação, ou (None, False)."""
+    origin = typing.get_origin(annotation)
+    if origin in (typing.Union, types.UnionType):
+        args = [a for a in typing.get_args(annotation) if a is not type(None)]
+        return _nested_model(args[0]) if len(args) == 1 else (None, False)
+    if origin is list:
+        model, _ = _nested_model(typing.get_args(annotation)[0])
+        return model, model is not None
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation, False
+    return None, False
+
+
+@cache
+def row_mapper(schema: type[BaseModel]) -> RowMapper:
+    """Compila o mapeador objeto -> dict JSON de ``schema`` (com cache por schema)."""
+    fields = []
+    for name, field in schema.model_fields.items():
+        model, many = _nested_model(field.annotation)
+        default = field.get_default(call_default_factory=True)
+        alias = field.alias or name
+        fields.append((
+            field.serialization_alias or alias,
+            alias,
+            name,
+            None if default is PydanticUndefined else default,
+            row_mapper(model) if model is not None else None,
+            many,
+        ))
+
+    plans: dict[type, list] = {}
+
+    def plan_for(cls: type) -> list:
+        # Mesma ordem do from_attributes: primeiro o alias (camelCase, ex.:
+        # UserModel.firstName), depois o nome do campo. Resolvido uma vez por classe.
+        plan = []
+        for key, alias, name, default, nested, many in fields:
+            attr = alias if hasattr(cls, alias) else name if hasattr(cls, name) else None
+            plan.append((key, attr, alias, name, default, nested, many))
+        plans[cls] = plan
+        return plan
+
+    def map_row(obj) -> dict:
+        out = {}
+        plan = plans.get(type(obj)) or plan_for(type(obj))
+        for key, attr, alias, name, default, nested, many in plan:
+            if attr is not None:
+                value = getattr(obj, attr)
+            else:
+                # Atributo só da instância (ou ausente): resolve a cada objeto
+                value = getattr(obj, alias, _MISSING)
+                if value is _MISSING:
+                    value = getattr(obj, name, default)
+            if nested is not None and value is not None:
+                value = [nested(v) for v in value] if many else nested(value)
+            out[key] = value
+        return out
+
+    map_row.__name__ = f"map_{schema.__name__}"
+    return map_row
+
+
+card_to_json = row_mapper(CardSchema)
+list_slim_to_json = row_mapper(ListSchemaSlim)
+
+
+def construct(schema: type[BaseModel], obj) -> BaseModel | None:
+    """Instância de ``schema`` com os atributos de ``obj``, sem validação (schemas planos)."""
+    if obj is None:
+        return None
+    return schema.model_construct(**row_mapper(schema)(obj))
+
+
+def card_page_to_json(page: dict) -> dict:
+    """Página de cards de ListRules.get_cards_for_list_paginated no formato CardPageResponse."""
+    return {
+        "cards": [card_to_json(card) for card in page["cards"]],
+        "total": page["total"],
+        "page": page["page"],
+        "hasMore": page["has_more"],
+    }
+
+
+def json_response(content: Any, status_code: int = 200) -> Response:
+    """Resposta JSON a partir de dicts já serializados (sem jsonable_encoder)."""
+    return Response(to_json(content), status_code=status_code, media_type="application/json")
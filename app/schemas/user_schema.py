@@ -68,3 +68,7 @@ class ForgotPasswordRequest(CustomBaseModel):
 class ResetPasswordRequest(CustomBaseModel):
     token: str
     new_password: str
+
+
+class MessageResponse(CustomBaseModel):
+    message: str
@@ -0,0 +1,375 @@
+"""
+Gera um volume grande de dados sintéticos para reproduzir a performance em escala.
+
+Usuários, projetos, membros, listas, tags, cards (1M por padrão), tags dos
+cards, comentários, aprovadores, tarefas, histórico de movimentação e
+dependências, com distribuições assimétricas como as de produção: poucos
+projetos concentram a maior parte dos cards, poucos membros recebem a maior
+parte das atribuições e as quantidades por card (comentários, tarefas) têm
+cauda longa. Cards antigos tendem a estar concluídos e o histórico percorre
+as listas até a atual, então lead/cycle time, CFD e burndown ficam realistas.
+
+Os dados são acrescentados ao banco (ids a partir do maior existente) via
+COPY (asyncpg copy_records_to_table), em lotes de ``--batch-size`` cards. O
+mesmo ``--seed`` com a mesma data de referência (``--now``, padrão: hoje)
+gera sempre os mesmos dados. Ao final, as sequências de id são ajustadas, as
+tabelas analisadas e project_stats reconstruída. Requer as roles e
+categorias do generate_table.py. Todos os usuários têm a senha ``--password``.
+
+Uso (a partir do diretório Back-end/):
+    python -m app.generate_table                                   # esquema limpo
+    python -m app.seed_large_dataset                               # 1M cards
+    python -m app.seed_large_dataset --cards 50000 --projects 20 --seed 7
+"""
+import argparse
+import asyncio
+import math
+import random
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, time as dt_time, timedelta
+from typing import Iterator
+
+from sqlalchemy import text
+
+import app.db.models.__all_models  # noqa: F401
+from app import rebuild_project_stats
+from app.core.security import generator_hash_password
+from app.db.conection import engine
+from app.generate_table import _guard_against_production
+
+# Tabelas na ordem de carga (pais antes dos filhos) e colunas de cada COPY
+TABLES: dict[str, tuple[str, ...]] = {
+    "users": ("id", "firstName", "lastName", "email", "username", "password", "isAdmin"),
+    "projects": ("id", "title", "description", "createdAt", "updatedAt", "creatorId"),
+    "projectUsers": ("id", "projectId", "userId", "roleId"),
+    "lists": ("id", "name", "order", "isFinal", "projectId"),
+    "tags": ("id", "name", "projectId"),
+    "cards": (
+        "id", "cardNumber", "title", "createdAt", "updatedAt", "listId", "userId",
+        "date", "startDate", "endDate", "completedAt", "priority", "description",
+        "plannedHours", "completedHours", "storyPoints", "blocked", "sortOrder", "categoryId",
+    ),
+    "tagCards": ("id", "cardId", "tagId"),
+    "comments": ("id", "description", "createdAt", "updatedAt", "userId", "cardId"),
+    "approvers": ("id", "environment", "userId", "cardId"),
+    "tasksCard": ("id", "title", "date", "completed", "userId", "cardId"),
+    "card_history": (
+        "id", "cardId", "userId", "action", "oldValue", "newValue",
+        "oldListId", "newListId", "createdAt",
+    ),
+    "card_dependencies": ("id", "cardId", "relatedCardId", "createdAt"),
+}
+
+LIST_NAMES = ("Backlog", "To Do", "Doing", "Review", "Done")
+# Peso de cada lista não final para cards em aberto
+OPEN_LIST_WEIGHTS = (4, 3, 2, 1)
+TAG_NAMES = (
+    "backend", "frontend", "api", "database", "infra", "ux", "mobile", "security",
+    "performance", "docs", "tests", "billing", "auth", "reports", "search", "cache",
+)
+TITLE_VERBS = ("Corrigir", "Implementar", "Refatorar", "Revisar", "Documentar", "Testar", "Otimizar")
+TITLE_NOUNS = (
+    "login", "dashboard", "exportação", "filtro de cards", "notificações", "relatório",
+    "pagamento", "busca", "permissões", "upload", "integração", "cache",
+)
+ENVIRONMENTS = ("dev", "staging", "prod")
+STORY_POINTS = (1, 2, 3, 5, 8, 13)
+
+
+@dataclass
+class SeedPlan:
+    users: int = 2_000
+    projects: int = 200
+    cards: int = 1_000_000
+    tags_per_project: int = 8
+    comments_per_card: float = 1.5
+    tasks_per_card: float = 1.0
+    approver_rate: float = 0.2
+    tag_rate: float = 0.7
+    dependency_rate: float = 0.05
+    days: int = 730
+    seed: int = 42
+    batch_size: int = 50_000
+
+
+def zipf_weights(n: int, s: float = 1.1) -> list[float]:
+    """Pesos 1/rank^s normalizados: o primeiro item recebe a maior fatia."""
+    raw = [1 / (rank ** s) for rank in range(1, n + 1)]
+    total = sum(raw)
+    return [w / total for w in raw]
+
+
+def split_total(total: int, weights: list[float]) -> list[int]:
+    """Divide ``total`` proporcionalmente aos pesos (maiores restos), somando exatamente ``total``."""
+    shares = [total * w for w in weights]
+    counts = [math.floor(s) for s in shares]
+    by_remainder = sorted(range(len(weights)), key=lambda i: shares[i] - counts[i], reverse=True)
+    for i in by_remainder[: total - sum(counts)]:
+        counts[i] += 1
+    return counts
+
+
+def _long_tail(rnd: random.Random, mean: float, cap: int = 50) -> int:
+    """Quantidade com média ~``mean`` e cauda longa (exponencial truncada)."""
+    if mean <= 0:
+        return 0
+    return min(int(rnd.expovariate(1 / (mean + 0.5))), cap)
+
+
+class _Ids:
+    """Próximo id de cada tabela, a partir do maior id já existente no banco."""
+
+    def __init__(self, start: dict[str, int]):
+        self._next = {table: start.get(table, 0) + 1 for table in TABLES}
+
+    def __call__(self, table: str) -> int:
+        value = self._next[table]
+        self._next[table] += 1
+        return value
+
+
+def generate(
+    plan: SeedPlan,
+    start_ids: dict[str, int],
+    role_ids: dict[str, int],
+    category_ids: list[int],
+    password_hash: str,
+    now: datetime,
+) -> Iterator[dict[str, list[tuple]]]:
+    """
+    Gera as linhas de cada tabela (tuplas na ordem de TABLES) em lotes de
+    ~``plan.batch_size`` cards. Determinístico para o mesmo plano e ``now``.
+    """
+    rnd = random.Random(plan.seed)
+    next_id = _Ids(start_ids)
+    rows: dict[str, list[tuple]] = {table: [] for table in TABLES}
+    window = timedelta(days=plan.days)
+
+    user_ids = []
+    for _ in range(plan.users):
+        uid = next_id("users")
+        user_ids.append(uid)
+        rows["users"].append((
+            uid, rnd.choice(("Ana", "Bruno", "Carla", "Diego", "Elisa", "Felipe", "Gabi", "Hugo")),
+            f"Seed {uid}", f"seed{uid}@example.com", f"seed{uid}", password_hash, False,
+        ))
+    user_weights = zipf_weights(len(user_ids), s=0.8)
+
+    cards_per_project = split_total(plan.cards, zipf_weights(plan.projects))
+    for project_cards in cards_per_project:
+        project_id = next_id("projects")
+        created = now - window - timedelta(days=rnd.randint(1, 60))
+        creator = rnd.choices(user_ids, user_weights)[0]
+        rows["projects"].append((
+            project_id, f"Projeto {project_id}", "Projeto gerado por seed_large_dataset",
+            created, None, creator,
+        ))
+
+        # Membros: projetos maiores têm mais gente; o criador é SuperAdmin
+        size = min(len(user_ids), 3 + int(math.sqrt(project_cards) / 4))
+        members = [creator] + [u for u in rnd.sample(user_ids, size) if u != creator][: size - 1]
+        for i, uid in enumerate(members):
+            role = "SuperAdmin" if i == 0 else "Admin" if i == 1 else "Leader" if i < 4 else "User"
+            rows["projectUsers"].append((next_id("projectUsers"), project_id, uid, role_ids[role]))
+        member_weights = zipf_weights(len(members))
+
+        list_ids = []
+        for order, name in enumerate(LIST_NAMES):
+            list_id = next_id("lists")
+            list_ids.append(list_id)
+            rows["lists"].append((list_id, name, order, name == LIST_NAMES[-1], project_id))
+        sort_orders = [0] * len(list_ids)
+
+        tag_ids = []
+        for name in rnd.sample(TAG_NAMES, min(plan.tags_per_project, len(TAG_NAMES))):
+            tag_id = next_id("tags")
+            tag_ids.append(tag_id)
+            rows["tags"].append((tag_id, name, project_id))
+        tag_weights = zipf_weights(len(tag_ids)) if tag_ids else []
+
+        first_card = None
+        for number in range(1, project_cards + 1):
+            card_id = next_id("cards")
+            first_card = first_card or card_id
+            _card_rows(
+                rows, rnd, next_id, plan, now, window, card_id, number, members,
+                member_weights, list_ids, sort_orders, tag_ids, tag_weights, category_ids,
+                first_card,
+            )
+            if len(rows["cards"]) >= plan.batch_size:
+                yield rows
+                rows = {table: [] for table in TABLES}
+
+    if any(rows.values()):
+        yield rows
+
+
+def _card_rows(
+    rows, rnd, next_id, plan, now, window, card_id, number, members, member_weights,
+    list_ids, sort_orders, tag_ids, tag_weights, category_ids, first_card,
+) -> None:
+    # Mais cards recentes que antigos; os antigos tendem a estar concluídos
+    age = window * (rnd.random() ** 1.5)
+    created = now - age
+    done = rnd.random() < 0.15 + 0.75 * (age / window)
+    if done:
+        position = len(list_ids) - 1
+        lead = timedelta(days=rnd.lognormvariate(1.5, 0.9))
+        completed = min(created + lead, now)
+    else:
+        position = rnd.choices(range(len(list_ids) - 1), OPEN_LIST_WEIGHTS)[0]
+        completed = None
+    list_id = list_ids[position]
+    sort_orders[position] += 1
+    assignee = rnd.choices(members, member_weights)[0] if rnd.random() < 0.85 else None
+    actor = assignee or members[0]
+    due = created + timedelta(days=rnd.randint(1, 30)) if rnd.random() < 0.6 else None
+    points = rnd.choice(STORY_POINTS) if rnd.random() < 0.8 else None
+    planned = rnd.randint(1, 40) if rnd.random() < 0.3 else None
+
+    rows["cards"].append((
+        card_id, number,
+        f"{rnd.choice(TITLE_VERBS)} {rnd.choice(TITLE_NOUNS)} #{number}",
+        created, completed or created + (now - created) * rnd.random(),
+        list_id, assignee, due, None, None, completed,
+        rnd.choice((None, 1, 2, 3, 4, 5)),
+        "Descrição gerada para testes de carga. " * rnd.randint(0, 4) or None,
+        planned, rnd.randint(0, planned) if planned and done else None,
+        points, not done and rnd.random() < 0.03, sort_orders[position],
+        rnd.choice(category_ids) if category_ids and rnd.random() < 0.7 else None,
+    ))
+
+    # Histórico: criação e um "moved" por lista até a atual
+    end = completed or now
+    rows["card_history"].append((
+        next_id("card_history"), card_id, actor, "created", None, rows["cards"][-1][2],
+        None, None, created,
+    ))
+    moments = sorted(created + (end - created) * rnd.random() for _ in range(position))
+    for step, moment in enumerate(moments):
+        rows["card_history"].append((
+            next_id("card_history"), card_id, actor, "moved",
+            LIST_NAMES[step], LIST_NAMES[step + 1], list_ids[step], list_ids[step + 1], moment,
+        ))
+
+    if tag_ids and rnd.random() < plan.tag_rate:
+        chosen = {rnd.choices(tag_ids, tag_weights)[0] for _ in range(rnd.randint(1, 3))}
+        for tag_id in sorted(chosen):
+            rows["tagCards"].append((next_id("tagCards"), card_id, tag_id))
+
+    for _ in range(_long_tail(rnd, plan.comments_per_card)):
+        at = created + (now - created) * rnd.random()
+        rows["comments"].append((
+            next_id("comments"), "Comentário gerado para testes de carga.", at, None,
+            rnd.choices(members, member_weights)[0], card_id,
+        ))
+
+    if rnd.random() < plan.approver_rate:
+        rows["approvers"].append((
+            next_id("approvers"), rnd.choice(ENVIRONMENTS), rnd.choice(members), card_id,
+        ))
+
+    for i in range(_long_tail(rnd, plan.tasks_per_card, cap=20)):
+        rows["tasksCard"].append((
+            next_id("tasksCard"), f"Tarefa {i + 1}",
+            (created + timedelta(days=i + 1)).strftime("%Y-%m-%d"),
+            done or rnd.random() < 0.4, assignee, card_id,
+        ))
+
+    # Dependência com um card anterior do mesmo projeto (no máximo uma por card)
+    if card_id > first_card and rnd.random() < plan.dependency_rate:
+        rows["card_dependencies"].append((
+            next_id("card_dependencies"), card_id, rnd.randint(first_card, card_id - 1), created,
+        ))
+
+
+async def _max_ids() -> dict[str, int]:
+    async with engine.connect() as conn:
+        return {
+            table: (await conn.execute(text(f'SELECT coalesce(max(id), 0) FROM "{table}"'))).scalar()
+            for table in TABLES
+        }
+
+
+async def _lookup(sql: str) -> list:
+    async with engine.connect() as conn:
+        return (await conn.execute(text(sql))).all()
+
+
+async def _copy(batch: dict[str, list[tuple]]) -> None:
+    """Um lote inteiro via COPY, em uma transação."""
+    async with engine.connect() as conn:
+        raw = (await conn.get_raw_connection()).driver_connection
+        async with raw.transaction():
+            for table, columns in TABLES.items():
+                if batch[table]:
+                    await raw.copy_records_to_table(table, records=batch[table], columns=columns)
+
+
+async def _finish() -> None:
+    async with engine.begin() as conn:
+        for table in TABLES:
+            await conn.execute(text(
+                f"SELECT setval(pg_get_serial_sequence('\"{table}\"', 'id'), "
+                f'(SELECT max(id) FROM "{table}"))'
+            ))
+    # ANALYZE fora de transação: estatísticas prontas para o planner
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        for table in TABLES:
+            await conn.execute(text(f'ANALYZE "{table}"'))
+
+
+async def seed(plan: SeedPlan, password: str, now: datetime) -> None:
+    roles = dict(await _lookup("SELECT name, id FROM roles"))
+    missing = {"SuperAdmin", "Admin", "Leader", "User"} - roles.keys()
+    if missing:
+        raise RuntimeError(f"Roles ausentes ({', '.join(sorted(missing))}): rode app.generate_table antes.")
+    categories = [row.id for row in await _lookup("SELECT id FROM categories ORDER BY id")]
+
+    started = time.perf_counter()
+    loaded = 0
+    batches = generate(
+        plan, await _max_ids(), roles, categories, generator_hash_password(password), now
+    )
+    for batch in batches:
+        await _copy(batch)
+        loaded += len(batch["cards"])
+        rate = loaded / (time.perf_counter() - started)
+        print(f"{loaded:>10,} / {plan.cards:,} cards ({rate:,.0f} cards/s)")
+
+    print("Ajustando sequências e analisando tabelas...")
+    await _finish()
+    print("Reconstruindo project_stats...")
+    await rebuild_project_stats.run()
+    print(f"Concluído em {time.perf_counter() - started:.0f}s.")
+
+
+if __name__ == "__main__":
+    defaults = SeedPlan()
+    parser = argparse.ArgumentParser(description="Seed a large synthetic dataset (COPY).")
+    parser.add_argument("--users", type=int, default=defaults.users)
+    parser.add_argument("--projects", type=int, default=defaults.projects)
+    parser.add_argument("--cards", type=int, default=defaults.cards)
+    parser.add_argument("--tags-per-project", type=int, default=defaults.tags_per_project)
+    parser.add_argument("--comments-per-card", type=float, default=defaults.comments_per_card)
+    parser.add_argument("--tasks-per-card", type=float, default=defaults.tasks_per_card)
+    parser.add_argument("--approver-rate", type=float, default=defaults.approver_rate)
+    parser.add_argument("--tag-rate", type=float, default=defaults.tag_rate)
+    parser.add_argument("--dependency-rate", type=float, default=defaults.dependency_rate)
+    parser.add_argument("--days", type=int, default=defaults.days, help="History window")
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument("--batch-size", type=int, default=defaults.batch_size)
+    parser.add_argument("--password", default="seed1234", help="Password of every seeded user")
+    parser.add_argument(
+        "--now", type=date.fromisoformat, default=datetime.utcnow().date(),
+        help="Reference date (YYYY-MM-DD) the history ends at",
+    )
+    args = parser.parse_args()
+
+    _guard_against_production()
+    options = vars(args)
+    password = options.pop("password")
+    now = datetime.combine(options.pop("now"), dt_time.min)
+    asyncio.run(seed(SeedPlan(**options), password, now))
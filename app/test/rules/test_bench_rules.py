@@ -0,0 +1,83 @@
+"""Tests for benchmarks/bench_rules.py — cases run offline, baseline comparison."""
+import argparse
+import json
+
+from benchmarks.bench_rules import (
+    _FakeSession,
+    _environment,
+    build_update_card,
+    compare,
+    format_report,
+    main,
+    offline_cases,
+    run_cases,
+    update_payload,
+)
+from app.rules.card import CardRules
+
+
+async def test_offline_cases_run_without_a_database():
+    cases = offline_cases(cards=20, burndown_cards=200, updates=2, tasks=8, tokens=3)
+
+    results = await run_cases(cases, rounds=2)
+
+    assert [name.split("[")[0] for name in results] == [
+        "burndown", "dashboard_card", "update_card", "card_schema_list", "jwt",
+    ]
+    for stats in results.values():
+        assert stats["rounds"] == 2
+        assert 0 < stats["min"] <= stats["median"]
+
+
+async def test_update_payload_exercises_every_diff_branch():
+    card = build_update_card(tasks=8, approvers=2)
+    payload = update_payload(card)
+    kept = {t.id for t in payload.tasks_card if t.id}
+
+    await CardRules(_FakeSession(card)).update_card(card.id, payload, user_id=1)
+
+    assert card.title == "Título (editado)"
+    assert len(kept) == 6  # two existing tasks are dropped
+    assert sum(1 for t in payload.tasks_card if t.id is None) == 5
+    assert {a.environment for a in card.approvers} == {"produção"}
+
+
+def test_compare_flags_only_cases_above_threshold():
+    baseline = {"cases": {"a": {"min": 10.0, "median": 12.0}, "b": {"min": 10.0, "median": 12.0}}}
+    results = {
+        "a": {"rounds": 5, "min": 12.5, "median": 13.0, "mean": 13.0, "stddev": 0.1},
+        "b": {"rounds": 5, "min": 11.0, "median": 20.0, "mean": 20.0, "stddev": 0.1},
+        "new": {"rounds": 5, "min": 1.0, "median": 1.0, "mean": 1.0, "stddev": 0.0},
+    }
+
+    assert compare(results, baseline, threshold=0.2) == ["a"]
+    assert compare(results, baseline, threshold=0.2, stat="median") == ["b"]
+    report = format_report(results, baseline, ["a"])
+    assert "+25%" in report and "REGRESSÃO" in report
+
+
+def _args(baseline, save=False):
+    return argparse.Namespace(
+        cards=5, burndown_cards=20, updates=1, tasks=2, tokens=1, db=False, rounds=1,
+        baseline=str(baseline), threshold=0.2, stat="min", save=save,
+    )
+
+
+async def test_baseline_from_another_environment_is_not_compared(tmp_path):
+    baseline = tmp_path / "bench_rules.json"
+    slow = {"min": 1e-9, "median": 1e-9}  # every case would be a regression
+    other = {**_environment(), "mode": "db"}
+    baseline.write_text(json.dumps({"environment": other, "cases": {"jwt[1]": slow}}))
+
+    assert await main(_args(baseline)) == 0
+
+    baseline.write_text(json.dumps({"environment": _environment(), "cases": {"jwt[1]": slow}}))
+    assert await main(_args(baseline)) == 1
+
+
+async def test_save_records_the_mode(tmp_path):
+    baseline = tmp_path / "bench_rules.json"
+
+    assert await main(_args(baseline, save=True)) == 0
+
+    assert json.loads(baseline.read_text())["environment"]["mode"] == "offline"
@@ -1,10 +1,14 @@
 """Tests for app/rules/card.py — CardRules."""
+from datetime import datetime
+from types import SimpleNamespace
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 from fastapi import HTTPException
 from sqlalchemy.exc import NoResultFound
 
 from rules.card import CardRules
+from rules.project_stats import ProjectStatsRules, _entry_deltas
 from schemas.card_schema import CardSchemaBase, CardSchemaUp, CardReorderItem
 from app.test.rules.conftest import make_session, make_result
 
@@ -25,12 +29,21 @@ def _make_card(card_id=1, title="Task", list_id=10, card_number=1):
     return c
 
 
+def _agg_row(kind, key=None, label=None, is_final=None, sort_key=None, cnt=0, total_days=None):
+    # One row of project_stats_stmt
+    return SimpleNamespace(
+        kind=kind, key=key, label=label, is_final=is_final, sort_key=sort_key,
+        cnt=cnt, total_days=total_days,
+    )
+
+
 def _make_list_obj(list_id=10, project_id=1, name="To Do", is_final=False):
     lst = MagicMock()
     lst.id = list_id
     lst.project_id = project_id
     lst.name = name
     lst.is_final = is_final
+    lst.order = 0
     return lst
 
 
@@ -95,8 +108,9 @@ async def test_add_card_success():
     count_result.scalar_one.return_value = 5
 
     session.execute = AsyncMock(side_effect=[
-        make_result(scalar=lst),  # list query
-        count_result,             # count cards
+        make_result(scalar=lst),   # list query
+        count_result,              # count cards
+        MagicMock(),               # project_stats delta UPDATE
     ])
 
     rules = CardRules(session)
@@ -159,7 +173,11 @@ async def test_delete_card_success():
     card = _make_card()
     perm_result = make_result(scalar="SuperAdmin")
     card_result = make_result(scalar=card)
-    session.execute = AsyncMock(side_effect=[perm_result, card_result])
+    project_result = make_result(scalar=1)
+    stats_result = MagicMock()  # project_stats delta UPDATE
+    session.execute = AsyncMock(
+        side_effect=[perm_result, card_result, project_result, stats_result]
+    )
 
     rules = CardRules(session)
     await rules.delete_card(card_id=1, user_id=1)
@@ -329,10 +347,109 @@ async def test_update_card_move_to_final_list():
     old_list_result = make_result(scalar=old_list)
     new_list_result = make_result(scalar=new_list)
 
-    session.execute = AsyncMock(side_effect=[card_result, old_list_result, new_list_result])
+    first_moved_result = MagicMock()
+    first_moved_result.scalar.return_value = None
+    stats_result = MagicMock()  # project_stats delta UPDATE
+
+    session.execute = AsyncMock(side_effect=[
+        card_result, old_list_result, new_list_result, first_moved_result, stats_result,
+    ])
 
     rules = CardRules(session)
     data = CardSchemaUp(list_id=2)
     await rules.update_card(card_id=1, data=data, user_id=1)
 
     assert card.completed_at is not None
+
+
+def _apply_deltas(values, deltas):
+    """Python mirror of the delta UPDATE in rules/project_stats.py (_APPLY_DELTAS)."""
+    merged = {}
+    for column in ("by_list", "by_tag"):
+        merged[column] = {}
+        for key in values[column].keys() | deltas[column].keys():
+            current = values[column].get(key)
+            delta = deltas[column].get(key, {"count": 0})
+            count = (current or {}).get("count", 0) + delta["count"]
+            if count > 0:
+                merged[column][key] = {**(current or delta), "count": count}
+    merged["by_priority"] = {
+        key: n
+        for key in values["by_priority"].keys() | deltas["by_priority"].keys()
+        if (n := values["by_priority"].get(key, 0) + deltas["by_priority"].get(key, 0)) > 0
+    }
+    for metric in ("lead_time_sum", "lead_time_count", "cycle_time_sum", "cycle_time_count"):
+        merged[metric] = values[metric] + deltas[metric]
+    return merged
+
+
+def _history_session(*results):
+    """
+    Session whose card_history is an in-memory list: events added to the
+    session get an id and createdAt on flush, and first-"moved" queries are
+    answered from that list. Other statements get ``results`` in order.
+    """
+    session = make_session()
+    history = []
+    queue = list(results)
+
+    def add(obj):
+        if type(obj).__name__ == "CardHistoryModel":
+            history.append(obj)
+
+    async def flush():
+        for n, event in enumerate(history, start=500):
+            event.id = event.id or n
+            event.created_at = event.created_at or datetime.utcnow()
+
+    async def execute(stmt, *args):
+        if "card_history" not in str(stmt):
+            return queue.pop(0)
+        params = stmt.compile().params
+        moved = [
+            e.created_at for e in history
+            if e.action == "moved" and e.card_id == params["cardId_1"] and e.id != params.get("id_1")
+        ]
+        result = MagicMock()
+        result.scalar.return_value = min(moved) if moved else None
+        return result
+
+    session.add = MagicMock(side_effect=add)
+    session.flush = AsyncMock(side_effect=flush)
+    session.execute = AsyncMock(side_effect=execute)
+    return session
+
+
+async def test_update_card_stats_match_aggregate_after_moving_out_of_final_list():
+    # Card created straight in the final list: completed, never moved
+    card = _make_card(list_id=2)
+    card.created_at = datetime(2026, 1, 1)
+    card.completed_at = datetime(2026, 1, 3)
+    done = _make_list_obj(list_id=2, name="Done", is_final=True)
+    todo = _make_list_obj(list_id=1, name="To Do", is_final=False)
+    session = _history_session(
+        make_result(scalar=card), make_result(scalar=done), make_result(scalar=todo)
+    )
+    rules = CardRules(session)
+    rules.stats_rules.apply_card_change = AsyncMock()
+
+    await rules.update_card(card_id=1, data=CardSchemaUp(list_id=1), user_id=1)
+
+    # What project_stats_stmt returns before and after: cycle time only
+    # counts cards with a "moved" event, lead time only completed cards
+    stmt_before = ProjectStatsRules._values_from_rows([
+        _agg_row("list", key=2, label="Done", is_final=True, sort_key=1, cnt=1),
+        _agg_row("priority", cnt=1),
+        _agg_row("lead", cnt=1, total_days=2.0),
+        _agg_row("cycle", cnt=0),
+    ])
+    stmt_after = ProjectStatsRules._values_from_rows([
+        _agg_row("list", key=1, label="To Do", is_final=False, sort_key=0, cnt=1),
+        _agg_row("priority", cnt=1),
+        _agg_row("lead", cnt=0),
+        _agg_row("cycle", cnt=0),
+    ])
+    _, before, after = rules.stats_rules.apply_card_change.await_args.args
+    assert before.cycle_days is None
+    deltas, _ = _entry_deltas(before, after)
+    assert _apply_deltas(stmt_before, deltas) == stmt_after
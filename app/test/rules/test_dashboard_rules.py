@@ -0,0 +1,544 @@
+"""Tests for app/rules/dashboard.py — DashboardRules."""
+import random
+
+import numpy as np
+from datetime import date, datetime, time, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import rules.dashboard as dashboard
+from rules.dashboard import (
+    DashboardRules,
+    _cfd_series,
+    _forecast_plan,
+    _remaining_series,
+    _simulate_completion_days,
+    invalidate_throughput,
+)
+from app.test.rules.conftest import make_session, make_result
+
+
+def _stats_row():
+    row = MagicMock()
+    row.by_list = {
+        "1": {"name": "To Do", "is_final": False, "order": 0, "count": 6},
+        "3": {"name": "Done", "is_final": True, "order": 2, "count": 4},
+    }
+    row.by_priority = {"none": 2, "1": 3}
+    row.by_tag = {"7": {"name": "backend", "count": 1}}
+    row.lead_time_sum = 10.0
+    row.lead_time_count = 4
+    row.cycle_time_sum = 0.0
+    row.cycle_time_count = 0
+    return row
+
+
+def _rows_result(rows):
+    r = MagicMock()
+    r.all.return_value = rows
+    return r
+
+
+# ── get_project_stats ─────────────────────────────────────────────────────────
+
+async def test_get_project_stats_reads_materialized_row():
+    session = make_session()
+    session.execute.return_value = make_result(scalar=_stats_row())
+    rules = DashboardRules(session)
+
+    stats = await rules.get_project_stats(project_id=1)
+
+    assert session.execute.await_count == 1
+    session.commit.assert_not_called()
+    assert stats.total_cards == 10
+    assert [d.list_name for d in stats.by_list] == ["To Do", "Done"]
+    assert [d.priority for d in stats.by_priority] == [1, None]
+    assert stats.lead_time_days == 2.5
+    assert stats.cycle_time_days is None
+
+
+async def test_get_project_stats_aggregates_missing_row_without_writing():
+    session = make_session()
+    session.execute = AsyncMock(side_effect=[
+        make_result(scalar=None),  # project_stats row
+        _rows_result([]),          # aggregate statement
+    ])
+    rules = DashboardRules(session)
+
+    stats = await rules.get_project_stats(project_id=1)
+
+    assert stats.total_cards == 0
+    assert stats.by_list == []
+    # The row is created by writes, never by a GET
+    assert session.execute.await_count == 2
+    session.commit.assert_not_called()
+
+
+# ── get_burndown ──────────────────────────────────────────────────────────────
+
+def _card(created, completed=None, points=None):
+    return SimpleNamespace(created_at=created, completed_at=completed, story_points=points)
+
+
+def _naive_remaining(rows, start, end):
+    """Reference: the original days × cards loop."""
+    series = []
+    for i in range((end - start).days + 1):
+        day_end = datetime.combine(start + timedelta(days=i), time.max)
+        remaining = 0
+        for r in rows:
+            if r.created_at is None or r.created_at > day_end:
+                continue
+            if r.completed_at is None or r.completed_at > day_end:
+                remaining += r.story_points if r.story_points else 1
+        series.append(remaining)
+    return series
+
+
+def test_remaining_series_matches_naive_on_random_cards():
+    rnd = random.Random(1234)
+    origin = datetime(2024, 1, 1)
+    rows = []
+    for _ in range(500):
+        created = origin + timedelta(minutes=rnd.randint(0, 60 * 24 * 90))
+        completed = rnd.choice([
+            None,
+            created + timedelta(minutes=rnd.randint(0, 60 * 24 * 30)),
+            created - timedelta(days=1),  # inconsistent data
+            created,
+        ])
+        if rnd.random() < 0.05:
+            created = None
+        rows.append(_card(created, completed, rnd.choice([None, 0, 1, 3, 8])))
+
+    start, end = date(2023, 12, 20), date(2024, 4, 10)
+    assert _remaining_series(rows, start, end) == _naive_remaining(rows, start, end)
+
+
+def test_remaining_series_day_boundaries():
+    day = date(2024, 3, 10)
+    end_of_day = datetime.combine(day, time.max)
+    rows = [
+        _card(end_of_day),                                   # created at the last instant
+        _card(datetime(2024, 3, 9), completed=end_of_day),   # completed at the last instant
+        _card(datetime(2024, 3, 9), completed=end_of_day + timedelta(microseconds=1), points=5),
+    ]
+
+    series = _remaining_series(rows, date(2024, 3, 9), date(2024, 3, 11))
+
+    assert series == _naive_remaining(rows, date(2024, 3, 9), date(2024, 3, 11))
+    assert series == [6, 6, 1]
+
+
+async def test_get_burndown_builds_points():
+    session = make_session()
+    result = MagicMock()
+    result.all.return_value = [
+        _card(datetime(2024, 1, 1, 9), completed=datetime(2024, 1, 2, 12), points=3),
+        _card(datetime(2024, 1, 1, 10)),
+    ]
+    session.execute.return_value = result
+    rules = DashboardRules(session)
+
+    burndown = await rules.get_burndown(1, date(2024, 1, 1), date(2024, 1, 3))
+
+    assert burndown.total == 4
+    assert [p.remaining for p in burndown.points] == [4, 1, 1]
+    assert [p.ideal for p in burndown.points] == [4.0, 2.0, 0.0]
+    assert burndown.points[0].date == "2024-01-01"
+
+
+async def test_get_burndown_sql_strategy(monkeypatch):
+    from app.core.configs import settings
+
+    monkeypatch.setattr(settings, "BURNDOWN_STRATEGY", "sql")
+    session = make_session()
+    result = MagicMock()
+    result.all.return_value = [
+        SimpleNamespace(day=date(2024, 1, 1), remaining=4, total=4),
+        SimpleNamespace(day=date(2024, 1, 2), remaining=1, total=4),
+        SimpleNamespace(day=date(2024, 1, 3), remaining=1, total=4),
+    ]
+    session.execute.return_value = result
+    rules = DashboardRules(session)
+
+    burndown = await rules.get_burndown(1, date(2024, 1, 1), date(2024, 1, 3))
+
+    assert session.execute.await_count == 1
+    assert burndown.total == 4
+    assert [p.remaining for p in burndown.points] == [4, 1, 1]
+    assert [p.ideal for p in burndown.points] == [4.0, 2.0, 0.0]
+
+
+def _snapshot(day, remaining, total):
+    return SimpleNamespace(day=day, remaining_points=remaining, total_points=total)
+
+
+def _scalars_result(items):
+    r = MagicMock()
+    r.scalars.return_value.all.return_value = items
+    return r
+
+
+async def test_get_burndown_snapshot_strategy_reads_snapshots(monkeypatch):
+    from app.core.configs import settings
+
+    monkeypatch.setattr(settings, "BURNDOWN_STRATEGY", "snapshot")
+    session = make_session()
+    total = MagicMock()
+    total.scalar_one.return_value = 8  # live cards: one card added after the last snapshot
+    session.execute = AsyncMock(side_effect=[
+        _scalars_result([
+            _snapshot(date(2024, 1, 1), 4, 4),
+            _snapshot(date(2024, 1, 2), 6, 7),
+            _snapshot(date(2024, 1, 3), 2, 7),
+        ]),
+        total,
+    ])
+    rules = DashboardRules(session)
+
+    burndown = await rules.get_burndown(1, date(2024, 1, 1), date(2024, 1, 3))
+
+    assert session.execute.await_count == 2
+    assert burndown.total == 8
+    assert [p.remaining for p in burndown.points] == [4, 6, 2]
+
+
+async def test_get_burndown_snapshot_total_does_not_depend_on_the_window(monkeypatch):
+    from app.core.configs import settings
+
+    monkeypatch.setattr(settings, "BURNDOWN_STRATEGY", "snapshot")
+    cards = [
+        _card(datetime(2024, 1, 1, 9), completed=datetime(2024, 1, 2, 12), points=3),
+        _card(datetime(2024, 1, 1, 10)),
+        _card(datetime(2024, 1, 3, 8), points=5),
+    ]
+    snapshots = [_snapshot(date(2024, 1, 2), 9, 9), _snapshot(date(2024, 1, 3), 6, 9)]
+    live_total = MagicMock()
+    live_total.scalar_one.return_value = 9  # sum of the weights of the cards above
+    session = make_session()
+    session.execute = AsyncMock(side_effect=[
+        # Range crossing the first snapshot date (2024-01-02): rebuilt from cards
+        _scalars_result(snapshots),
+        _rows_result(cards),
+        # Range fully covered by snapshots
+        _scalars_result(snapshots),
+        live_total,
+    ])
+    rules = DashboardRules(session)
+
+    crossing = await rules.get_burndown(1, date(2024, 1, 1), date(2024, 1, 3))
+    covered = await rules.get_burndown(1, date(2024, 1, 2), date(2024, 1, 3))
+
+    assert crossing.total == covered.total == 9
+    assert [p.remaining for p in crossing.points] == [4, 9, 6]
+
+
+async def test_get_burndown_snapshot_strategy_fills_missing_days(monkeypatch):
+    from app.core.configs import settings
+
+    monkeypatch.setattr(settings, "BURNDOWN_STRATEGY", "snapshot")
+    session = make_session()
+    session.execute = AsyncMock(side_effect=[
+        _scalars_result([_snapshot(date(2024, 1, 2), 9, 9)]),
+        _rows_result([
+            _card(datetime(2024, 1, 1, 9), completed=datetime(2024, 1, 2, 12), points=3),
+            _card(datetime(2024, 1, 1, 10)),
+        ]),
+    ])
+    rules = DashboardRules(session)
+
+    burndown = await rules.get_burndown(1, date(2024, 1, 1), date(2024, 1, 3))
+
+    assert burndown.total == 4
+    assert [p.remaining for p in burndown.points] == [4, 9, 1]
+
+
+# ── get_cfd ───────────────────────────────────────────────────────────────────
+
+def _cfd_card(card_id, list_id, created):
+    return SimpleNamespace(id=card_id, list_id=list_id, created_at=created)
+
+
+def _move(card_id, created, old_list_id=None, old_value=None):
+    return SimpleNamespace(
+        card_id=card_id, old_list_id=old_list_id, old_value=old_value, created_at=created
+    )
+
+
+def _naive_cfd(cards, history, start, end):
+    """Reference: replay every card's moves forward for each day."""
+    series = []
+    for i in range((end - start).days + 1):
+        day_end = datetime.combine(start + timedelta(days=i), time.max)
+        counts = {}
+        for c in cards:
+            if c.created_at is not None and c.created_at > day_end:
+                continue
+            moves = sorted(h for h in history if h[1] == c.id)
+            # Initial list: origin of the first move (or the current one)
+            lst = moves[0][2] if moves else c.list_id
+            for ts, _, old, new in moves:
+                if ts <= day_end:
+                    lst = new
+            counts[lst] = counts.get(lst, 0) + 1
+        series.append(counts)
+    return series
+
+
+def test_cfd_series_matches_naive_replay():
+    rnd = random.Random(99)
+    origin = datetime(2024, 1, 1)
+    cards, history = [], []
+    for card_id in range(1, 301):
+        created = origin + timedelta(minutes=rnd.randint(0, 60 * 24 * 40))
+        lst = rnd.randint(1, 4)
+        ts = created
+        for _ in range(rnd.randint(0, 4)):
+            ts += timedelta(minutes=rnd.randint(1, 60 * 24 * 10))
+            new = rnd.choice([x for x in range(1, 5) if x != lst])
+            history.append((ts, card_id, lst, new))
+            lst = new
+        cards.append(_cfd_card(card_id, lst, created))
+
+    start, end = date(2023, 12, 25), date(2024, 3, 1)
+    start_end = datetime.combine(start, time.max)
+    moves = sorted(
+        ((ts, cid, old) for ts, cid, old, _ in history if ts > start_end), reverse=True
+    )
+
+    series = _cfd_series(cards, moves, start, end)
+
+    assert [dict(day) for day in series] == _naive_cfd(cards, history, start, end)
+
+
+async def test_get_cfd_resolves_legacy_names_and_builds_series():
+    session = make_session()
+    session.execute = AsyncMock(side_effect=[
+        _rows_result([
+            SimpleNamespace(id=1, name="To Do", is_final=False),
+            SimpleNamespace(id=2, name="Done", is_final=True),
+        ]),
+        _rows_result([
+            _cfd_card(10, 2, datetime(2024, 1, 1, 9)),
+            _cfd_card(11, 2, datetime(2024, 1, 2, 9)),
+        ]),
+        _rows_result([
+            _move(11, datetime(2024, 1, 3, 8), old_list_id=1),
+            _move(10, datetime(2024, 1, 2, 8), old_value="To Do"),
+        ]),
+    ])
+    rules = DashboardRules(session)
+
+    cfd = await rules.get_cfd(1, date(2024, 1, 1), date(2024, 1, 3))
+
+    assert cfd.dates == ["2024-01-01", "2024-01-02", "2024-01-03"]
+    assert [(s.list_name, s.counts) for s in cfd.lists] == [
+        ("To Do", [1, 1, 0]),
+        ("Done", [0, 1, 2]),
+    ]
+
+
+# ── get_time_distribution ─────────────────────────────────────────────────────
+
+def _summary(**kwargs):
+    values = {
+        f"{name}_{field}": None
+        for name in ("lead", "cycle")
+        for field in ("pct", "min", "max")
+    }
+    values.update(lead_count=0, cycle_count=0)
+    values.update(kwargs)
+    r = MagicMock()
+    r.one.return_value = SimpleNamespace(**values)
+    return r
+
+
+async def test_get_time_distribution_builds_percentiles_and_histogram():
+    session = make_session()
+    session.execute = AsyncMock(side_effect=[
+        _summary(
+            lead_count=5, lead_pct=[2.0, 7.5, 9.25], lead_min=1.0, lead_max=11.0,
+            cycle_count=2, cycle_pct=[3.0, 3.0, 3.0], cycle_min=3.0, cycle_max=3.0,
+        ),
+        _rows_result([
+            SimpleNamespace(kind="lead", bucket=1, cnt=3),
+            SimpleNamespace(kind="lead", bucket=4, cnt=2),
+        ]),
+    ])
+    rules = DashboardRules(session)
+
+    dist = await rules.get_time_distribution(1, date(2024, 1, 1), date(2024, 1, 31), buckets=4)
+
+    assert session.execute.await_count == 2
+    lead = dist.lead_time
+    assert (lead.count, lead.p50, lead.p85, lead.p95) == (5, 2.0, 7.5, 9.2)
+    assert [(b.lower, b.upper, b.count) for b in lead.histogram] == [
+        (1.0, 3.5, 3), (3.5, 6.0, 0), (6.0, 8.5, 0), (8.5, 11.0, 2),
+    ]
+    # All values equal: a single bucket and no histogram query
+    assert [(b.lower, b.upper, b.count) for b in dist.cycle_time.histogram] == [(3.0, 3.0, 2)]
+
+
+async def test_get_time_distribution_without_completed_cards():
+    session = make_session()
+    session.execute.return_value = _summary()
+    rules = DashboardRules(session)
+
+    dist = await rules.get_time_distribution(1, date(2024, 1, 1), date(2024, 1, 31), tag_id=7)
+
+    assert session.execute.await_count == 1
+    assert dist.lead_time.count == 0
+    assert dist.lead_time.p50 is None
+    assert dist.cycle_time.histogram == []
+
+
+# ── get_throughput ────────────────────────────────────────────────────────────
+
+def _current_week_start():
+    today = datetime.utcnow().date()
+    return today - timedelta(days=today.weekday())
+
+
+async def test_get_throughput_fills_weeks_and_caches(monkeypatch):
+    monkeypatch.setattr(dashboard, "_throughput_cache", {})
+    this_week = _current_week_start()
+    session = make_session()
+    session.execute.return_value = _rows_result([
+        SimpleNamespace(
+            week=datetime.combine(this_week - timedelta(weeks=2), time.min), cards=3, points=8
+        ),
+        SimpleNamespace(week=datetime.combine(this_week, time.min), cards=1, points=0),
+    ])
+    rules = DashboardRules(session)
+
+    throughput = await rules.get_throughput(1, weeks=4)
+    again = await rules.get_throughput(1, weeks=4)
+
+    assert session.execute.await_count == 1
+    assert again is throughput
+    assert [w.cards for w in throughput.weeks] == [0, 3, 0, 1]
+    assert [w.story_points for w in throughput.weeks] == [0, 8, 0, 0]
+    assert throughput.weeks[-1].week_start == this_week.strftime("%Y-%m-%d")
+    iso_year, iso_week, _ = this_week.isocalendar()
+    assert throughput.weeks[-1].week == f"{iso_year}-W{iso_week:02d}"
+    assert throughput.avg_cards == 1.0
+    assert throughput.avg_story_points == 2.0
+
+
+async def test_invalidate_throughput_drops_only_that_project(monkeypatch):
+    monkeypatch.setattr(dashboard, "_throughput_cache", {})
+    session = make_session()
+    session.execute.return_value = _rows_result([])
+    rules = DashboardRules(session)
+
+    await rules.get_throughput(1, weeks=2)
+    await rules.get_throughput(2, weeks=2)
+    invalidate_throughput(1)
+    await rules.get_throughput(1, weeks=2)
+    await rules.get_throughput(2, weeks=2)
+
+    assert session.execute.await_count == 3
+
+
+async def test_throughput_cache_expires_after_ttl(monkeypatch):
+    # Completions in other workers never call invalidate_throughput here
+    monkeypatch.setattr(dashboard, "_throughput_cache", {})
+    clock = [1000.0]
+    monkeypatch.setattr(dashboard, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(dashboard.settings, "THROUGHPUT_CACHE_SECONDS", 60)
+    session = make_session()
+    session.execute.return_value = _rows_result([])
+    rules = DashboardRules(session)
+
+    await rules.get_throughput(1, weeks=2)
+    clock[0] += 59
+    await rules.get_throughput(1, weeks=2)
+    clock[0] += 1
+    await rules.get_throughput(1, weeks=2)
+
+    assert session.execute.await_count == 2
+
+
+# ── get_forecast ──────────────────────────────────────────────────────────────
+
+def test_simulate_completion_days_constant_throughput():
+    days = _simulate_completion_days(np.array([2]), 10, 1000, np.random.default_rng(0))
+
+    assert (days == 5).all()
+
+
+def test_simulate_completion_days_matches_expected_mean():
+    samples = np.array([0, 1, 2, 3])  # mean of 1.5 cards/day
+    days = _simulate_completion_days(samples, 300, 5000, np.random.default_rng(7))
+
+    assert abs(days.mean() - 200) < 5
+    assert days.min() > 90  # spans more than one block
+
+
+def test_simulate_completion_days_without_cards():
+    days = _simulate_completion_days(np.array([0, 1]), 0, 10, np.random.default_rng(0))
+
+    assert (days == 0).all()
+
+
+def test_simulate_completion_days_stops_at_horizon():
+    days = _simulate_completion_days(np.array([0, 1]), 1000, 50, np.random.default_rng(0), horizon=100)
+
+    assert (days == 101).all()  # two blocks of 90 days cannot reach 1000 cards
+
+
+def test_forecast_plan_keeps_draws_under_budget():
+    assert _forecast_plan(6, 2.0, 10_000) == (10_000, dashboard._FORECAST_MAX_DRAWS // 10_000)
+    assert _forecast_plan(0, 0.0, 10_000) == (10_000, dashboard._FORECAST_HORIZON_DAYS)
+    for cards, mean in ((5000, 0.3), (300, 0.3), (100_000, 5.0), (30, 0.1)):
+        trials, horizon = _forecast_plan(cards, mean, 20_000)
+        assert trials * horizon <= dashboard._FORECAST_MAX_DRAWS
+        assert trials >= dashboard._FORECAST_MIN_TRIALS
+        # Room for twice the mean duration, up to the ~10 year horizon
+        assert horizon >= min(dashboard._FORECAST_HORIZON_DAYS, 2 * cards / mean)
+
+
+async def test_get_forecast_reduces_trials_for_large_backlogs():
+    since = datetime.utcnow().date() - timedelta(days=10)
+    session = make_session()
+    session.execute.return_value = _rows_result([SimpleNamespace(day=since, cnt=3)])
+    rules = DashboardRules(session)
+
+    forecast = await rules.get_forecast(1, cards=5000, history_days=10, trials=20_000, seed=1)
+
+    assert forecast.trials == dashboard._FORECAST_MAX_DRAWS // dashboard._FORECAST_HORIZON_DAYS
+    assert forecast.avg_daily_throughput == 0.3
+    assert forecast.p50 is None  # beyond the ~10 year horizon
+
+
+async def test_get_forecast_counts_backlog_and_returns_dates():
+    since = datetime.utcnow().date() - timedelta(days=7)
+    backlog = MagicMock()
+    backlog.scalar_one.return_value = 6  # cards outside the final list
+    session = make_session()
+    session.execute = AsyncMock(side_effect=[
+        backlog,
+        _rows_result([SimpleNamespace(day=since + timedelta(days=i), cnt=2) for i in range(7)]),
+    ])
+    rules = DashboardRules(session)
+
+    forecast = await rules.get_forecast(1, history_days=7, trials=500, seed=1)
+
+    today = datetime.utcnow().date()
+    expected = (today + timedelta(days=3)).strftime("%Y-%m-%d")
+    assert forecast.remaining_cards == 6
+    assert forecast.avg_daily_throughput == 2.0
+    assert (forecast.p50, forecast.p85, forecast.p95) == (expected, expected, expected)
+
+
+async def test_get_forecast_without_history_has_no_dates():
+    session = make_session()
+    session.execute.return_value = _rows_result([])
+    rules = DashboardRules(session)
+
+    forecast = await rules.get_forecast(1, cards=4, history_days=30, trials=100)
+
+    assert session.execute.await_count == 1
+    assert forecast.p50 is None
+    assert forecast.avg_daily_throughput == 0.0
@@ -0,0 +1,167 @@
+"""Tests for app/rules/email_outbox.py — EmailOutboxRules."""
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from core.email import EmailTransport, FileTransport
+from rules.email_outbox import EmailOutboxRules
+from app.test.rules.conftest import make_session, make_result
+
+
+class _RecordingTransport(EmailTransport):
+    def __init__(self, fail_for=(), fail_open=False):
+        self.fail_for = set(fail_for)
+        self.fail_open = fail_open
+        self.sent: list[str] = []
+        self.opened = self.closed = 0
+
+    async def open(self):
+        self.opened += 1
+        if self.fail_open:
+            raise ConnectionError("smtp down")
+
+    async def send(self, to, subject, body):
+        if to in self.fail_for:
+            raise RuntimeError("rejected")
+        self.sent.append(to)
+
+    async def close(self):
+        self.closed += 1
+
+
+def _email(to, attempts=0):
+    return SimpleNamespace(
+        to=to,
+        subject="Hi",
+        body="Body",
+        status="pending",
+        attempts=attempts,
+        next_attempt_at=datetime(2024, 1, 1),
+        last_error=None,
+        sent_at=None,
+    )
+
+
+# ── enqueue ───────────────────────────────────────────────────────────────────
+
+def test_enqueue_adds_pending_row_without_commit():
+    session = make_session()
+    rules = EmailOutboxRules(session)
+
+    email = rules.enqueue(to="a@b.com", subject="Hi", body="Body")
+
+    session.add.assert_called_once_with(email)
+    session.commit.assert_not_called()
+    assert email.status == "pending"
+    assert email.attempts == 0
+
+
+# ── send_pending ──────────────────────────────────────────────────────────────
+
+async def test_send_pending_uses_one_connection_per_batch():
+    emails = [_email("a@b.com"), _email("c@d.com")]
+    session = make_session()
+    session.execute.return_value = make_result(scalars_list=emails)
+    transport = _RecordingTransport()
+    rules = EmailOutboxRules(session)
+
+    count = await rules.send_pending(transport, batch_size=10)
+
+    assert count == 2
+    assert (transport.opened, transport.closed) == (1, 1)
+    assert transport.sent == ["a@b.com", "c@d.com"]
+    assert all(e.status == "sent" and e.sent_at is not None for e in emails)
+    session.commit.assert_called_once()
+
+
+async def test_send_pending_clears_body_of_sent_emails_only():
+    ok, bad = _email("a@b.com"), _email("bad@b.com")
+    session = make_session()
+    session.execute.return_value = make_result(scalars_list=[ok, bad])
+    rules = EmailOutboxRules(session)
+
+    await rules.send_pending(_RecordingTransport(fail_for={"bad@b.com"}), batch_size=10)
+
+    # Reset links carry live tokens: sent rows must not keep them
+    assert ok.body is None
+    assert bad.body == "Body"  # still needed for the retry
+
+
+async def test_send_pending_retries_failed_email_with_backoff():
+    ok, bad = _email("a@b.com"), _email("bad@b.com", attempts=1)
+    session = make_session()
+    session.execute.return_value = make_result(scalars_list=[ok, bad])
+    rules = EmailOutboxRules(session)
+
+    before = datetime.utcnow()
+    await rules.send_pending(_RecordingTransport(fail_for={"bad@b.com"}), batch_size=10)
+
+    assert ok.status == "sent"
+    assert bad.status == "pending"
+    assert bad.attempts == 2
+    assert bad.last_error == "RuntimeError: rejected"
+    assert bad.next_attempt_at >= before + timedelta(minutes=1)
+
+
+async def test_send_pending_marks_failed_after_max_attempts(monkeypatch):
+    from app.core.configs import settings
+
+    monkeypatch.setattr(settings, "EMAIL_MAX_ATTEMPTS", 3)
+    email = _email("a@b.com", attempts=2)
+    session = make_session()
+    session.execute.return_value = make_result(scalars_list=[email])
+    rules = EmailOutboxRules(session)
+
+    await rules.send_pending(_RecordingTransport(fail_open=True), batch_size=10)
+
+    assert email.status == "failed"
+    assert email.attempts == 3
+    assert email.last_error == "ConnectionError: smtp down"
+
+
+async def test_send_pending_empty_queue_skips_transport():
+    session = make_session()
+    session.execute.return_value = make_result(scalars_list=[])
+    transport = _RecordingTransport()
+    rules = EmailOutboxRules(session)
+
+    assert await rules.send_pending(transport, batch_size=10) == 0
+    assert transport.opened == 0
+    session.rollback.assert_called_once()
+
+
+async def test_send_all_pending_drains_full_batches():
+    session = make_session()
+    session.execute.side_effect = [
+        make_result(scalars_list=[_email("a@b.com"), _email("b@b.com")]),
+        make_result(scalars_list=[_email("c@b.com")]),
+    ]
+    transport = _RecordingTransport()
+    rules = EmailOutboxRules(session)
+
+    assert await rules.send_all_pending(transport, batch_size=2) == 3
+    assert transport.opened == 2
+
+
+# ── transports ────────────────────────────────────────────────────────────────
+
+def test_transport_without_send_cannot_be_instantiated():
+    class Incomplete(EmailTransport):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+async def test_file_transport_writes_eml(tmp_path):
+    transport = FileTransport(tmp_path / "mail")
+
+    await transport.open()
+    await transport.send("a@b.com", "Password Reset", "Click the link")
+    await transport.close()
+
+    [eml] = (tmp_path / "mail").iterdir()
+    content = eml.read_text()
+    assert "To: a@b.com" in content
+    assert "Subject: Password Reset" in content
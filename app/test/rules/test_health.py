@@ -0,0 +1,105 @@
+"""Tests for app/core/health.py and the /health and /ready routes."""
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import core.health as health
+from api.routes import health_router
+
+
+def _engine(checked_out=0):
+    return SimpleNamespace(pool=SimpleNamespace(checkedout=lambda: checked_out))
+
+
+def _patch_checks(monkeypatch, ping=None, backlog=3):
+    async def fake_ping(engine):
+        if ping is not None:
+            await ping()
+
+    async def fake_backlog(session_factory):
+        if isinstance(backlog, Exception):
+            raise backlog
+        return backlog
+
+    monkeypatch.setattr(health, "_ping", fake_ping)
+    monkeypatch.setattr(health, "_outbox_backlog", fake_backlog)
+
+
+# ── pool_check ────────────────────────────────────────────────────────────────
+
+def test_pool_check_reports_usage_against_capacity():
+    check = health.pool_check(_engine(checked_out=3), capacity=15, max_usage=0.9)
+
+    assert check.ok is True
+    assert check.checked_out == 3
+    assert check.usage == 0.2
+
+
+def test_pool_check_fails_when_saturated():
+    assert health.pool_check(_engine(checked_out=14), capacity=15, max_usage=0.9).ok is False
+
+
+# ── check_readiness ───────────────────────────────────────────────────────────
+
+async def test_ready_when_warmed_up_and_database_answers(monkeypatch):
+    _patch_checks(monkeypatch)
+
+    result = await health.check_readiness(SimpleNamespace(ready=True), _engine(), None)
+
+    assert result.status == "ready"
+    assert result.database.ok is True
+    assert result.database.ms >= 0
+    assert result.email_outbox.pending == 3
+    assert result.password_hashing.workers >= 1
+
+
+async def test_not_ready_before_warm_up(monkeypatch):
+    _patch_checks(monkeypatch)
+
+    result = await health.check_readiness(SimpleNamespace(ready=False), _engine(), None)
+
+    assert result.status == "not_ready"
+    assert result.warmed_up is False
+
+
+async def test_database_timeout_makes_worker_not_ready(monkeypatch):
+    async def slow():
+        await asyncio.sleep(1)
+
+    _patch_checks(monkeypatch, ping=slow)
+    monkeypatch.setattr(health.settings, "READY_TIMEOUT_SECONDS", 0.01)
+
+    result = await health.check_readiness(SimpleNamespace(ready=True), _engine(), None)
+
+    assert result.status == "not_ready"
+    assert result.database.error == "timeout"
+
+
+async def test_outbox_failure_is_reported_but_does_not_gate(monkeypatch):
+    _patch_checks(monkeypatch, backlog=RuntimeError("boom"))
+
+    result = await health.check_readiness(SimpleNamespace(ready=True), _engine(), None)
+
+    assert result.status == "ready"
+    assert result.email_outbox.ok is False
+    assert result.email_outbox.error == "RuntimeError"
+
+
+# ── routes ────────────────────────────────────────────────────────────────────
+
+async def test_health_route_does_no_io():
+    result = await health_router.health()
+
+    assert result.status == "ok"
+    assert result.uptime_seconds >= 0
+
+
+async def test_ready_route_answers_503_when_not_ready(monkeypatch):
+    _patch_checks(monkeypatch)
+    request = SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace(ready=False)))
+    response = MagicMock(status_code=200)
+
+    result = await health_router.ready(request, response)
+
+    assert result.status == "not_ready"
+    assert response.status_code == 503
@@ -0,0 +1,148 @@
+"""Tests for app/core/limiter.py — token bucket rate limiting."""
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi import HTTPException
+from starlette.requests import Request
+
+from core.auth import TokenService
+from core.limiter import (
+    DatabaseBackend,
+    MemoryBackend,
+    RateLimiter,
+    parse_rate,
+    range_cost,
+    request_key,
+)
+from app.test.rules.conftest import make_session
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _request(path="/api/x", query=b"", headers=None, endpoint=None, host="10.0.0.1"):
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": path,
+        "query_string": query,
+        "headers": [(k.lower().encode(), v.encode()) for k, v in (headers or {}).items()],
+        "client": (host, 1234),
+    }
+    if endpoint is not None:
+        scope["route"] = type("Route", (), {"endpoint": endpoint})()
+    return Request(scope)
+
+
+def test_parse_rate():
+    assert parse_rate("10/minute") == (10, 10 / 60)
+    assert parse_rate("3/seconds") == (3, 3.0)
+
+
+# ── MemoryBackend ─────────────────────────────────────────────────────────────
+
+async def test_memory_backend_consumes_and_refills():
+    clock = _Clock()
+    backend = MemoryBackend(clock=clock)
+
+    assert await backend.consume("k", 2, capacity=3, refill=1.0) == 0
+    assert await backend.consume("k", 1, capacity=3, refill=1.0) == 0
+    assert await backend.consume("k", 2, capacity=3, refill=1.0) == 2.0
+
+    clock.now = 2.0
+    assert await backend.consume("k", 2, capacity=3, refill=1.0) == 0
+
+
+async def test_memory_backend_evicts_least_recently_used_bucket():
+    backend = MemoryBackend(max_buckets=2, clock=_Clock())
+
+    await backend.consume("a", 1, capacity=1, refill=0.1)
+    await backend.consume("b", 1, capacity=1, refill=0.1)
+    await backend.consume("a", 1, capacity=1, refill=0.1)  # "a" becomes most recent
+    await backend.consume("c", 1, capacity=1, refill=0.1)  # evicts "b"
+
+    assert set(backend._buckets) == {"a", "c"}
+    assert await backend.consume("b", 1, capacity=1, refill=0.1) == 0
+
+
+# ── DatabaseBackend ───────────────────────────────────────────────────────────
+
+async def test_database_backend_reads_outcome_from_upsert():
+    session = make_session()
+    session.__aenter__.return_value = session
+    allowed, denied = MagicMock(), MagicMock()
+    allowed.first.return_value = (4.0,)
+    denied.first.return_value = None
+    session.execute.side_effect = [allowed, denied]
+    backend = DatabaseBackend(lambda: session)
+
+    assert await backend.consume("k", 1, capacity=5, refill=0.5) == 0
+    assert await backend.consume("k", 2, capacity=5, refill=0.5) == 4.0
+    assert session.commit.await_count == 2
+    params = session.execute.call_args_list[0].args[1]
+    assert params == {"key": "k", "cost": 1, "capacity": 5, "refill": 0.5}
+
+
+async def test_database_backend_prunes_buckets_idle_for_a_day():
+    session = make_session()
+    session.__aenter__.return_value = session
+    session.execute.return_value = MagicMock(rowcount=3)
+    backend = DatabaseBackend(lambda: session)
+
+    assert await backend.prune() == 3
+
+    statement, params = session.execute.call_args.args
+    assert str(statement).split()[:3] == ["DELETE", "FROM", "rate_limit_buckets"]
+    # A bucket idle for the longest period ("/day") is full again
+    assert params == {"idle": 86400}
+    session.commit.assert_awaited_once()
+
+
+# ── keys and costs ────────────────────────────────────────────────────────────
+
+def test_request_key_prefers_authenticated_user():
+    token = TokenService().create_access_token(sub=42)
+
+    assert request_key(_request(headers={"Authorization": f"Bearer {token}"})) == "user:42"
+    assert request_key(_request(headers={"Authorization": "Bearer forged"})) == "ip:10.0.0.1"
+    assert request_key(_request()) == "ip:10.0.0.1"
+
+
+def test_range_cost_grows_with_period():
+    assert range_cost(_request(query=b"start=2024-01-01&end=2024-01-10")) == 1
+    assert range_cost(_request(query=b"start=2024-01-01&end=2024-12-31")) == 13
+    assert range_cost(_request(query=b"start=bad")) == 1
+
+
+async def test_limit_charges_route_cost_and_raises_429():
+    limiter = RateLimiter(MemoryBackend(clock=_Clock()), "5/minute")
+    dependency = limiter.limit()
+
+    @limiter.cost(3)
+    async def pricey():
+        pass
+
+    await dependency(_request(endpoint=pricey))
+    with pytest.raises(HTTPException) as exc:
+        await dependency(_request(endpoint=pricey))
+
+    assert exc.value.status_code == 429
+    assert exc.value.headers["Retry-After"] == "12"
+    # Other keys keep their own budget
+    await dependency(_request(endpoint=pricey, host="10.0.0.2"))
+
+
+async def test_scoped_limit_uses_its_own_bucket():
+    limiter = RateLimiter(MemoryBackend(clock=_Clock()), "1/minute")
+    login = limiter.limit("2/minute", scope="login")
+
+    await limiter.limit()(_request())
+    await login(_request())
+    await login(_request())
+    with pytest.raises(HTTPException):
+        await login(_request())
@@ -20,6 +20,13 @@ def _make_list(list_id=1, project_id=10, name="To Do", order=1, cards=None):
     return lst
 
 
+def _stats_rebuild_results():
+    """Results consumed by ProjectStatsRules.rebuild: insert + lock, aggregate rows, upsert."""
+    rows = MagicMock()
+    rows.all.return_value = []
+    return [MagicMock(), MagicMock(), rows, MagicMock()]
+
+
 # ── _check_manage_permission ──────────────────────────────────────────────────
 
 async def test_check_manage_permission_allowed():
@@ -152,7 +159,8 @@ async def test_add_list_success():
     lists = [_make_list(1, order=1), _make_list(2, order=2)]
     lists_result = make_result(scalars_list=lists)
 
-    session.execute = AsyncMock(side_effect=[perm_result, lists_result, AsyncMock(), AsyncMock()])
+    session.execute = AsyncMock(side_effect=[perm_result, lists_result, AsyncMock(), AsyncMock(),
+                                              *_stats_rebuild_results()])
 
     rules = ListRules(session)
     new_list = await rules.add_list(
@@ -187,7 +195,7 @@ async def test_update_list_success():
     lists_result = make_result(scalars_list=[lst])
 
     session.execute = AsyncMock(side_effect=[perm_result, list_result, lists_result,
-                                              AsyncMock(), AsyncMock()])
+                                              AsyncMock(), *_stats_rebuild_results()])
 
     rules = ListRules(session)
     result = await rules.update_list(
@@ -221,7 +229,7 @@ async def test_delete_list_no_cards_success():
     lists_result = make_result(scalars_list=[lst])
 
     session.execute = AsyncMock(side_effect=[perm_result, list_result, lists_result,
-                                              AsyncMock(), AsyncMock()])
+                                              AsyncMock(), *_stats_rebuild_results()])
     rules = ListRules(session)
     await rules.delete_list(project_id=1, list_id=1, user_id=1)
 
@@ -260,13 +268,12 @@ async def test_delete_list_with_cards_target_list_id_success():
     update_result = MagicMock()
     # _recalculate_final_list: lists query
     recalc_lists = make_result(scalars_list=[lst])
-    # _recalculate_final_list: update non-final cards + update final cards
+    # _recalculate_final_list: update final cards (no non-final lists left)
     upd1 = MagicMock()
-    upd2 = MagicMock()
 
     session.execute = AsyncMock(
         side_effect=[perm_result, list_result, target_result,
-                     update_result, recalc_lists, upd1, upd2]
+                     update_result, recalc_lists, upd1, *_stats_rebuild_results()]
     )
     session.refresh = AsyncMock()
 
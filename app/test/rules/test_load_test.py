@@ -0,0 +1,117 @@
+"""Tests for benchmarks/load_test.py — journeys against a stub API (no server)."""
+import httpx
+from fastapi import FastAPI, Form, Request
+
+from benchmarks.load_test import LoadOptions, Recorder, format_report, percentile, run_load, summarize
+
+
+def _stub_api(calls):
+    app = FastAPI()
+    cards = [{"id": n, "listId": 10 + n % 3} for n in range(1, 31)]
+
+    @app.middleware("http")
+    async def record(request: Request, call_next):
+        calls.append((request.method, request.url.path, request.headers.get("authorization")))
+        return await call_next(request)
+
+    @app.post("/api/users/login")
+    async def login(username: str = Form(), password: str = Form()):
+        # seed1 has no projects; everyone else does
+        return {"accessToken": f"token-{username}", "expiresAt": "2030-01-01T00:00:00"}
+
+    @app.get("/api/projects/")
+    async def projects(request: Request):
+        if request.headers["authorization"] == "Bearer token-seed1@example.com":
+            return []
+        return [{"id": 1}, {"id": 2}]
+
+    @app.get("/api/projects/{project_id}")
+    async def project(project_id: int):
+        return {"id": project_id}
+
+    @app.get("/api/projects/{project_id}/lists/")
+    async def lists(project_id: int):
+        return [{"id": 10}, {"id": 11}, {"id": 12}]
+
+    @app.get("/api/projects/{project_id}/lists/{list_id}/cards")
+    async def page(project_id: int, list_id: int, page: int = 1, limit: int = 20):
+        column = [c for c in cards if c["listId"] == list_id]
+        chunk = column[(page - 1) * limit : page * limit]
+        return {"cards": chunk, "total": len(column), "page": page, "hasMore": page * limit < len(column)}
+
+    @app.api_route("/api/{rest:path}", methods=["GET", "PUT", "POST"])
+    async def anything(rest: str):
+        return {}
+
+    return app
+
+
+async def test_journeys_hit_every_step_and_report_per_route():
+    calls = []
+    transport = httpx.ASGITransport(app=_stub_api(calls))
+    options = LoadOptions(
+        base_url="http://test", concurrency=2, duration=0.3, ramp_up=0, think_ms=0, page_size=4
+    )
+
+    summary = await run_load(options, transport=transport)
+
+    routes = summary["routes"]
+    assert {
+        "POST /api/users/login",
+        "GET /api/projects/",
+        "GET /api/projects/{project_id}/lists/",
+        "GET /api/projects/{project_id}/lists/{list_id}/cards",
+        "GET /api/cards/{card_id}",
+        "PUT /api/cards/{card_id}",
+        "PUT /api/cards/reorder",
+        "POST /api/comments/card/{card_id}",
+        "GET /api/dashboard/my-cards",
+        "GET /api/dashboard/project/{project_id}/burndown",
+    } <= set(routes)
+    assert summary["errors"] == 0
+    # Virtual user 0 skips seed1 (no projects) and logs in as seed3
+    assert routes["POST /api/users/login"]["count"] == 3
+    card_calls = [auth for method, path, auth in calls if path.startswith("/api/cards/")]
+    assert card_calls and None not in card_calls
+    assert "Bearer token-seed1@example.com" not in card_calls
+
+
+async def test_read_only_skips_writes():
+    calls = []
+    options = LoadOptions(
+        base_url="http://test", concurrency=1, duration=0.2, ramp_up=0, think_ms=0,
+        first_user=2, read_only=True,
+    )
+
+    await run_load(options, transport=httpx.ASGITransport(app=_stub_api(calls)))
+
+    methods = {method for method, path, _ in calls if path != "/api/users/login"}
+    assert methods == {"GET"}
+
+
+def test_percentile_nearest_rank():
+    values = list(range(1, 101))
+
+    assert percentile(values, 50) == 50
+    assert percentile(values, 95) == 95
+    assert percentile(values, 99) == 99
+    assert percentile([7.0], 99) == 7.0
+    assert percentile([], 50) == 0.0
+
+
+def test_summary_counts_errors_and_compares_with_baseline():
+    recorder = Recorder()
+    for ms in (10, 20, 30, 40):
+        recorder.add("GET /api/cards/{card_id}", ms, 200)
+    recorder.add("GET /api/cards/{card_id}", 500, 500)
+    recorder.add("POST /api/users/login", 5, 0)  # connection error
+
+    summary = summarize(recorder, elapsed=2.0)
+    baseline = {"rps": 2.0, "errors": 0, "routes": {"GET /api/cards/{card_id}": {"p95": 250.0}}}
+    report = format_report(summary, baseline)
+
+    cards = summary["routes"]["GET /api/cards/{card_id}"]
+    assert (cards["count"], cards["errors"], cards["p50"], cards["p95"]) == (5, 1, 30, 500)
+    assert summary["errors"] == 2
+    assert summary["rps"] == 3.0
+    assert "+100%" in report
@@ -0,0 +1,260 @@
+"""Tests for app/core/metrics.py — registry, MetricsMiddleware and engine hooks."""
+from types import SimpleNamespace
+
+import logging
+
+import httpx
+import pytest
+from fastapi import APIRouter, FastAPI
+from sqlalchemy import create_engine, text
+from sqlalchemy.util import greenlet_spawn
+
+import app.core.metrics as metrics
+from app.api.routes import metrics_router
+
+
+# ── Registry / exposition format ──────────────────────────────────────────────
+
+def test_renders_counter_gauge_and_histogram():
+    registry = metrics.Registry()
+    counter = metrics.Counter("jobs_total", "Jobs.", ("queue",), registry=registry)
+    gauge = metrics.Gauge("depth", "Depth.", collect=lambda: 7, registry=registry)
+    histogram = metrics.Histogram("latency_seconds", "Latency.", buckets=(0.1, 1), registry=registry)
+
+    counter.inc("a")
+    counter.inc("a", amount=2)
+    histogram.observe(0.05)
+    histogram.observe(0.5)
+    histogram.observe(3)
+
+    lines = registry.render().splitlines()
+    assert "# TYPE jobs_total counter" in lines
+    assert 'jobs_total{queue="a"} 3' in lines
+    assert "depth 7" in lines
+    assert 'latency_seconds_bucket{le="0.1"} 1' in lines
+    assert 'latency_seconds_bucket{le="1"} 2' in lines
+    assert 'latency_seconds_bucket{le="+Inf"} 3' in lines
+    assert "latency_seconds_sum 3.55" in lines
+    assert "latency_seconds_count 3" in lines
+
+
+def test_label_values_are_escaped():
+    registry = metrics.Registry()
+    counter = metrics.Counter("c_total", "C.", ("path",), registry=registry)
+    counter.inc('a"b\\c\n')
+
+    assert 'c_total{path="a\\"b\\\\c\\n"} 1' in registry.render()
+
+
+def test_histogram_bucket_bounds_are_inclusive():
+    histogram = metrics.Histogram("h", "H.", buckets=(1, 2), registry=metrics.Registry())
+    histogram.observe(1)
+
+    samples = {labels[-1][1]: value for name, labels, value in histogram.samples() if name == "h_bucket"}
+    assert samples == {"1": 1, "2": 1, "+Inf": 1}
+
+
+# ── MetricsMiddleware ─────────────────────────────────────────────────────────
+
+def _query(statement="SELECT 1"):
+    # Runs the cursor hooks as the engine would for one query
+    conn = SimpleNamespace(info={})
+    metrics._before_cursor_execute(conn, None, statement, (), None, False)
+    metrics._after_cursor_execute(conn, None, statement, (), None, False)
+
+
+def _app(**options):
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: int):
+        _query()
+        _query()
+        return {"id": item_id}
+
+    @app.get("/n-plus-one")
+    async def n_plus_one():
+        for n in range(6):
+            _query(f"SELECT * FROM tags WHERE tags.id = ${n + 1}")
+        return {}
+
+    app.include_router(metrics_router.router)
+    return metrics.MetricsMiddleware(app, **options)
+
+
+async def _get(app, path):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        return await client.get(path)
+
+
+async def test_labels_requests_by_route_template():
+    route = "/items/{item_id}"
+    before = metrics.HTTP_REQUESTS.value("GET", route, "200")
+
+    await _get(_app(), "/items/1")
+    await _get(_app(), "/items/2")
+
+    assert metrics.HTTP_REQUESTS.value("GET", route, "200") == before + 2
+    assert metrics.HTTP_LATENCY.count("GET", route) >= 2
+    assert metrics.HTTP_IN_PROGRESS.value("GET") == 0
+
+
+async def test_included_routes_are_labelled_with_their_full_prefix():
+    router = APIRouter()
+
+    @router.get("/{card_id}")
+    async def get_card(card_id: int):
+        return {"id": card_id}
+
+    api = APIRouter()
+    api.include_router(router, prefix="/cards")
+    app = FastAPI()
+    app.include_router(api, prefix="/api")
+    route = "/api/cards/{card_id}"
+    before = metrics.HTTP_REQUESTS.value("GET", route, "200")
+
+    await _get(metrics.MetricsMiddleware(app), "/api/cards/5")
+
+    assert metrics.HTTP_REQUESTS.value("GET", route, "200") == before + 1
+
+
+async def test_unknown_paths_share_one_label():
+    before = metrics.HTTP_REQUESTS.value("GET", "unmatched", "404")
+
+    await _get(_app(), "/nope/123")
+
+    assert metrics.HTTP_REQUESTS.value("GET", "unmatched", "404") == before + 1
+
+
+async def test_records_db_queries_per_request():
+    route = "/items/{item_id}"
+    count = metrics.DB_REQUEST_QUERIES.count(route)
+    total = metrics.DB_REQUEST_QUERIES.sum(route)
+
+    await _get(_app(), "/items/1")
+
+    assert metrics.DB_REQUEST_QUERIES.count(route) == count + 1
+    assert metrics.DB_REQUEST_QUERIES.sum(route) == total + 2
+    assert metrics.current_request_stats() is None
+
+
+async def test_metrics_endpoint_serves_text_format():
+    await _get(_app(), "/items/1")
+
+    response = await _get(_app(), "/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == metrics.CONTENT_TYPE
+    assert '# TYPE http_request_duration_seconds histogram' in response.text
+    assert 'route="/items/{item_id}"' in response.text
+
+
+async def test_query_header_reports_queries_per_request():
+    response = await _get(_app(query_header=True), "/items/1")
+
+    assert response.headers["x-db-queries"] == "2"
+    assert float(response.headers["x-db-time-ms"]) >= 0
+
+
+async def test_query_header_is_off_by_default():
+    response = await _get(_app(), "/items/1")
+
+    assert "x-db-queries" not in response.headers
+
+
+async def test_logs_repeated_statement_shapes(caplog):
+    with caplog.at_level(logging.WARNING, logger=metrics.logger.name):
+        await _get(_app(repeat_threshold=5), "/n-plus-one")
+        await _get(_app(repeat_threshold=5), "/items/1")
+
+    [record] = caplog.records
+    assert "GET /n-plus-one" in record.getMessage()
+    assert "6x SELECT * FROM tags WHERE tags.id = ?" in record.getMessage()
+
+
+# ── Statement shapes and query budget ─────────────────────────────────────────
+
+def test_statement_shape_normalizes_params_and_in_lists():
+    shape = metrics.statement_shape(
+        "SELECT cards.id\n  FROM cards WHERE cards.list_id IN ($1, $2, $3) LIMIT $4"
+    )
+
+    assert shape == "SELECT cards.id FROM cards WHERE cards.list_id IN (?, ...) LIMIT ?"
+    assert metrics.statement_shape("SELECT 1 WHERE a = %(a_1)s") == "SELECT 1 WHERE a = ?"
+
+
+def test_query_budget_passes_within_budget():
+    with metrics.query_budget(2) as stats:
+        _query()
+        _query()
+
+    assert stats.queries == 2
+
+
+def test_query_budget_fails_listing_the_statements():
+    with pytest.raises(metrics.QueryBudgetExceeded, match="3 queries") as exc:
+        with metrics.query_budget(2):
+            for n in range(3):
+                _query(f"SELECT * FROM users WHERE id = ${n + 1}")
+
+    assert "3x SELECT * FROM users WHERE id = ?" in str(exc.value)
+
+
+def test_query_budget_adds_to_the_enclosing_request():
+    outer = metrics.RequestStats()
+    token = metrics._request_stats.set(outer)
+    try:
+        _query()
+        with metrics.query_budget(5):
+            _query()
+    finally:
+        metrics._request_stats.reset(token)
+
+    assert outer.queries == 2
+    assert outer.statements["SELECT 1"] == 2
+
+
+# ── Engine hooks and pool ─────────────────────────────────────────────────────
+
+def test_instrument_engine_counts_queries_and_reports_pool(monkeypatch):
+    monkeypatch.setattr(metrics.DB_POOL_CHECKED_OUT, "collect", None)
+    sync_engine = create_engine("sqlite://")
+    engine = SimpleNamespace(sync_engine=sync_engine, pool=SimpleNamespace(checkedout=lambda: 4))
+    metrics.instrument_engine(engine)
+    metrics.instrument_engine(engine)  # idempotent
+    before = metrics.DB_QUERIES.value()
+
+    stats = metrics.RequestStats()
+    token = metrics._request_stats.set(stats)
+    try:
+        with sync_engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            conn.execute(text("SELECT 2"))
+    finally:
+        metrics._request_stats.reset(token)
+
+    assert metrics.DB_QUERIES.value() == before + 2
+    assert stats.queries == 2
+    assert stats.db_seconds > 0
+    assert "db_pool_checked_out 4" in metrics.render().splitlines()
+
+
+async def test_timed_pool_records_checkout_wait():
+    pool = metrics.TimedAsyncQueuePool(creator=lambda: SimpleNamespace(close=lambda: None), pool_size=1)
+    before = metrics.DB_POOL_WAIT.count()
+
+    connection = await greenlet_spawn(pool.connect)
+    await greenlet_spawn(connection.close)
+
+    assert metrics.DB_POOL_WAIT.count() == before + 1
+
+
+def test_cache_lookups_are_counted_by_result():
+    before = metrics.CACHE_LOOKUPS.value("throughput", "hit")
+
+    metrics.record_cache("throughput", True)
+    metrics.record_cache("throughput", False)
+
+    assert metrics.CACHE_LOOKUPS.value("throughput", "hit") == before + 1
+    assert metrics.CACHE_LOOKUPS.value("throughput", "miss") >= 1
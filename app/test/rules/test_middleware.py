@@ -0,0 +1,198 @@
+"""Tests for app/core/middleware.py — SecurityHeadersMiddleware and CompressionMiddleware."""
+import gzip
+import zlib
+
+import brotli
+import pytest
+
+from core.middleware import (
+    CompressionMiddleware,
+    SecurityHeadersMiddleware,
+    negotiate_encoding,
+)
+
+
+def _app(chunks=(b"hello",), headers=()):
+    async def app(scope, receive, send):
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [(b"content-type", b"text/plain"), *headers],
+        })
+        for i, chunk in enumerate(chunks):
+            await send({
+                "type": "http.response.body",
+                "body": chunk,
+                "more_body": i < len(chunks) - 1,
+            })
+
+    return app
+
+
+async def _call(app, scope_type="http", accept_encoding=None):
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {"type": scope_type, "headers": []}
+    if accept_encoding is not None:
+        scope["headers"].append((b"accept-encoding", accept_encoding.encode()))
+    await app(scope, receive, send)
+    return messages
+
+
+def _headers(message):
+    return {k.decode(): v.decode() for k, v in message["headers"]}
+
+
+async def test_adds_security_headers_and_keeps_existing_ones():
+    messages = await _call(SecurityHeadersMiddleware(_app()))
+
+    headers = _headers(messages[0])
+    assert headers["content-type"] == "text/plain"
+    assert headers["x-content-type-options"] == "nosniff"
+    assert headers["x-frame-options"] == "DENY"
+    assert headers["referrer-policy"] == "strict-origin-when-cross-origin"
+    assert "strict-transport-security" not in headers
+
+
+async def test_hsts_only_when_enabled():
+    messages = await _call(SecurityHeadersMiddleware(_app(), hsts=True))
+
+    assert _headers(messages[0])["strict-transport-security"].startswith("max-age=")
+
+
+async def test_streaming_body_is_forwarded_chunk_by_chunk():
+    messages = await _call(SecurityHeadersMiddleware(_app([b"a", b"b", b"c"])))
+
+    bodies = [m["body"] for m in messages if m["type"] == "http.response.body"]
+    assert bodies == [b"a", b"b", b"c"]
+
+
+async def test_non_http_scopes_pass_through():
+    seen = []
+
+    async def app(scope, receive, send):
+        seen.append(scope["type"])
+        await send({"type": "lifespan.startup.complete"})
+
+    messages = await _call(SecurityHeadersMiddleware(app), scope_type="lifespan")
+
+    assert seen == ["lifespan"]
+    assert messages == [{"type": "lifespan.startup.complete"}]
+
+
+# ── CompressionMiddleware ─────────────────────────────────────────────────────
+
+_LARGE = b'{"cardNumber": 1, "title": "Card"},' * 200
+
+
+def _body(messages):
+    return b"".join(m["body"] for m in messages if m["type"] == "http.response.body")
+
+
+def test_negotiate_encoding_prefers_highest_q_and_honours_q_zero():
+    assert negotiate_encoding("") is None
+    assert negotiate_encoding("identity") is None
+    assert negotiate_encoding("gzip, deflate") == "gzip"
+    assert negotiate_encoding("gzip;q=0") is None
+    assert negotiate_encoding("*;q=0.5, gzip;q=0") in (None, "br")
+
+
+async def test_gzip_compresses_large_responses():
+    app = CompressionMiddleware(_app([_LARGE]), minimum_size=1024)
+
+    messages = await _call(app, accept_encoding="gzip")
+
+    headers = _headers(messages[0])
+    assert headers["content-encoding"] == "gzip"
+    assert headers["vary"] == "Accept-Encoding"
+    assert gzip.decompress(_body(messages)) == _LARGE
+    assert int(headers["content-length"]) < len(_LARGE)
+
+
+async def test_small_responses_are_not_compressed():
+    app = CompressionMiddleware(_app([b"hello"]), minimum_size=1024)
+
+    messages = await _call(app, accept_encoding="gzip")
+
+    assert "content-encoding" not in _headers(messages[0])
+    assert _body(messages) == b"hello"
+
+
+async def test_without_accept_encoding_body_is_untouched():
+    app = CompressionMiddleware(_app([_LARGE]), minimum_size=1024)
+
+    messages = await _call(app)
+
+    assert "content-encoding" not in _headers(messages[0])
+    assert _body(messages) == _LARGE
+
+
+async def test_already_encoded_responses_pass_through():
+    app = CompressionMiddleware(
+        _app([_LARGE], headers=[(b"content-encoding", b"identity")]), minimum_size=1024
+    )
+
+    messages = await _call(app, accept_encoding="gzip")
+
+    assert _headers(messages[0])["content-encoding"] == "identity"
+    assert _body(messages) == _LARGE
+
+
+async def test_streaming_gzip_flushes_each_chunk():
+    chunks = [_LARGE, _LARGE, b""]
+    app = CompressionMiddleware(_app(chunks), minimum_size=1024)
+
+    messages = await _call(app, accept_encoding="gzip")
+
+    bodies = [m["body"] for m in messages if m["type"] == "http.response.body"]
+    assert "content-length" not in _headers(messages[0])
+    # Every chunk is flushed, so the client can decode it as soon as it arrives
+    decoder = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    assert decoder.decompress(bodies[0]) == _LARGE
+    assert gzip.decompress(b"".join(bodies)) == _LARGE * 2
+
+
+async def test_brotli_preferred_over_gzip():
+    app = CompressionMiddleware(_app([_LARGE, _LARGE, b""]), minimum_size=1024)
+
+    messages = await _call(app, accept_encoding="gzip, br")
+
+    assert _headers(messages[0])["content-encoding"] == "br"
+    assert brotli.decompress(_body(messages)) == _LARGE * 2
+
+
+@pytest.mark.parametrize("content_type", [b"image/png", b"text/event-stream", b"video/mp4"])
+async def test_excluded_content_types_are_not_compressed(content_type):
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200,
+                    "headers": [(b"content-type", content_type)]})
+        await send({"type": "http.response.body", "body": _LARGE})
+
+    messages = await _call(CompressionMiddleware(app, minimum_size=1024), accept_encoding="gzip")
+
+    assert "content-encoding" not in _headers(messages[0])
+    assert _body(messages) == _LARGE
+
+
+async def test_partial_content_is_not_compressed():
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 206,
+                    "headers": [(b"content-type", b"text/plain")]})
+        await send({"type": "http.response.body", "body": _LARGE})
+
+    messages = await _call(CompressionMiddleware(app, minimum_size=1024), accept_encoding="gzip")
+
+    assert "content-encoding" not in _headers(messages[0])
+    assert _body(messages) == _LARGE
+
+
+async def test_uncompressed_large_response_still_varies_on_accept_encoding():
+    messages = await _call(CompressionMiddleware(_app([_LARGE]), minimum_size=1024))
+
+    assert _headers(messages[0])["vary"] == "Accept-Encoding"
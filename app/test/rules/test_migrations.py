@@ -0,0 +1,72 @@
+"""Tests for the Alembic migration history in migrations/."""
+import io
+import re
+from pathlib import Path
+
+from alembic import command
+from alembic.config import Config
+from alembic.script import ScriptDirectory
+
+import app.db.models.__all_models  # noqa: F401
+from app.core.configs import settings
+
+ALEMBIC_INI = Path(__file__).resolve().parents[3] / "alembic.ini"
+
+
+def _config(buffer=None):
+    return Config(str(ALEMBIC_INI), output_buffer=buffer)
+
+
+def _offline_sql(revision: str = "head") -> str:
+    buffer = io.StringIO()
+    command.upgrade(_config(buffer), revision, sql=True)
+    return buffer.getvalue()
+
+
+def _created_columns(sql: str, table: str) -> set[str]:
+    """Columns of ``table`` from its CREATE TABLE plus later ALTER TABLE ... ADD COLUMN."""
+    match = re.search(rf'CREATE TABLE "?{re.escape(table)}"? \((.*?)\n\);', sql, re.S)
+    if not match:
+        return set()
+    created = set(re.findall(r'^\s+"?(\w+)"? [A-Z]', match.group(1), re.M))
+    created |= set(re.findall(rf'ALTER TABLE "?{re.escape(table)}"? ADD COLUMN "?(\w+)"?', sql))
+    return created
+
+
+def test_history_is_linear_with_a_single_head():
+    script = ScriptDirectory.from_config(_config())
+
+    assert len(script.get_heads()) == 1
+    assert [rev.revision for rev in script.walk_revisions()][-1] == "0001_baseline"
+
+
+def test_migrations_create_every_model_table_and_column():
+    sql = _offline_sql()
+
+    for table in settings.DBBaseModel.metadata.sorted_tables:
+        created = _created_columns(sql, table.name)
+        assert created, f"table {table.name} is not created by the migrations"
+        assert {c.name for c in table.columns} <= created, table.name
+
+
+def test_migrations_create_every_model_index():
+    sql = _offline_sql()
+
+    for table in settings.DBBaseModel.metadata.sorted_tables:
+        for index in table.indexes:
+            assert re.search(rf'CREATE (UNIQUE )?INDEX "?{re.escape(index.name)}"?', sql), index.name
+
+
+
+def test_baseline_is_the_schema_created_before_migrations():
+    # Pre-migration databases are stamped at 0001: it must not create anything
+    # they lack, or "alembic upgrade head" would skip it on those databases.
+    sql = _offline_sql("0001_baseline")
+
+    for table in ("email_outbox", "rate_limit_buckets", "project_snapshots", "project_stats"):
+        assert not _created_columns(sql, table), table
+    assert not {"oldListId", "newListId"} & _created_columns(sql, "card_history")
+    assert "ix_card_history_action_created_at" not in sql
+    assert "ix_cards_completedAt" not in sql
+    assert {"completedAt", "sortOrder"} <= _created_columns(sql, "cards")
+    assert "isFinal" in _created_columns(sql, "lists")
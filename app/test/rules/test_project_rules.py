@@ -475,9 +475,10 @@ async def test_invite_users_unregistered_sends_email():
     rules = ProjectRules(session)
     invites = [{"email": "ghost@test.com", "role": "User"}]
 
-    with patch("rules.project.send_email") as mock_email:
+    with patch("rules.project.EmailOutboxRules") as mock_outbox:
         response = await rules.invite_users_by_email(
             project_id=1, invites=invites, inviter_name="Alice", current_user_id=1
         )
-    mock_email.assert_called_once()
+    mock_outbox.return_value.enqueue.assert_called_once()
+    assert mock_outbox.return_value.enqueue.call_args.kwargs["to"] == "ghost@test.com"
     assert response.results[0].registered is False
@@ -0,0 +1,194 @@
+"""Tests for app/rules/project_stats.py — ProjectStatsRules."""
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+from sqlalchemy.dialects import postgresql
+
+from rules.project_stats import CardStatsEntry, ProjectStatsRules, _entry_deltas
+from app.test.rules.conftest import make_session, make_result
+
+
+def _agg_row(kind, key=None, label=None, is_final=None, sort_key=None, cnt=0, total_days=None):
+    return SimpleNamespace(
+        kind=kind,
+        key=key,
+        label=label,
+        is_final=is_final,
+        sort_key=sort_key,
+        cnt=cnt,
+        total_days=total_days,
+    )
+
+
+def _rows_result(rows):
+    r = MagicMock()
+    r.all.return_value = rows
+    return r
+
+
+# ── rebuild ───────────────────────────────────────────────────────────────────
+
+async def test_rebuild_aggregates_rows_and_upserts():
+    session = make_session()
+    upsert = MagicMock()
+    session.execute = AsyncMock(side_effect=[
+        MagicMock(),  # insert missing row
+        MagicMock(),  # row lock
+        _rows_result([
+            _agg_row("list", key=3, label="Done", is_final=True, sort_key=2, cnt=4),
+            _agg_row("list", key=1, label="To Do", is_final=False, sort_key=0, cnt=6),
+            _agg_row("priority", key=None, cnt=2),
+            _agg_row("priority", key=3, cnt=8),
+            _agg_row("tag", key=7, label="backend", cnt=1),
+            _agg_row("tag", key=8, label="frontend", cnt=9),
+            _agg_row("lead", cnt=4, total_days=10.0),
+            _agg_row("cycle", cnt=3, total_days=4.0),
+        ]),
+        upsert,
+    ])
+    rules = ProjectStatsRules(session)
+
+    values = await rules.rebuild(project_id=1)
+
+    assert session.execute.await_count == 4
+    session.commit.assert_not_called()
+    stats = rules._to_response(values)
+    assert stats.total_cards == 10
+    assert [d.list_name for d in stats.by_list] == ["To Do", "Done"]
+    assert [d.priority for d in stats.by_priority] == [3, None]
+    assert [d.tag_name for d in stats.by_tag] == ["frontend", "backend"]
+    assert stats.lead_time_days == 2.5
+    assert stats.cycle_time_days == 1.3
+
+
+async def test_rebuild_locks_the_stats_row_before_aggregating():
+    session = make_session()
+    session.execute = AsyncMock(side_effect=[MagicMock(), MagicMock(), _rows_result([]), MagicMock()])
+    rules = ProjectStatsRules(session)
+
+    await rules.rebuild(project_id=1)
+
+    insert, lock, aggregate, upsert = [
+        str(call.args[0].compile(dialect=postgresql.dialect())) for call in session.execute.call_args_list
+    ]
+    # Concurrent deltas either land in the aggregate or wait for this transaction
+    assert insert.startswith("INSERT INTO project_stats") and "ON CONFLICT" in insert
+    assert "DO NOTHING" in insert
+    assert lock.endswith("FOR UPDATE") and "project_stats" in lock
+    assert "project_cards" in aggregate
+    assert "DO UPDATE" in upsert
+
+
+# ── apply_card_change ─────────────────────────────────────────────────────────
+
+def _update_result(by_list=None, by_tag=None):
+    # RETURNING of the delta UPDATE (None = project not materialized)
+    r = MagicMock()
+    r.first.return_value = (
+        None if by_list is None else SimpleNamespace(by_list=by_list, by_tag=by_tag or {})
+    )
+    return r
+
+
+async def test_apply_card_change_noop_when_unchanged():
+    session = make_session()
+    rules = ProjectStatsRules(session)
+    entry = CardStatsEntry(list_id=1)
+
+    await rules.apply_card_change(1, entry, CardStatsEntry(list_id=1))
+
+    session.execute.assert_not_called()
+
+
+async def test_apply_card_change_adds_deltas_in_a_single_update():
+    session = make_session()
+    session.execute.return_value = _update_result(by_list={}, by_tag={})
+    rules = ProjectStatsRules(session)
+
+    before = CardStatsEntry(list_id=1, tags={7: "backend"})
+    after = CardStatsEntry(list_id=2, tags={7: "backend"}, lead_days=2.0, cycle_days=1.0)
+    await rules.apply_card_change(1, before, after)
+
+    [(stmt, params)] = [call.args for call in session.execute.call_args_list]
+    assert str(stmt).split()[:2] == ["UPDATE", "project_stats"]
+    assert '"leadTimeCount" = "leadTimeCount" + :lead_time_count' in str(stmt)
+    assert json.loads(params["by_list"]) == {"1": {"count": -1}, "2": {"count": 1}}
+    assert json.loads(params["by_tag"]) == {}  # unchanged tags cancel out
+    assert json.loads(params["by_priority"]) == {}
+    assert (params["lead_time_sum"], params["lead_time_count"]) == (2.0, 1)
+    assert (params["cycle_time_sum"], params["cycle_time_count"]) == (1.0, 1)
+    assert params["project_id"] == 1
+
+
+def test_entry_deltas_carry_metadata_for_new_keys():
+    after = CardStatsEntry(
+        list_id=5, list_name="Review", list_is_final=False, list_order=3, priority=2,
+        tags={7: "backend", 99: None},
+    )
+
+    deltas, incomplete = _entry_deltas(None, after)
+
+    assert deltas["by_list"] == {"5": {"count": 1, "name": "Review", "is_final": False, "order": 3}}
+    assert deltas["by_priority"] == {"2": 1}
+    assert deltas["by_tag"] == {"7": {"count": 1, "name": "backend"}, "99": {"count": 1}}
+    assert incomplete == [("by_tag", "99")]
+
+
+def test_entry_deltas_of_deleted_card_are_negative():
+    before = CardStatsEntry(list_id=2, tags={7: "backend"}, lead_days=4.0, cycle_days=1.0)
+
+    deltas, incomplete = _entry_deltas(before, None)
+
+    assert deltas["by_list"] == {"2": {"count": -1}}
+    assert deltas["by_priority"] == {"none": -1}
+    assert deltas["by_tag"] == {"7": {"count": -1, "name": "backend"}}
+    assert (deltas["lead_time_sum"], deltas["cycle_time_count"]) == (-4.0, -1)
+    assert incomplete == []
+
+
+async def test_apply_card_change_rebuilds_unmaterialized_project():
+    session = make_session()
+    session.execute = AsyncMock(side_effect=[
+        _update_result(None),  # no project_stats row
+        MagicMock(),           # insert missing row
+        MagicMock(),           # row lock
+        _rows_result([]),      # aggregate statement
+        MagicMock(),           # upsert
+    ])
+    rules = ProjectStatsRules(session)
+
+    await rules.apply_card_change(1, None, CardStatsEntry(list_id=1, list_name="To Do"))
+
+    assert session.execute.await_count == 5
+    session.commit.assert_not_called()
+
+
+async def test_apply_card_change_unknown_tag_rebuilds():
+    session = make_session()
+    session.execute = AsyncMock(side_effect=[
+        _update_result(by_list={}, by_tag={"99": {"count": 1}}),  # created without a name
+        MagicMock(),                                               # insert missing row
+        MagicMock(),                                               # row lock
+        _rows_result([]),                                          # aggregate statement
+        MagicMock(),                                               # upsert
+    ])
+    rules = ProjectStatsRules(session)
+
+    before = CardStatsEntry(list_id=1)
+    after = CardStatsEntry(list_id=1, tags={99: None})
+    await rules.apply_card_change(1, before, after)
+
+    assert session.execute.await_count == 5
+
+
+async def test_apply_card_change_known_tag_by_id_keeps_row():
+    session = make_session()
+    session.execute.return_value = _update_result(
+        by_list={}, by_tag={"7": {"name": "backend", "count": 2}}
+    )
+    rules = ProjectStatsRules(session)
+
+    await rules.apply_card_change(1, CardStatsEntry(list_id=1), CardStatsEntry(list_id=1, tags={7: None}))
+
+    assert session.execute.await_count == 1
@@ -0,0 +1,116 @@
+"""
+Query budgets for the hot read endpoints.
+
+Each rules method behind a board/dashboard route must issue a fixed number of
+statements, no matter how many rows come back: a per-row query (N+1) makes
+the count grow with ``rows`` and fails here. Loader queries (selectinload)
+run inside those statements and show up at runtime in the X-DB-Queries
+header and the db_queries_per_request metric (app/core/metrics.py).
+"""
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from rules.card import CardRules
+from rules.dashboard import DashboardRules
+from rules.list import ListRules
+from app.test.rules.conftest import make_session, make_result
+
+ROWS = [1, 50]
+
+
+def _card(n):
+    project = SimpleNamespace(id=1, title="Projeto")
+    return SimpleNamespace(
+        id=n,
+        card_number=n,
+        title=f"Card {n}",
+        priority=None,
+        date=datetime.now() - timedelta(days=n % 3),
+        completed_at=None,
+        list_id=1,
+        list=SimpleNamespace(name="Doing", project=project),
+        user=None,
+        category=None,
+    )
+
+
+def _session(rows):
+    session = make_session()
+    cards = [_card(n) for n in range(1, rows + 1)]
+    result = make_result(scalar=cards[0], scalars_list=cards)
+    result.scalar.return_value = rows
+    session.execute = AsyncMock(return_value=result)
+    return session
+
+
+def _assert_budget(session, budget):
+    assert session.execute.await_count == budget, (
+        f"{session.execute.await_count} statements (budget: {budget})"
+    )
+
+
+@pytest.mark.parametrize("rows", ROWS)
+async def test_board_lists_budget(rows):
+    session = _session(rows)
+
+    await ListRules(session).get_lists_slim(project_id=1)
+
+    _assert_budget(session, 1)
+
+
+@pytest.mark.parametrize("rows", ROWS)
+async def test_cards_page_budget(rows):
+    session = _session(rows)
+
+    await ListRules(session).get_cards_for_list_paginated(list_id=1, page=1, limit=rows)
+
+    _assert_budget(session, 2)  # count + page
+
+
+@pytest.mark.parametrize("rows", ROWS)
+async def test_card_detail_budget(rows):
+    session = _session(rows)
+
+    await CardRules(session).get_card_by_id(card_id=1)
+
+    _assert_budget(session, 1)
+
+
+@pytest.mark.parametrize("rows", ROWS)
+async def test_card_search_budget(rows):
+    session = _session(rows)
+
+    await CardRules(session).search_cards(q="card", project_id=1)
+
+    _assert_budget(session, 1)
+
+
+@pytest.mark.parametrize("rows", ROWS)
+async def test_my_cards_budget(rows):
+    session = _session(rows)
+
+    response = await DashboardRules(session).get_my_cards(user_id=1)
+
+    assert len(response.assigned) == rows
+    _assert_budget(session, 2)  # assigned + pending approvals
+
+
+@pytest.mark.parametrize("rows", ROWS)
+async def test_my_day_budget(rows):
+    session = _session(rows)
+
+    await DashboardRules(session).get_my_day(user_id=1)
+
+    _assert_budget(session, 1)
+
+
+@pytest.mark.parametrize("rows", ROWS)
+async def test_pending_approvals_budget(rows):
+    session = _session(rows)
+
+    await DashboardRules(session).get_pending_approvals(user_id=1)
+
+    _assert_budget(session, 1)
@@ -1,5 +1,14 @@
 """Tests for app/core/security.py"""
-from core.security import generator_hash_password, verification_password
+import asyncio
+import threading
+
+import core.security as security
+from core.security import (
+    generator_hash_password,
+    generator_hash_password_async,
+    verification_password,
+    verification_password_async,
+)
 
 
 def test_hash_is_not_plaintext():
@@ -25,3 +34,36 @@ def test_different_hashes_same_password():
     assert h1 != h2
     assert verification_password("abc", h1) is True
     assert verification_password("abc", h2) is True
+
+
+# ── async variants (bcrypt worker pool) ───────────────────────────────────────
+
+async def test_async_hash_and_verify_round_trip():
+    hashed = await generator_hash_password_async("secret123")
+
+    assert await verification_password_async("secret123", hashed) is True
+    assert await verification_password_async("wrong", hashed) is False
+    assert verification_password("secret123", hashed) is True
+
+
+async def test_hash_pool_bounds_concurrency_and_reports_queue_depth(monkeypatch):
+    monkeypatch.setattr(security, "_HASH_WORKERS", 1)
+    monkeypatch.setattr(security, "_hash_slots", None)
+    release = threading.Event()
+
+    def slow_hash(password):
+        release.wait(timeout=5)
+        return password
+
+    tasks = [
+        asyncio.create_task(security._run_in_hash_pool(slow_hash, str(i))) for i in range(3)
+    ]
+    await asyncio.sleep(0.05)
+
+    stats = security.hash_pool_stats()
+    assert (stats["running"], stats["queued"]) == (1, 2)
+
+    release.set()
+    assert await asyncio.gather(*tasks) == ["0", "1", "2"]
+    assert security.hash_pool_stats()["queued"] == 0
+    assert security.hash_pool_stats()["running"] == 0
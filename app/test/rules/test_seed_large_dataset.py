@@ -0,0 +1,116 @@
+"""Tests for app/seed_large_dataset.py — synthetic data generation (no database)."""
+from collections import Counter
+from datetime import datetime
+
+import pytest
+
+from app.seed_large_dataset import TABLES, SeedPlan, generate, split_total, zipf_weights
+
+NOW = datetime(2026, 3, 1)
+ROLES = {"SuperAdmin": 1, "Admin": 2, "Leader": 3, "User": 4}
+
+
+def _plan(**overrides):
+    options = dict(users=40, projects=6, cards=3_000, batch_size=700, seed=7)
+    options.update(overrides)
+    return SeedPlan(**options)
+
+
+def _tables(plan, start_ids=None):
+    merged = {table: [] for table in TABLES}
+    batches = list(generate(plan, start_ids or {}, ROLES, [1, 2, 3], "hash", NOW))
+    for batch in batches:
+        for table, rows in batch.items():
+            merged[table].extend(rows)
+    return batches, {
+        table: [dict(zip(TABLES[table], row)) for row in rows] for table, rows in merged.items()
+    }
+
+
+@pytest.fixture(scope="module")
+def seeded():
+    return _tables(_plan())
+
+
+def test_split_total_is_exact_and_skewed():
+    counts = split_total(1_000, zipf_weights(10))
+
+    assert sum(counts) == 1_000
+    assert counts == sorted(counts, reverse=True)
+    assert counts[0] > 3 * counts[-1]
+
+
+def test_generates_the_requested_volume_in_batches(seeded):
+    batches, tables = seeded
+
+    assert len(tables["cards"]) == 3_000
+    assert len(tables["projects"]) == 6
+    assert len(tables["users"]) == 40
+    assert len(tables["lists"]) == 6 * 5
+    assert all(len(b["cards"]) <= 700 for b in batches)
+    for table in ("comments", "tasksCard", "tagCards", "approvers", "card_history", "card_dependencies"):
+        assert tables[table], table
+
+
+def test_same_seed_same_data_and_different_seed_differs(seeded):
+    _, tables = seeded
+
+    assert _tables(_plan())[1] == tables
+    assert _tables(_plan(seed=8))[1]["cards"] != tables["cards"]
+
+
+def test_ids_start_after_existing_rows_and_are_unique():
+    _, tables = _tables(_plan(cards=200), start_ids={"cards": 1_000, "users": 50})
+
+    card_ids = [c["id"] for c in tables["cards"]]
+    assert min(card_ids) == 1_001
+    assert len(set(card_ids)) == len(card_ids)
+    assert min(u["id"] for u in tables["users"]) == 51
+
+
+def test_foreign_keys_point_to_generated_rows(seeded):
+    _, tables = seeded
+    ids = {table: {row["id"] for row in rows} for table, rows in tables.items()}
+    members = {(m["projectId"], m["userId"]) for m in tables["projectUsers"]}
+    project_of_list = {lst["id"]: lst["projectId"] for lst in tables["lists"]}
+
+    for card in tables["cards"]:
+        assert card["listId"] in ids["lists"]
+        if card["userId"] is not None:
+            assert (project_of_list[card["listId"]], card["userId"]) in members
+    for table in ("tagCards", "comments", "approvers", "tasksCard", "card_history"):
+        assert {row["cardId"] for row in tables[table]} <= ids["cards"], table
+    assert {t["tagId"] for t in tables["tagCards"]} <= ids["tags"]
+    for dep in tables["card_dependencies"]:
+        assert dep["relatedCardId"] in ids["cards"]
+        assert dep["relatedCardId"] < dep["cardId"]
+
+
+def test_card_numbers_are_contiguous_per_project(seeded):
+    _, tables = seeded
+    project_of_list = {lst["id"]: lst["projectId"] for lst in tables["lists"]}
+    numbers = {}
+    for card in tables["cards"]:
+        numbers.setdefault(project_of_list[card["listId"]], []).append(card["cardNumber"])
+
+    for project_numbers in numbers.values():
+        assert project_numbers == list(range(1, len(project_numbers) + 1))
+    # Skew: the largest project holds far more cards than the smallest
+    sizes = sorted(len(n) for n in numbers.values())
+    assert sizes[-1] > 5 * sizes[0]
+
+
+def test_completed_cards_are_in_the_final_list_with_consistent_history(seeded):
+    _, tables = seeded
+    final_lists = {lst["id"] for lst in tables["lists"] if lst["isFinal"]}
+    moves = Counter(h["cardId"] for h in tables["card_history"] if h["action"] == "moved")
+    created = Counter(h["cardId"] for h in tables["card_history"] if h["action"] == "created")
+    order = {lst["id"]: lst["order"] for lst in tables["lists"]}
+
+    for card in tables["cards"]:
+        assert (card["completedAt"] is not None) == (card["listId"] in final_lists)
+        assert card["createdAt"] <= NOW
+        if card["completedAt"] is not None:
+            assert card["createdAt"] <= card["completedAt"] <= NOW
+        assert created[card["id"]] == 1
+        assert moves[card["id"]] == order[card["listId"]]
@@ -0,0 +1,207 @@
+"""Tests for app/core/slow_queries.py — slow query log and EXPLAIN capture."""
+import asyncio
+import json
+import logging
+import os
+from datetime import datetime
+from types import SimpleNamespace
+
+from sqlalchemy import Column, Integer, MetaData, Table, create_engine, event, select, text
+from sqlalchemy.util import greenlet_spawn
+
+import app.core.slow_queries as slow_queries
+
+
+def _records(caplog):
+    return [json.loads(r.getMessage()) for r in caplog.records if r.name == slow_queries.logger.name]
+
+
+def _context(**flags):
+    # Execution context of a compiled (non-textual) statement; flags override
+    return SimpleNamespace(**{"isinsert": False, "isupdate": False, "isdelete": False, "is_text": False, **flags})
+
+
+def _run(slow_log, statement, parameters=(), executemany=False, context=None):
+    # Runs the cursor hooks as the engine would for one query
+    conn = SimpleNamespace(info={})
+    context = context or _context()
+    slow_log.before_cursor_execute(conn, None, statement, parameters, context, executemany)
+    slow_log.after_cursor_execute(conn, None, statement, parameters, context, executemany)
+
+
+class FakeEngine:
+    """Async engine stand-in that records the statements of the EXPLAIN connection."""
+
+    def __init__(self, plan='[{"Plan": {"Node Type": "Seq Scan"}}]', error=None):
+        self.statements = []
+        self.plan = plan
+        self.error = error
+
+    def connect(self):
+        engine = self
+
+        class Conn:
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+            async def exec_driver_sql(self, statement, parameters=None):
+                engine.statements.append((statement, parameters))
+                if engine.error and statement.startswith("EXPLAIN"):
+                    raise engine.error
+                return SimpleNamespace(scalar=lambda: engine.plan)
+
+        return Conn()
+
+
+# ── redact ────────────────────────────────────────────────────────────────────
+
+def test_redact_masks_strings_and_keeps_ids_and_dates():
+    params = (7, "ana@example.com", None, True, datetime(2026, 1, 2, 3, 4), b"\x00\x01")
+
+    assert slow_queries.redact(params) == [
+        7, "<str len=15>", None, True, "2026-01-02T03:04:00", "<bytes len=2>",
+    ]
+    assert slow_queries.redact({"q": "%bug%", "limit": 10}) == {"q": "<str len=5>", "limit": 10}
+    assert slow_queries.redact([(1, "a"), (2, "bb")]) == [[1, "<str len=1>"], [2, "<str len=2>"]]
+
+
+# ── calling_rule ──────────────────────────────────────────────────────────────
+
+class FakeRules:
+    async def search(self):
+        return await greenlet_spawn(slow_queries.calling_rule)
+
+
+async def test_calling_rule_crosses_the_greenlet_boundary(monkeypatch):
+    monkeypatch.setattr(slow_queries, "_RULES_DIR", os.path.dirname(__file__))
+
+    assert await FakeRules().search() == "FakeRules.search"
+
+
+def test_calling_rule_is_none_outside_rules():
+    assert slow_queries.calling_rule() is None
+
+
+# ── SlowQueryLog ──────────────────────────────────────────────────────────────
+
+def test_fast_queries_are_not_logged(caplog):
+    slow_log = slow_queries.SlowQueryLog(FakeEngine(), threshold_ms=60_000)
+
+    with caplog.at_level(logging.WARNING):
+        _run(slow_log, "SELECT 1")
+
+    assert _records(caplog) == []
+
+
+def test_logs_slow_query_as_json_with_redacted_params(caplog):
+    slow_log = slow_queries.SlowQueryLog(FakeEngine(), threshold_ms=0)
+    before = slow_queries.SLOW_QUERIES.value()
+
+    with caplog.at_level(logging.WARNING):
+        _run(slow_log, "SELECT *\n  FROM users WHERE email = $1", ("ana@example.com",))
+
+    [record] = _records(caplog)
+    assert record["event"] == "slow_query"
+    assert record["statement"] == "SELECT * FROM users WHERE email = $1"
+    assert record["parameters"] == ["<str len=15>"]
+    assert record["ms"] >= 0
+    assert "plan" not in record
+    assert slow_queries.SLOW_QUERIES.value() == before + 1
+
+
+def test_hooks_on_a_real_engine(caplog):
+    engine = create_engine("sqlite://")
+    slow_queries.instrument_slow_queries(SimpleNamespace(sync_engine=engine), threshold_ms=0, explain=True)
+
+    with caplog.at_level(logging.WARNING), engine.connect() as conn:
+        conn.execute(text("SELECT :name"), {"name": "segredo"})
+
+    # No running event loop (sync engine): logged without a plan
+    [record] = _records(caplog)
+    assert record["parameters"] == ["<str len=7>"]
+    assert "plan" not in record
+
+
+async def test_explains_sampled_selects_with_analyze(caplog):
+    engine = FakeEngine()
+    slow_log = slow_queries.SlowQueryLog(engine, threshold_ms=0, explain=True, sample_rate=1.0)
+
+    with caplog.at_level(logging.WARNING):
+        _run(slow_log, "SELECT * FROM cards WHERE id = $1", (5,))
+        await asyncio.gather(*slow_log._tasks)
+
+    assert engine.statements[-1] == (
+        "EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) SELECT * FROM cards WHERE id = $1", (5,)
+    )
+    assert engine.statements[0][0].startswith("SET LOCAL statement_timeout")
+    [record] = _records(caplog)
+    assert record["plan"] == [{"Plan": {"Node Type": "Seq Scan"}}]
+
+
+async def test_writes_are_explained_without_analyze():
+    engine = FakeEngine()
+    slow_log = slow_queries.SlowQueryLog(engine, threshold_ms=0, explain=True)
+
+    _run(slow_log, "UPDATE cards SET title = $1", ("x",), context=_context(isupdate=True))
+    await asyncio.gather(*slow_log._tasks)
+
+    assert engine.statements[-1][0] == "EXPLAIN (FORMAT JSON) UPDATE cards SET title = $1"
+
+
+def test_can_analyze_uses_the_execution_context():
+    engine = create_engine("sqlite://")
+    contexts = []
+    event.listen(engine, "before_cursor_execute", lambda *args: contexts.append((args[2], args[4])))
+    table = Table("t", MetaData(), Column("id", Integer, primary_key=True))
+
+    with engine.begin() as conn:
+        table.create(conn)
+        cte = select(table.c.id).cte("ids")
+        conn.execute(select(cte.c.id))
+        conn.execute(table.insert().values(id=1))
+        conn.execute(table.update().values(id=2))
+        conn.execute(table.delete())
+        conn.execute(text("SELECT 1"))
+        conn.execute(text("UPDATE t SET id = 3"))
+
+    assert [slow_queries.can_analyze(s, c) for s, c in contexts[1:]] == [
+        True, False, False, False, True, False,
+    ]
+    assert contexts[1][0].lstrip().startswith("WITH")
+
+
+def test_locking_reads_are_not_analyzed():
+    for clause in ("FOR UPDATE", "FOR NO KEY UPDATE", "FOR SHARE", "for key share", "FOR UPDATE SKIP LOCKED"):
+        assert not slow_queries.can_analyze(f"SELECT * FROM cards WHERE id = $1 {clause}", _context())
+    assert slow_queries.can_analyze("SELECT * FROM cards WHERE format = $1", _context())
+
+
+async def test_explain_is_sampled_and_one_at_a_time():
+    engine = FakeEngine()
+    slow_log = slow_queries.SlowQueryLog(engine, threshold_ms=0, explain=True)
+
+    _run(slow_log, "SELECT 1")
+    _run(slow_log, "SELECT 2")  # first EXPLAIN still pending
+    await asyncio.gather(*slow_log._tasks)
+    slow_log.sample_rate = 0.0
+    _run(slow_log, "SELECT 3")
+
+    assert [s for s, _ in engine.statements if s.startswith("EXPLAIN")] == [
+        "EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) SELECT 1"
+    ]
+
+
+async def test_explain_failure_is_logged_and_releases_the_slot(caplog):
+    engine = FakeEngine(error=RuntimeError("boom"))
+    slow_log = slow_queries.SlowQueryLog(engine, threshold_ms=0, explain=True)
+
+    with caplog.at_level(logging.WARNING):
+        _run(slow_log, "SELECT 1")
+        await asyncio.gather(*slow_log._tasks)
+
+    [record] = _records(caplog)
+    assert record["plan_error"] == "RuntimeError"
+    assert slow_log._explaining is False
@@ -0,0 +1,79 @@
+"""Tests for app/rules/snapshot.py — SnapshotRules."""
+from datetime import date
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+from rules.snapshot import SnapshotRules
+from app.test.rules.conftest import make_session, make_result
+
+
+def _rows_result(rows):
+    r = MagicMock()
+    r.all.return_value = rows
+    return r
+
+
+def _list_row(project_id, list_id, cards, closed, points, remaining):
+    return SimpleNamespace(
+        project_id=project_id,
+        list_id=list_id,
+        cards=cards,
+        closed=closed,
+        points=points,
+        remaining=remaining,
+    )
+
+
+# ── take_snapshots ────────────────────────────────────────────────────────────
+
+async def test_take_snapshots_skips_when_lock_is_taken():
+    session = make_session()
+    session.execute.return_value = make_result(scalar=False)
+    rules = SnapshotRules(session)
+
+    count = await rules.take_snapshots(date(2024, 1, 1))
+
+    assert count == 0
+    assert session.execute.await_count == 1
+    session.rollback.assert_called_once()
+    session.commit.assert_not_called()
+
+
+async def test_take_snapshots_aggregates_per_project_and_upserts():
+    session = make_session()
+    session.execute = AsyncMock(side_effect=[
+        make_result(scalar=True),  # advisory lock
+        _rows_result([
+            _list_row(1, 10, cards=3, closed=0, points=5, remaining=5),
+            _list_row(1, 11, cards=2, closed=2, points=4, remaining=0),
+            _list_row(2, 20, cards=1, closed=0, points=1, remaining=1),
+        ]),
+        MagicMock(),               # upsert
+    ])
+    rules = SnapshotRules(session)
+
+    count = await rules.take_snapshots(date(2024, 1, 1))
+
+    assert count == 2
+    session.commit.assert_called_once()
+    params = session.execute.call_args_list[2].args[1]
+    assert params[0] == {
+        "project_id": 1,
+        "day": date(2024, 1, 1),
+        "remaining_points": 5,
+        "total_points": 9,
+        "open_cards": 3,
+        "closed_cards": 2,
+        "by_list": {"10": 3, "11": 2},
+    }
+    assert params[1]["by_list"] == {"20": 1}
+
+
+async def test_take_snapshots_without_cards_skips_upsert():
+    session = make_session()
+    session.execute = AsyncMock(side_effect=[make_result(scalar=True), _rows_result([])])
+    rules = SnapshotRules(session)
+
+    assert await rules.take_snapshots(date(2024, 1, 1)) == 0
+    assert session.execute.await_count == 2
+    session.commit.assert_called_once()
@@ -319,7 +319,7 @@ async def test_forgot_password_user_not_found_returns_silently():
     await rules.forgot_password("ghost@test.com")
 
 
-async def test_forgot_password_sends_email():
+async def test_forgot_password_enqueues_email():
     session = make_session()
     user = _make_user()
     session.execute.return_value = make_result(scalar=user)
@@ -327,9 +327,10 @@ async def test_forgot_password_sends_email():
     rules = UserRules(session)
     rules.token_service.create_reset_token = MagicMock(return_value="resettoken")
 
-    with patch("rules.user.send_email") as mock_email:
+    with patch("rules.user.EmailOutboxRules") as mock_outbox:
         await rules.forgot_password("test@test.com")
-    mock_email.assert_called_once()
+    mock_outbox.return_value.enqueue.assert_called_once()
+    session.commit.assert_called_once()
 
 
 # ── reset_password_with_token ─────────────────────────────────────────────────
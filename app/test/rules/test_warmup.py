@@ -0,0 +1,98 @@
+"""Tests for app/core/warmup.py — startup warm-up and readiness."""
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import core.warmup as warmup
+from app.test.rules.conftest import make_session
+
+
+class _FakeEngine:
+    def __init__(self, pool_size):
+        self.pool = SimpleNamespace(size=lambda: pool_size)
+        self.open = 0
+        self.peak = 0
+        self.executed = 0
+
+    def connect(self):
+        engine = self
+
+        class _Conn:
+            async def __aenter__(self):
+                engine.open += 1
+                engine.peak = max(engine.peak, engine.open)
+                await asyncio.sleep(0)
+                return self
+
+            async def __aexit__(self, *exc):
+                engine.open -= 1
+
+            async def execute(self, stmt):
+                engine.executed += 1
+
+        return _Conn()
+
+
+def _session_factory(session):
+    factory = MagicMock()
+    factory.return_value.__aenter__ = AsyncMock(return_value=session)
+    factory.return_value.__aexit__ = AsyncMock(return_value=False)
+    return factory
+
+
+# ── open_pool_connections ─────────────────────────────────────────────────────
+
+async def test_open_pool_connections_holds_them_together_up_to_pool_size():
+    engine = _FakeEngine(pool_size=3)
+
+    opened = await warmup.open_pool_connections(engine, 10)
+
+    assert opened == 3
+    assert engine.peak == 3
+    assert engine.executed == 3
+    assert engine.open == 0
+
+
+# ── warm_up ───────────────────────────────────────────────────────────────────
+
+async def test_warm_up_runs_every_hot_query(monkeypatch):
+    lists = MagicMock(get_lists_slim=AsyncMock(), get_cards_for_list_paginated=AsyncMock())
+    dashboard = MagicMock(get_my_cards=AsyncMock())
+    mappers = MagicMock()
+    monkeypatch.setattr(warmup, "ListRules", lambda session: lists)
+    monkeypatch.setattr(warmup, "DashboardRules", lambda session: dashboard)
+    monkeypatch.setattr(warmup, "configure_mappers", mappers)
+    session = make_session()
+
+    elapsed = await warmup.warm_up(_FakeEngine(2), _session_factory(session), 2)
+
+    assert elapsed >= 0
+    mappers.assert_called_once()
+    session.execute.assert_awaited_once()  # authenticated user lookup
+    lists.get_lists_slim.assert_awaited_once_with(-1)
+    lists.get_cards_for_list_paginated.assert_awaited_once_with(-1)
+    dashboard.get_my_cards.assert_awaited_once_with(-1)
+    session.rollback.assert_awaited_once()
+
+
+# ── warm_up_until_ready ───────────────────────────────────────────────────────
+
+async def test_ready_flips_only_after_a_successful_warm_up(monkeypatch):
+    state = SimpleNamespace(ready=False)
+    seen = []
+
+    async def flaky(engine, session_factory, connections):
+        seen.append(state.ready)
+        if len(seen) == 1:
+            raise ConnectionError("database is starting")
+        return 0.1
+
+    sleep = AsyncMock()
+    monkeypatch.setattr(warmup, "warm_up", flaky)
+    monkeypatch.setattr(warmup.asyncio, "sleep", sleep)
+
+    await warmup.warm_up_until_ready(state, None, None, 2)
+
+    assert seen == [False, False]
+    assert state.ready is True
+    sleep.assert_awaited_once_with(1.0)
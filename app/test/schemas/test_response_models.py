@@ -0,0 +1,64 @@
+"""
+Every JSON route must declare a response_model and keep the default
+response class, so FastAPI serializes the validated model straight to bytes
+(pydantic-core dump_json) instead of jsonable_encoder + json.dumps.
+"""
+from fastapi.datastructures import DefaultPlaceholder
+from fastapi.routing import APIRoute
+
+from api.routes import (
+    card_router,
+    category_router,
+    comments_router,
+    dashboard_router,
+    health_router,
+    list_router,
+    metrics_router,
+    project_router,
+    user_router,
+)
+
+_ROUTERS = [
+    card_router,
+    category_router,
+    comments_router,
+    dashboard_router,
+    health_router,
+    list_router,
+    metrics_router,
+    project_router,
+    user_router,
+]
+
+# Routes that answer with an empty (null) body on purpose
+_NO_BODY = {"add_card_dependency"}
+
+# Routes that answer with a non-JSON body (Prometheus text format)
+_NOT_JSON = {"metrics"}
+
+
+def _routes():
+    for module in _ROUTERS:
+        for route in module.router.routes:
+            if isinstance(route, APIRoute):
+                yield route
+
+
+def test_json_routes_declare_a_response_model():
+    missing = [
+        route.name
+        for route in _routes()
+        if route.status_code != 204
+        and route.name not in _NO_BODY | _NOT_JSON
+        and route.response_model is None
+    ]
+    assert missing == []
+
+
+def test_routes_keep_the_default_response_class():
+    custom = [
+        route.name
+        for route in _routes()
+        if not isinstance(route.response_class, DefaultPlaceholder)
+    ]
+    assert custom == []
@@ -0,0 +1,174 @@
+"""
+Output equivalence of the precompiled serializers (app/schemas/serializers.py)
+with pydantic's from_attributes validation + dump_json, on real ORM instances.
+"""
+import json
+from datetime import datetime
+
+import app.db.models.__all_models  # noqa: F401
+from app.db.models.approver_model import ApproverModel
+from app.db.models.card_model import CardModel
+from app.db.models.category_model import CategoryModel
+from app.db.models.comment_model import CommentModel
+from app.db.models.list_model import ListModel
+from app.db.models.project_model import ProjectModel
+from app.db.models.tag_card_model import TagCardModel
+from app.db.models.tag_model import TagModel
+from app.db.models.task_card_model import TaskCardModel
+from app.db.models.user_model import UserModel
+from app.schemas.card_schema import CardPageResponse, CardSchema
+from app.schemas.category_schema import CategorySchema
+from app.schemas.dashboard_schema import DashboardCardSchema, MyDayResponse
+from app.schemas.list_schema import ListSchemaSlim
+from app.schemas.serializers import (
+    card_page_to_json,
+    card_to_json,
+    construct,
+    json_response,
+    list_slim_to_json,
+    row_mapper,
+)
+from app.schemas.user_schema import UserSchemaBase
+from pydantic_core import to_json
+
+NOW = datetime(2026, 3, 14, 9, 26, 53, 589000)
+
+
+def _user(user_id=7):
+    return UserModel(
+        id=user_id,
+        username=f"user{user_id}",
+        firstName="Ana",
+        lastName="Souza",
+        email=f"user{user_id}@example.com",
+        isAdmin=False,
+    )
+
+
+def _card(card_id=1, full=True):
+    card = CardModel(
+        id=card_id,
+        card_number=card_id,
+        title=f"Card {card_id} — ação",
+        list_id=3,
+        user_id=7,
+        priority=2,
+        story_points=5,
+        blocked=False,
+        sort_order=card_id,
+        date=NOW,
+        created_at=NOW,
+        updated_at=None,
+    )
+    if full:
+        card.user = _user()
+        card.category = CategoryModel(id=1, name="Bug")
+        card.tag_cards = [
+            TagCardModel(id=11, cardId=card_id, tagId=4, tag=TagModel(id=4, name="backend")),
+        ]
+        card.comments = [
+            CommentModel(id=21, description="Olá", created_at=NOW, user_id=7, user=_user()),
+        ]
+        card.approvers = [ApproverModel(id=31, environment="prod", user_id=8, user=_user(8))]
+        card.tasks_card = [TaskCardModel(id=41, title="Tarefa", date="2026-03-15", completed=True)]
+    return card
+
+
+def _pydantic_json(schema, obj):
+    return schema.model_validate(obj).model_dump_json(by_alias=True)
+
+
+# ── row_mapper ────────────────────────────────────────────────────────────────
+
+
+def test_card_matches_from_attributes_byte_for_byte():
+    card = _card()
+
+    assert to_json(card_to_json(card)).decode() == _pydantic_json(CardSchema, card)
+
+
+def test_card_without_relationships_matches():
+    card = _card(full=False)
+
+    assert to_json(card_to_json(card)).decode() == _pydantic_json(CardSchema, card)
+
+
+def test_camel_case_orm_attributes_are_resolved_like_from_attributes():
+    mapped = row_mapper(UserSchemaBase)(_user())
+
+    assert mapped["firstName"] == "Ana"
+    assert mapped["isAdmin"] is False
+
+
+def test_list_slim_matches():
+    lst = ListModel(id=3, name="Doing", order=1, is_final=False, project_id=9)
+
+    assert to_json(list_slim_to_json(lst)).decode() == _pydantic_json(ListSchemaSlim, lst)
+
+
+def test_card_page_matches_card_page_response():
+    cards = [_card(1), _card(2, full=False)]
+    page = {"cards": cards, "total": 5, "page": 1, "has_more": True}
+
+    expected = CardPageResponse.model_validate(page).model_dump(mode="json", by_alias=True)
+    assert json.loads(to_json(card_page_to_json(page))) == expected
+
+
+def test_plain_objects_fall_back_to_instance_attributes():
+    class Row:
+        def __init__(self, **kwargs):
+            self.__dict__.update(kwargs)
+
+    mapper = row_mapper(CategorySchema)
+
+    assert mapper(Row(id=1, name="Bug")) == {"id": 1, "name": "Bug"}
+    assert mapper(Row(id=2, name="Feature")) == {"id": 2, "name": "Feature"}
+
+
+# ── construct ─────────────────────────────────────────────────────────────────
+
+
+def test_construct_builds_instances_without_validation():
+    assert construct(UserSchemaBase, None) is None
+
+    user = construct(UserSchemaBase, _user())
+
+    assert isinstance(user, UserSchemaBase)
+    assert user.model_dump_json(by_alias=True) == _pydantic_json(UserSchemaBase, _user())
+
+
+def test_constructed_dashboard_card_dumps_like_validated_one():
+    card = _card()
+    fields = dict(
+        id=card.id,
+        card_number=card.card_number,
+        title=card.title,
+        priority=card.priority,
+        date=card.date,
+        completed_at=card.completed_at,
+        list_id=card.list_id,
+        list_name="Doing",
+        project_id=9,
+        project_title="Projeto",
+    )
+    validated = DashboardCardSchema(**fields, user=card.user, category=card.category)
+    constructed = DashboardCardSchema.model_construct(
+        **fields,
+        user=construct(UserSchemaBase, card.user),
+        category=construct(CategorySchema, card.category),
+    )
+
+    response = MyDayResponse(due_today=[constructed], overdue=[])
+    assert response.due_today[0] is constructed
+    assert constructed.model_dump_json(by_alias=True) == validated.model_dump_json(by_alias=True)
+
+
+# ── json_response ─────────────────────────────────────────────────────────────
+
+
+def test_json_response_renders_bytes():
+    response = json_response({"a": NOW}, status_code=201)
+
+    assert response.status_code == 201
+    assert response.media_type == "application/json"
+    assert response.body == b'{"a":"2026-03-14T09:26:53.589000"}'
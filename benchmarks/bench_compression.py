@@ -0,0 +1,86 @@
+"""
+Benchmark: níveis de compressão (gzip e brotli) para as respostas da API.
+
+Gera payloads JSON no formato das respostas reais (cards camelCase de
+/dashboard/my-cards e listas com cards de /projects/{id}/lists) e mede, para
+cada nível, a taxa de compressão e o tempo de compressão. Foi usado para
+escolher COMPRESSION_GZIP_LEVEL, COMPRESSION_BROTLI_QUALITY e
+COMPRESSION_MIN_SIZE. Não acessa o banco.
+
+Uso (a partir do diretório Back-end/):
+    python -m benchmarks.bench_compression --cards 2000
+"""
+import argparse
+import json
+import random
+import statistics
+import time
+import zlib
+
+import brotli
+
+
+def _card(rnd: random.Random, n: int) -> dict:
+    return {
+        "id": n,
+        "cardNumber": n,
+        "title": f"Card {n} - {rnd.choice(['Fix', 'Add', 'Refactor', 'Review'])} "
+        f"{rnd.choice(['login', 'board', 'dashboard', 'export', 'email'])}",
+        "priority": rnd.choice([None, 1, 2, 3, 4, 5]),
+        "date": f"2024-{rnd.randint(1, 12):02d}-{rnd.randint(1, 28):02d}T00:00:00",
+        "completedAt": None,
+        "listId": rnd.randint(1, 5),
+        "listName": rnd.choice(["Backlog", "To Do", "Doing", "Review", "Done"]),
+        "projectId": 1,
+        "projectTitle": "Projeto TCC",
+        "user": {
+            "id": rnd.randint(1, 20),
+            "firstName": "Maria",
+            "lastName": "Silva",
+            "email": "maria.silva@example.com",
+            "username": "maria.silva",
+        },
+        "category": {"id": 1, "name": "Feature", "color": "#3366ff"},
+    }
+
+
+def _payloads(cards: int) -> dict[str, bytes]:
+    rnd = random.Random(7)
+    all_cards = [_card(rnd, n) for n in range(1, cards + 1)]
+    return {
+        "small": json.dumps(all_cards[:1]).encode(),
+        "page-20": json.dumps(all_cards[:20]).encode(),
+        f"cards-{cards}": json.dumps(all_cards).encode(),
+    }
+
+
+def _time(fn, body: bytes, runs: int) -> tuple[float, int]:
+    timings = []
+    size = 0
+    for _ in range(runs):
+        started = time.perf_counter()
+        size = len(fn(body))
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings), size
+
+
+def main(cards: int, runs: int) -> None:
+    codecs = {f"gzip-{level}": (lambda b, l=level: zlib.compress(b, l)) for level in (1, 4, 5, 6, 9)}
+    codecs.update(
+        {f"br-{q}": (lambda b, q=q: brotli.compress(b, quality=q)) for q in (1, 3, 4, 5, 6, 11)}
+    )
+
+    for name, body in _payloads(cards).items():
+        print(f"\n{name}: {len(body)} bytes")
+        for codec, fn in codecs.items():
+            ms, size = _time(fn, body, runs)
+            print(f"  {codec:<8} {size:>9} bytes  ratio={len(body) / size:5.1f}x  {ms:7.2f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--cards", type=int, default=2000)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    main(args.cards, args.runs)
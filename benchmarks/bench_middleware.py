@@ -0,0 +1,142 @@
+"""
+Benchmark: overhead por requisição do middleware de cabeçalhos de segurança.
+
+Compara uma aplicação Starlette mínima sem middleware, com a implementação
+anterior (BaseHTTPMiddleware, reproduzida em _LegacySecurityHeaders) e com o
+middleware ASGI puro de app/core/middleware.py. As requisições são feitas
+chamando a aplicação ASGI diretamente (sem servidor nem rede), então a diferença
+medida é apenas a do middleware. Também mede o tempo até o primeiro pedaço de
+uma resposta em streaming. Não acessa o banco.
+
+Uso (a partir do diretório Back-end/):
+    python -m benchmarks.bench_middleware --requests 20000
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import JSONResponse, StreamingResponse
+from starlette.routing import Route
+
+from app.core.middleware import SecurityHeadersMiddleware
+
+STREAM_CHUNKS = 5
+STREAM_DELAY = 0.02
+
+
+class _LegacySecurityHeaders(BaseHTTPMiddleware):
+    """A implementação anterior, que ficava em app/main.py."""
+
+    async def dispatch(self, request: Request, call_next):
+        response = await call_next(request)
+        response.headers["X-Content-Type-Options"] = "nosniff"
+        response.headers["X-Frame-Options"] = "DENY"
+        response.headers["X-XSS-Protection"] = "1; mode=block"
+        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
+        return response
+
+
+async def _json(request):
+    return JSONResponse({"ok": True})
+
+
+async def _stream(request):
+    async def chunks():
+        for i in range(STREAM_CHUNKS):
+            yield f"data: {i}\n\n".encode()
+            await asyncio.sleep(STREAM_DELAY)
+
+    return StreamingResponse(chunks(), media_type="text/event-stream")
+
+
+def _build(middleware: list[Middleware]) -> Starlette:
+    return Starlette(
+        routes=[Route("/json", _json), Route("/stream", _stream)], middleware=middleware
+    )
+
+
+def _scope(path: str) -> dict:
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 1234),
+        "server": ("bench", 80),
+    }
+
+
+async def _request(app, path: str, on_message=None) -> None:
+    sent = False
+
+    async def receive():
+        nonlocal sent
+        if not sent:
+            sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await asyncio.Event().wait()  # sem desconexão durante a resposta
+
+    async def send(message):
+        if on_message is not None:
+            on_message(message)
+
+    await app(_scope(path), receive, send)
+
+
+async def _per_request(app, requests: int) -> float:
+    for _ in range(200):  # aquecimento
+        await _request(app, "/json")
+    started = time.perf_counter()
+    for _ in range(requests):
+        await _request(app, "/json")
+    return (time.perf_counter() - started) / requests * 1e6
+
+
+async def _first_chunk(app) -> float:
+    started = time.perf_counter()
+    first = None
+
+    def on_message(message):
+        nonlocal first
+        if first is None and message["type"] == "http.response.body" and message.get("body"):
+            first = time.perf_counter() - started
+
+    await _request(app, "/stream", on_message)
+    return first * 1000
+
+
+async def main(requests: int, rounds: int) -> None:
+    variants = {
+        "none": _build([]),
+        "base-http": _build([Middleware(_LegacySecurityHeaders)]),
+        "pure-asgi": _build([Middleware(SecurityHeadersMiddleware)]),
+    }
+    for name, app in variants.items():
+        timings = [await _per_request(app, requests) for _ in range(rounds)]
+        await _first_chunk(app)  # aquecimento
+        first = await _first_chunk(app)
+        print(
+            f"{name:<10} {statistics.median(timings):7.1f} µs/req  "
+            f"first stream chunk={first:6.1f} ms (stream total ≈ "
+            f"{STREAM_CHUNKS * STREAM_DELAY * 1000:.0f} ms)"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=20_000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.requests, args.rounds))
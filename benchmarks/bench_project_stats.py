@@ -0,0 +1,194 @@
+"""
+Benchmark: latência de DashboardRules.get_project_stats em um projeto grande.
+
+Compara a implementação anterior (cinco consultas sequenciais, reproduzida em
+_legacy_project_stats), a consulta única usada na reconstrução (project_stats_stmt)
+e a leitura da linha materializada em project_stats. Cria um projeto sintético no
+banco LOCAL (TEST_MODE=True) e o remove ao final.
+
+Uso (a partir do diretório Back-end/):
+    python -m benchmarks.bench_project_stats --cards 100000 --runs 20
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import delete, func, insert, select
+
+import app.db.models.__all_models  # noqa: F401
+from app.db.conection import Session, engine
+from app.db.models.card_history_model import CardHistoryModel
+from app.db.models.card_model import CardModel
+from app.db.models.list_model import ListModel
+from app.db.models.project_model import ProjectModel
+from app.db.models.tag_card_model import TagCardModel
+from app.db.models.tag_model import TagModel
+from app.generate_table import _guard_against_production
+from app.rules.dashboard import DashboardRules
+from app.rules.project_stats import ProjectStatsRules, project_stats_stmt
+
+CHUNK = 5_000
+
+
+async def _seed(cards: int, seed: int) -> int:
+    rnd = random.Random(seed)
+    now = datetime.utcnow()
+
+    async with Session() as session:
+        project = ProjectModel(title=f"bench-stats-{seed}", description="benchmark")
+        session.add(project)
+        await session.flush()
+
+        lists = [
+            ListModel(name=name, order=i, is_final=i == 4, project_id=project.id)
+            for i, name in enumerate(["Backlog", "To Do", "Doing", "Review", "Done"])
+        ]
+        tags = [TagModel(name=f"tag-{i}", projectId=project.id) for i in range(20)]
+        session.add_all(lists + tags)
+        await session.flush()
+
+        for offset in range(0, cards, CHUNK):
+            rows = []
+            for n in range(offset, min(offset + CHUNK, cards)):
+                lst = rnd.choice(lists)
+                created = now - timedelta(days=rnd.randint(1, 365))
+                rows.append({
+                    "card_number": n + 1,
+                    "title": f"Card {n + 1}",
+                    "list_id": lst.id,
+                    "priority": rnd.choice([None, 1, 2, 3, 4, 5]),
+                    "created_at": created,
+                    "completed_at": (
+                        created + timedelta(days=rnd.randint(0, 30)) if lst.is_final else None
+                    ),
+                })
+            ids = (
+                await session.execute(insert(CardModel).returning(CardModel.id), rows)
+            ).scalars().all()
+
+            await session.execute(
+                insert(TagCardModel),
+                [{"cardId": cid, "tagId": rnd.choice(tags).id} for cid in ids],
+            )
+            await session.execute(
+                insert(CardHistoryModel),
+                [
+                    {
+                        "card_id": cid,
+                        "action": "moved",
+                        "old_value": "To Do",
+                        "new_value": "Doing",
+                        "created_at": now - timedelta(days=rnd.randint(0, 30)),
+                    }
+                    for cid in ids
+                    if rnd.random() < 0.5
+                ],
+            )
+        await session.commit()
+        return project.id
+
+
+async def _cleanup(project_id: int) -> None:
+    async with Session() as session:
+        card_ids = (
+            select(CardModel.id)
+            .join(ListModel, ListModel.id == CardModel.list_id)
+            .where(ListModel.project_id == project_id)
+        )
+        await session.execute(delete(CardHistoryModel).where(CardHistoryModel.card_id.in_(card_ids)))
+        await session.execute(delete(TagCardModel).where(TagCardModel.cardId.in_(card_ids)))
+        await session.execute(delete(CardModel).where(CardModel.id.in_(card_ids)))
+        await session.execute(delete(TagModel).where(TagModel.projectId == project_id))
+        await session.execute(delete(ListModel).where(ListModel.project_id == project_id))
+        await session.execute(delete(ProjectModel).where(ProjectModel.id == project_id))
+        await session.commit()
+
+
+async def _legacy_project_stats(session, project_id: int) -> None:
+    """As cinco consultas sequenciais usadas antes da consulta única."""
+    await session.execute(
+        select(ListModel.name, ListModel.is_final, func.count(CardModel.id))
+        .join(CardModel, CardModel.list_id == ListModel.id)
+        .where(ListModel.project_id == project_id)
+        .group_by(ListModel.id, ListModel.name, ListModel.is_final, ListModel.order)
+        .order_by(ListModel.order)
+    )
+    await session.execute(
+        select(CardModel.priority, func.count(CardModel.id))
+        .join(ListModel, ListModel.id == CardModel.list_id)
+        .where(ListModel.project_id == project_id)
+        .group_by(CardModel.priority)
+    )
+    await session.execute(
+        select(TagModel.name, func.count(TagCardModel.cardId))
+        .join(TagCardModel, TagCardModel.tagId == TagModel.id)
+        .join(CardModel, CardModel.id == TagCardModel.cardId)
+        .join(ListModel, ListModel.id == CardModel.list_id)
+        .where(ListModel.project_id == project_id)
+        .group_by(TagModel.id, TagModel.name)
+    )
+    await session.execute(
+        select(func.avg(func.extract("epoch", CardModel.completed_at - CardModel.created_at)))
+        .join(ListModel, ListModel.id == CardModel.list_id)
+        .where(ListModel.project_id == project_id, CardModel.completed_at.isnot(None))
+    )
+    first_moved = (
+        select(CardHistoryModel.card_id, func.min(CardHistoryModel.created_at).label("first_moved"))
+        .where(CardHistoryModel.action == "moved")
+        .group_by(CardHistoryModel.card_id)
+        .subquery()
+    )
+    await session.execute(
+        select(func.avg(func.extract("epoch", CardModel.completed_at - first_moved.c.first_moved)))
+        .join(ListModel, ListModel.id == CardModel.list_id)
+        .join(first_moved, first_moved.c.card_id == CardModel.id)
+        .where(ListModel.project_id == project_id, CardModel.completed_at.isnot(None))
+    )
+
+
+async def _time(label: str, runs: int, fn) -> None:
+    timings = []
+    for _ in range(runs):
+        async with Session() as session:
+            started = time.perf_counter()
+            await fn(session)
+            timings.append((time.perf_counter() - started) * 1000)
+    timings.sort()
+    print(
+        f"{label:<12} median={statistics.median(timings):8.1f} ms  "
+        f"p95={timings[int(len(timings) * 0.95) - 1]:8.1f} ms  min={timings[0]:8.1f} ms"
+    )
+
+
+async def main(cards: int, runs: int, seed: int) -> None:
+    print(f"Populando projeto com {cards} cards...")
+    project_id = await _seed(cards, seed)
+    try:
+        # Aquecimento (cache do Postgres e do compilador do SQLAlchemy)
+        async with Session() as session:
+            await _legacy_project_stats(session, project_id)
+            await ProjectStatsRules(session).rebuild(project_id)
+            await session.commit()
+
+        await _time("before", runs, lambda s: _legacy_project_stats(s, project_id))
+        await _time("single", runs, lambda s: s.execute(project_stats_stmt(project_id)))
+        await _time(
+            "materialized", runs, lambda s: DashboardRules(s).get_project_stats(project_id)
+        )
+    finally:
+        await _cleanup(project_id)
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--cards", type=int, default=100_000)
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    _guard_against_production()
+    asyncio.run(main(args.cards, args.runs, args.seed))
@@ -0,0 +1,464 @@
+"""
+Benchmark: funções quentes da camada de regras, com baseline e limite de regressão.
+
+Casos medidos:
+
+- burndown:         DashboardRules.get_burndown sobre as linhas de cards de um projeto;
+- dashboard_card:   DashboardRules._to_dashboard_card para cada card de uma lista;
+- update_card:      CardRules.update_card com título, data, tarefas e aprovadores
+                    alterados (detecção de mudanças, histórico e diff das coleções);
+- card_schema_list: validação + serialização de list[CardSchema] a partir de cards
+                    ORM, o caminho do response_model das rotas de cards;
+- jwt:              TokenService.create_access_token + jwt.decode (get_current_user).
+
+Sem --db, o banco é substituído por uma sessão falsa que devolve linhas prontas e
+mede-se só o trabalho em Python (o burndown usa a estratégia "python"). Com --db,
+burndown e update_card rodam contra o Postgres LOCAL (TEST_MODE=True), no projeto
+com mais cards (ex.: os dados de app.seed_large_dataset) e com a BURNDOWN_STRATEGY
+configurada; update_card roda dentro de uma transação desfeita ao final.
+
+Cada caso roda uma vez de aquecimento e depois --rounds vezes; o relatório mostra
+min, mediana, média e desvio por rodada (ms), com o coletor de lixo desligado
+durante as rodadas. --save grava min e mediana de cada caso em
+benchmarks/baselines/bench_rules.json (fora do git). Nas execuções seguintes, um valor
+acima de baseline × (1 + --threshold) é regressão e o script termina com código 1.
+Compara-se o mínimo por padrão (--stat), o menos sensível a ruído da máquina. Os
+números só são comparáveis na mesma máquina e no mesmo modo (com ou sem --db): com
+baseline de outro ambiente a comparação é ignorada. Grave a baseline antes da mudança.
+
+Uso (a partir do diretório Back-end/):
+    python -m benchmarks.bench_rules --save
+    python -m benchmarks.bench_rules --threshold 0.2
+    python -m benchmarks.bench_rules --db --rounds 20
+"""
+import argparse
+import asyncio
+import gc
+import inspect
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+from collections import namedtuple
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Callable
+
+from jose import jwt
+from pydantic import TypeAdapter
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import app.db.models.__all_models  # noqa: F401
+from app.core.auth import TokenService
+from app.core.configs import settings
+from app.db.models.approver_model import ApproverModel
+from app.db.models.card_model import CardModel
+from app.db.models.list_model import ListModel
+from app.db.models.project_model import ProjectModel
+from app.db.models.task_card_model import TaskCardModel
+from app.rules.card import CardRules
+from app.rules.dashboard import DashboardRules
+from app.schemas.approver_schema import ApproverSchemaBase
+from app.schemas.card_schema import CardSchema, CardSchemaUp
+from app.schemas.tasks_card_schema import TaskCardSchemaBase
+from benchmarks.bench_serialization import build_orm_cards
+
+BASELINE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "baselines", "bench_rules.json"
+)
+BURNDOWN_DAYS = 90
+NOW = datetime(2026, 1, 1, 12, 0)
+
+BurndownRow = namedtuple("BurndownRow", "created_at completed_at story_points")
+
+
+@dataclass
+class Case:
+    name: str
+    run: Callable  # recebe o retorno de setup; síncrona ou assíncrona
+    setup: Callable = lambda: None  # fora da medição
+    teardown: Callable = lambda state: None
+
+
+class _Result:
+    def __init__(self, value=None, rows=()):
+        self.value = value
+        self.rows = rows
+
+    def all(self):
+        return self.rows
+
+    def scalars(self):
+        return self
+
+    def unique(self):
+        return self
+
+    def one_or_none(self):
+        return self.value
+
+    def scalar_one_or_none(self):
+        return self.value
+
+    def scalar(self):
+        return None
+
+
+class _FakeSession:
+    """AsyncSession que devolve sempre o mesmo resultado, sem custo de I/O nem de mock."""
+
+    def __init__(self, value=None, rows=()):
+        self.result = _Result(value, rows)
+
+    async def execute(self, statement):
+        return self.result
+
+    def add(self, instance):
+        pass
+
+    async def flush(self):
+        pass
+
+    async def commit(self):
+        pass
+
+    async def refresh(self, instance):
+        pass
+
+
+async def _maybe_await(value):
+    return await value if inspect.isawaitable(value) else value
+
+
+async def measure(case: Case, rounds: int) -> dict:
+    """Tempos de ``rounds`` rodadas (ms), após uma rodada de aquecimento."""
+    timings = []
+    # Como o --benchmark-disable-gc do pytest-benchmark: pausas do coletor distorcem rodadas
+    gc.collect()
+    gc.disable()
+    try:
+        for i in range(rounds + 1):
+            state = await _maybe_await(case.setup())
+            try:
+                started = time.perf_counter()
+                await _maybe_await(case.run(state))
+                elapsed = (time.perf_counter() - started) * 1000
+            finally:
+                await _maybe_await(case.teardown(state))
+            if i:
+                timings.append(elapsed)
+    finally:
+        gc.enable()
+    return {
+        "rounds": rounds,
+        "min": min(timings),
+        "median": statistics.median(timings),
+        "mean": statistics.fmean(timings),
+        "stddev": statistics.stdev(timings) if len(timings) > 1 else 0.0,
+    }
+
+
+def compare(results: dict, baseline: dict, threshold: float, stat: str = "min") -> list[str]:
+    """Casos cujo ``stat`` (min ou median) passou de baseline × (1 + threshold)."""
+    cases = baseline.get("cases", {})
+    return [
+        name
+        for name, stats in results.items()
+        if name in cases and stats[stat] > cases[name][stat] * (1 + threshold)
+    ]
+
+
+def _environment(db: bool = False) -> dict:
+    return {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "node": platform.node(),
+        "mode": "db" if db else "offline",
+    }
+
+
+def format_report(
+    results: dict, baseline: dict | None, regressions: list[str], stat: str = "min"
+) -> str:
+    cases = (baseline or {}).get("cases", {})
+    width = max(len(name) for name in results)
+    lines = [
+        f"{'caso':<{width}} {'rodadas':>7} {'min':>9} {'mediana':>9} {'média':>9} {'desvio':>9}"
+        + (f" {'base ' + stat:>11} {'Δ':>7}" if cases else "")
+    ]
+    for name, stats in results.items():
+        line = (
+            f"{name:<{width}} {stats['rounds']:>7} {stats['min']:>9.3f} {stats['median']:>9.3f}"
+            f" {stats['mean']:>9.3f} {stats['stddev']:>9.3f}"
+        )
+        if name in cases:
+            before = cases[name][stat]
+            line += f" {before:>11.3f} {(stats[stat] - before) / before:>+7.0%}"
+            if name in regressions:
+                line += "  REGRESSÃO"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+# ── Dados sintéticos ──────────────────────────────────────────────────────────
+
+def build_burndown_rows(cards: int, seed: int = 42) -> list[BurndownRow]:
+    """Cards de um projeto criados no último ano; ~60% concluídos."""
+    rnd = random.Random(seed)
+    rows = []
+    for _ in range(cards):
+        created = NOW - timedelta(minutes=rnd.randrange(365 * 24 * 60))
+        completed = None
+        if rnd.random() < 0.6:
+            completed = min(created + timedelta(hours=rnd.randrange(1, 60 * 24)), NOW)
+        rows.append(BurndownRow(created, completed, rnd.choice([None, 1, 2, 3, 5, 8])))
+    return rows
+
+
+def build_board_cards(cards: int) -> list[CardModel]:
+    """Cards ORM de build_orm_cards ligados a uma lista e a um projeto."""
+    project = ProjectModel(id=1, title="Projeto")
+    lst = ListModel(id=1, name="Doing", order=1, is_final=False, project_id=1)
+    lst.project = project
+    rows = build_orm_cards(cards)
+    for card in rows:
+        card.list = lst
+    return rows
+
+
+def build_update_card(tasks: int, approvers: int, seed: int = 42) -> CardModel:
+    rnd = random.Random(seed)
+    card = CardModel(
+        id=1, card_number=1, title="Título", description="Descrição", list_id=1,
+        priority=2, date=NOW, created_at=NOW - timedelta(days=10), completed_at=None,
+        story_points=3, user_id=1,
+    )
+    card.tag_cards = []
+    card.tasks_card = [
+        TaskCardModel(id=n, title=f"Tarefa {n}", completed=rnd.random() < 0.5, cardId=1)
+        for n in range(1, tasks + 1)
+    ]
+    card.approvers = [
+        ApproverModel(id=n, environment="homolog", user_id=n, card_id=1)
+        for n in range(1, approvers + 1)
+    ]
+    return card
+
+
+def update_payload(card: CardModel) -> CardSchemaUp:
+    """Edição típica do modal do card: mantém 3/4 das tarefas, conclui metade delas,
+    adiciona 5 novas e troca o ambiente dos aprovadores."""
+    kept = card.tasks_card[: max(len(card.tasks_card) * 3 // 4, 1)]
+    return CardSchemaUp(
+        title=f"{card.title} (editado)",
+        description="Descrição revisada",
+        date=(card.date or NOW) + timedelta(days=1),
+        tasks_card=[
+            TaskCardSchemaBase(id=t.id, title=t.title, completed=not t.completed if i % 2 else None)
+            for i, t in enumerate(kept)
+        ]
+        + [TaskCardSchemaBase(title=f"Nova tarefa {n}") for n in range(5)],
+        approvers=[
+            ApproverSchemaBase(id=a.id, environment="produção", user_id=a.user_id)
+            for a in card.approvers
+        ],
+    )
+
+
+# ── Casos ─────────────────────────────────────────────────────────────────────
+
+def offline_cases(
+    cards: int, burndown_cards: int, updates: int, tasks: int, tokens: int
+) -> list[Case]:
+    burndown_rows = build_burndown_rows(burndown_cards)
+    end = NOW.date()
+    start = end - timedelta(days=BURNDOWN_DAYS - 1)
+    board = build_board_cards(cards)
+    dashboard = DashboardRules(_FakeSession())
+    adapter = TypeAdapter(list[CardSchema])
+    token_service = TokenService()
+
+    def burndown(_):
+        # A sessão falsa só atende a varredura em Python
+        strategy, settings.BURNDOWN_STRATEGY = settings.BURNDOWN_STRATEGY, "python"
+        try:
+            return DashboardRules(_FakeSession(rows=burndown_rows)).get_burndown(1, start, end)
+        finally:
+            settings.BURNDOWN_STRATEGY = strategy
+
+    def update_setup():
+        edits = []
+        for n in range(updates):
+            card = build_update_card(tasks, approvers=5, seed=n)
+            edits.append((card, update_payload(card)))
+        return edits
+
+    async def update_cards(edits):
+        for card, payload in edits:
+            await CardRules(_FakeSession(card)).update_card(card.id, payload, user_id=1)
+
+    def jwt_roundtrip(_):
+        for n in range(tokens):
+            token = token_service.create_access_token(sub=n)
+            jwt.decode(
+                token,
+                settings.JWT_SECRET,
+                algorithms=[settings.ALGORITHM],
+                options={"verify_aud": False},
+            )
+
+    return [
+        Case(f"burndown[{burndown_cards}x{BURNDOWN_DAYS}d]", burndown),
+        Case(
+            f"dashboard_card[{cards}]",
+            lambda _: [dashboard._to_dashboard_card(c) for c in board],
+        ),
+        Case(f"update_card[{updates}x{tasks} tarefas]", update_cards, setup=update_setup),
+        Case(
+            f"card_schema_list[{cards}]",
+            lambda _: adapter.dump_json(adapter.validate_python(board), by_alias=True),
+        ),
+        Case(f"jwt[{tokens}]", jwt_roundtrip),
+    ]
+
+
+async def db_cases(project_id: int | None) -> list[Case]:
+    from app.db.conection import Session, engine
+
+    async with Session() as session:
+        if project_id is None:
+            project_id = (
+                await session.execute(
+                    select(ListModel.project_id)
+                    .join(CardModel, CardModel.list_id == ListModel.id)
+                    .group_by(ListModel.project_id)
+                    .order_by(func.count().desc())
+                    .limit(1)
+                )
+            ).scalar_one()
+        card_id = (
+            await session.execute(
+                select(CardModel.id)
+                .join(ListModel, ListModel.id == CardModel.list_id)
+                .where(ListModel.project_id == project_id)
+                .order_by(CardModel.id)
+                .limit(1)
+            )
+        ).scalar_one()
+        card = await CardRules(session)._get_card_or_404(card_id)
+        payload = update_payload(card)
+
+    end = date.today()
+    start = end - timedelta(days=BURNDOWN_DAYS - 1)
+
+    async def burndown(_):
+        async with Session() as session:
+            await DashboardRules(session).get_burndown(project_id, start, end)
+
+    async def update_setup():
+        # commit() do update_card vira um savepoint; a transação externa é desfeita
+        conn = await engine.connect()
+        transaction = await conn.begin()
+        return conn, transaction, AsyncSession(bind=conn, join_transaction_mode="create_savepoint")
+
+    async def update_teardown(state):
+        conn, transaction, session = state
+        await session.close()
+        await transaction.rollback()
+        await conn.close()
+
+    print(f"Projeto {project_id}, card {card_id}, BURNDOWN_STRATEGY={settings.BURNDOWN_STRATEGY}")
+    return [
+        Case(f"burndown[db:{settings.BURNDOWN_STRATEGY}]", burndown),
+        Case(
+            "update_card[db]",
+            lambda state: CardRules(state[2]).update_card(card_id, payload, user_id=None),
+            setup=update_setup,
+            teardown=update_teardown,
+        ),
+    ]
+
+
+async def run_cases(cases: list[Case], rounds: int) -> dict:
+    return {case.name: await measure(case, rounds) for case in cases}
+
+
+async def main(args: argparse.Namespace) -> int:
+    cases = offline_cases(args.cards, args.burndown_cards, args.updates, args.tasks, args.tokens)
+    if args.db:
+        cases += await db_cases(args.project_id)
+    try:
+        results = await run_cases(cases, args.rounds)
+    finally:
+        if args.db:
+            from app.db.conection import engine
+
+            await engine.dispose()
+
+    baseline = None
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        if baseline.get("environment") != _environment(args.db):
+            print(
+                f"Baseline gravada em outro ambiente ({baseline.get('environment')}):"
+                " comparação ignorada; grave uma nesta máquina com --save"
+            )
+            baseline = None
+    regressions = compare(results, baseline, args.threshold, args.stat) if baseline else []
+    print(format_report(results, baseline, regressions, args.stat))
+
+    if args.save:
+        cases_saved = dict((baseline or {}).get("cases", {}))
+        cases_saved.update({
+            name: {"min": round(s["min"], 4), "median": round(s["median"], 4)}
+            for name, s in results.items()
+        })
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(
+                {"environment": _environment(args.db), "cases": cases_saved},
+                f,
+                indent=2,
+                ensure_ascii=False,
+            )
+        print(f"Baseline gravada em {args.baseline}")
+        return 0
+    if regressions:
+        print(
+            f"{len(regressions)} caso(s) acima de {args.threshold:.0%} da baseline:"
+            f" {', '.join(regressions)}"
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=30)
+    parser.add_argument("--cards", type=int, default=2000)
+    parser.add_argument("--burndown-cards", type=int, default=100_000)
+    parser.add_argument("--updates", type=int, default=50, help="cards editados por rodada")
+    parser.add_argument("--tasks", type=int, default=40, help="tarefas por card editado")
+    parser.add_argument("--tokens", type=int, default=500)
+    parser.add_argument("--db", action="store_true", help="inclui casos contra o Postgres local")
+    parser.add_argument("--project-id", type=int, help="projeto do --db (padrão: o maior)")
+    parser.add_argument("--baseline", default=BASELINE)
+    parser.add_argument(
+        "--threshold", type=float, default=0.2, help="regressão tolerada (0.2 = 20%%)"
+    )
+    parser.add_argument(
+        "--stat", choices=["min", "median"], default="min", help="estatística comparada"
+    )
+    parser.add_argument("--save", action="store_true", help="grava a baseline")
+    args = parser.parse_args()
+
+    if args.db:
+        from app.generate_table import _guard_against_production
+
+        _guard_against_production()
+    sys.exit(asyncio.run(main(args)))
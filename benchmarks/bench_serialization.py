@@ -0,0 +1,212 @@
+"""
+Benchmark: serialização das respostas JSON da API.
+
+Mede, para payloads de CardSchema, CardPageResponse e MyCardsResponse, os
+caminhos de serialização possíveis no FastAPI:
+
+- jsonresponse: modelo -> dict (mode="json") -> JSONResponse (json.dumps),
+  o que acontece quando a rota define um response_class próprio;
+- orjson:       modelo -> dict (mode="json") -> orjson.dumps, o que faria um
+  default_response_class=ORJSONResponse (só se o orjson estiver instalado);
+- to_json:      modelo -> dict (mode="json") -> pydantic_core.to_json;
+- dump_json:    modelo validado -> bytes direto pelo núcleo Rust do pydantic,
+  caminho usado pelo FastAPI quando a rota tem response_model e nenhum
+  response_class (o padrão da API). Definir um default_response_class
+  desativa esse caminho em todas as rotas.
+
+Também compara, para cards ORM com relacionamentos carregados, a validação
+``from_attributes`` do response_model com os mapeadores pré-compilados de
+app/schemas/serializers.py (row_mapper + to_json). Não acessa o banco.
+
+Uso (a partir do diretório Back-end/):
+    python -m benchmarks.bench_serialization --cards 2000 --runs 50
+"""
+import argparse
+import random
+import statistics
+import time
+from datetime import datetime, timedelta
+
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+from pydantic_core import to_json
+
+import app.db.models.__all_models  # noqa: F401
+from app.db.models.card_model import CardModel
+from app.db.models.category_model import CategoryModel
+from app.db.models.tag_card_model import TagCardModel
+from app.db.models.tag_model import TagModel
+from app.db.models.task_card_model import TaskCardModel
+from app.db.models.user_model import UserModel
+from app.schemas.card_schema import CardPageResponse, CardSchema
+from app.schemas.serializers import card_to_json
+from app.schemas.dashboard_schema import MyCardsResponse
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _user(rnd: random.Random) -> dict:
+    n = rnd.randint(1, 50)
+    return {
+        "id": n,
+        "username": f"user{n}",
+        "first_name": "Maria",
+        "last_name": f"Silva {n}",
+        "email": f"user{n}@example.com",
+    }
+
+
+def _card(rnd: random.Random, n: int, now: datetime) -> dict:
+    created = now - timedelta(days=rnd.randint(1, 365))
+    return {
+        "id": n,
+        "card_number": n,
+        "title": f"Card {n} - {rnd.choice(['Fix', 'Add', 'Refactor', 'Review'])} módulo",
+        "description": "Descrição do card " * rnd.randint(0, 6),
+        "priority": rnd.choice([None, 1, 2, 3, 4, 5]),
+        "story_points": rnd.choice([None, 1, 2, 3, 5, 8]),
+        "list_id": rnd.randint(1, 5),
+        "user_id": rnd.randint(1, 50),
+        "blocked": rnd.random() < 0.1,
+        "sort_order": n,
+        "date": created + timedelta(days=10) if rnd.random() < 0.5 else None,
+        "created_at": created,
+        "updated_at": created + timedelta(days=1),
+        "user": _user(rnd),
+        "tag_cards": [
+            {"id": n * 10 + i, "tag_id": i, "tag": {"id": i, "name": f"tag-{i}"}}
+            for i in range(rnd.randint(0, 3))
+        ],
+        "tasks_card": [
+            {"id": n * 10 + i, "title": f"Tarefa {i}", "completed": rnd.random() < 0.5}
+            for i in range(rnd.randint(0, 4))
+        ],
+    }
+
+
+def _dashboard_card(rnd: random.Random, n: int, now: datetime) -> dict:
+    return {
+        "id": n,
+        "card_number": n,
+        "title": f"Card {n}",
+        "priority": rnd.choice([None, 1, 2, 3]),
+        "date": now - timedelta(days=rnd.randint(-10, 10)),
+        "list_id": rnd.randint(1, 5),
+        "list_name": rnd.choice(["To Do", "Doing", "Review"]),
+        "project_id": rnd.randint(1, 10),
+        "project_title": "Projeto",
+        "user": _user(rnd),
+        "category": {"id": 1, "name": "Bug"},
+    }
+
+
+def build_payloads(cards: int, seed: int = 42) -> dict[str, tuple[type, object]]:
+    """Payloads validados (modelo + instância) usados pelos benchmarks."""
+    rnd = random.Random(seed)
+    now = datetime(2026, 1, 1, 12, 0)
+    quarter = max(cards // 4, 1)
+    return {
+        "card": (CardSchema, CardSchema.model_validate(_card(rnd, 1, now))),
+        f"page-{cards}": (
+            CardPageResponse,
+            CardPageResponse.model_validate({
+                "cards": [_card(rnd, n, now) for n in range(1, cards + 1)],
+                "total": cards * 2,
+                "page": 1,
+                "has_more": True,
+            }),
+        ),
+        f"my-cards-{cards}": (
+            MyCardsResponse,
+            MyCardsResponse.model_validate({
+                key: [_dashboard_card(rnd, n, now) for n in range(quarter)]
+                for key in ("assigned", "due_today", "overdue", "pending_approvals")
+            }),
+        ),
+    }
+
+
+def build_orm_cards(cards: int, seed: int = 42) -> list[CardModel]:
+    """Cards ORM (sem sessão) com usuário, categoria, tags e tarefas carregados."""
+    rnd = random.Random(seed)
+    now = datetime(2026, 1, 1, 12, 0)
+    users = [
+        UserModel(
+            id=n, username=f"user{n}", firstName="Maria", lastName=f"Silva {n}",
+            email=f"user{n}@example.com", isAdmin=False,
+        )
+        for n in range(1, 51)
+    ]
+    tags = [TagModel(id=n, name=f"tag-{n}") for n in range(10)]
+    category = CategoryModel(id=1, name="Bug")
+    rows = []
+    for n in range(1, cards + 1):
+        data = _card(rnd, n, now)
+        card = CardModel(**{
+            k: v for k, v in data.items() if k not in ("user", "tag_cards", "tasks_card")
+        })
+        card.user = rnd.choice(users)
+        card.category = category
+        card.tag_cards = [
+            TagCardModel(id=t["id"], cardId=n, tagId=t["tag_id"], tag=tags[t["tag_id"]])
+            for t in data["tag_cards"]
+        ]
+        card.tasks_card = [TaskCardModel(**t) for t in data["tasks_card"]]
+        card.comments, card.approvers = [], []
+        rows.append(card)
+    return rows
+
+
+def _time(runs: int, fn) -> float:
+    fn()  # aquecimento
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def main(cards: int, runs: int) -> None:
+    for label, (model, value) in build_payloads(cards).items():
+        adapter = TypeAdapter(model)
+
+        def as_dict():
+            return adapter.dump_python(value, mode="json", by_alias=True)
+
+        paths = {
+            "jsonresponse": lambda: JSONResponse(as_dict()).body,
+            "to_json": lambda: to_json(as_dict()),
+            "dump_json": lambda: adapter.dump_json(value, by_alias=True),
+        }
+        if orjson is not None:
+            paths["orjson"] = lambda: orjson.dumps(as_dict())
+
+        size = len(adapter.dump_json(value, by_alias=True))
+        print(f"{label} ({size / 1024:.1f} KB)")
+        for name, fn in paths.items():
+            print(f"  {name:<13} {_time(runs, fn):8.3f} ms")
+
+    orm_cards = build_orm_cards(cards)
+    adapter = TypeAdapter(list[CardSchema])
+    paths = {
+        "validate": lambda: adapter.dump_json(
+            adapter.validate_python(orm_cards), by_alias=True
+        ),
+        "row_mapper": lambda: to_json([card_to_json(c) for c in orm_cards]),
+    }
+    print(f"orm-cards-{cards}")
+    for name, fn in paths.items():
+        print(f"  {name:<13} {_time(runs, fn):8.3f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--cards", type=int, default=2000)
+    parser.add_argument("--runs", type=int, default=50)
+    args = parser.parse_args()
+
+    main(args.cards, args.runs)
@@ -0,0 +1,354 @@
+"""
+Teste de carga: jornadas de usuário contra um servidor local.
+
+Cada usuário virtual faz login com um usuário do conjunto gerado por
+app/seed_large_dataset.py, abre um quadro e repete passos sorteados por peso
+(paginar listas, abrir card, arrastar card, editar, comentar, acompanhar o
+dashboard) com um tempo de pensamento entre eles. Ao final mostra, por rota,
+o número de requisições, erros, requisições/s e as latências p50/p95/p99.
+
+A sequência de passos é determinística pelo ``--seed``: com o mesmo conjunto
+de dados, a mesma concorrência e a mesma duração, duas versões da API recebem
+a mesma carga. ``--output`` grava o resultado em JSON e ``--baseline`` compara
+com um resultado anterior. Os rótulos das rotas são os mesmos da métrica
+http_request_duration_seconds do /metrics.
+
+Suba o servidor com ``RATE_LIMIT_ENABLED=False``: o limite por usuário/IP
+transformaria a carga em respostas 429. ``--read-only`` pula os passos que
+escrevem (arrastar, editar, comentar) para não alterar o conjunto de dados.
+
+Uso (a partir do diretório Back-end/):
+    python -m benchmarks.load_test --concurrency 50 --duration 120 --output v2.json
+    python -m benchmarks.load_test --concurrency 50 --duration 120 --baseline v1.json
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+
+import httpx
+
+API = "/api"
+READ_STEPS = {"page_list", "open_card", "poll_dashboard", "open_board"}
+
+
+@dataclass
+class LoadOptions:
+    base_url: str = "http://localhost:8000"
+    concurrency: int = 20
+    duration: float = 60.0
+    ramp_up: float = 5.0
+    think_ms: float = 500.0
+    page_size: int = 20
+    email: str = "seed{n}@example.com"
+    password: str = "seed1234"
+    first_user: int = 1
+    user_pool: int = 2000
+    read_only: bool = False
+    seed: int = 42
+
+
+# Peso de cada passo da jornada depois do login e da abertura do quadro
+STEPS = {
+    "page_list": 30,
+    "open_card": 30,
+    "poll_dashboard": 15,
+    "drag_card": 10,
+    "edit_card": 6,
+    "comment": 6,
+    "open_board": 3,
+}
+
+
+class Recorder:
+    """Latências (ms) e status por rota."""
+
+    def __init__(self):
+        self.latencies: dict[str, list[float]] = defaultdict(list)
+        self.statuses: dict[str, Counter] = defaultdict(Counter)
+
+    def add(self, route: str, ms: float, status: int) -> None:
+        self.latencies[route].append(ms)
+        self.statuses[route][status] += 1
+
+
+def percentile(values: list[float], p: float) -> float:
+    """Percentil por posição mais próxima (``values`` ordenado)."""
+    if not values:
+        return 0.0
+    rank = max(1, -(-len(values) * p // 100))
+    return values[int(rank) - 1]
+
+
+def summarize(recorder: Recorder, elapsed: float) -> dict:
+    routes = {}
+    for route in sorted(recorder.latencies):
+        values = sorted(recorder.latencies[route])
+        statuses = recorder.statuses[route]
+        routes[route] = {
+            "count": len(values),
+            "errors": sum(n for status, n in statuses.items() if not 200 <= status < 400),
+            "rps": round(len(values) / elapsed, 2),
+            "p50": round(percentile(values, 50), 1),
+            "p95": round(percentile(values, 95), 1),
+            "p99": round(percentile(values, 99), 1),
+            "max": round(values[-1], 1),
+            "statuses": {str(status): n for status, n in sorted(statuses.items())},
+        }
+    requests = sum(r["count"] for r in routes.values())
+    return {
+        "elapsed_s": round(elapsed, 1),
+        "requests": requests,
+        "errors": sum(r["errors"] for r in routes.values()),
+        "rps": round(requests / elapsed, 2) if elapsed else 0.0,
+        "routes": routes,
+    }
+
+
+def format_report(summary: dict, baseline: dict | None = None) -> str:
+    width = max([len(route) for route in summary["routes"]] + [5])
+    header = f"{'rota':<{width}} {'n':>7} {'erros':>6} {'req/s':>8} {'p50':>8} {'p95':>8} {'p99':>8}"
+    if baseline:
+        header += f" {'Δp95':>8}"
+    lines = [header]
+    for route, stats in summary["routes"].items():
+        line = (
+            f"{route:<{width}} {stats['count']:>7} {stats['errors']:>6} {stats['rps']:>8.1f}"
+            f" {stats['p50']:>8.1f} {stats['p95']:>8.1f} {stats['p99']:>8.1f}"
+        )
+        before = (baseline or {}).get("routes", {}).get(route)
+        if before and before["p95"]:
+            line += f" {(stats['p95'] - before['p95']) / before['p95']:>+8.0%}"
+        elif baseline:
+            line += f" {'-':>8}"
+        lines.append(line)
+    lines.append(
+        f"total: {summary['requests']} requisições em {summary['elapsed_s']}s"
+        f" ({summary['rps']:.1f} req/s), {summary['errors']} erros"
+    )
+    if baseline:
+        lines.append(f"baseline: {baseline['rps']:.1f} req/s, {baseline['errors']} erros")
+    return "\n".join(lines)
+
+
+class VirtualUser:
+    def __init__(
+        self, client: httpx.AsyncClient, recorder: Recorder, options: LoadOptions, index: int
+    ):
+        self.client = client
+        self.recorder = recorder
+        self.options = options
+        self.index = index
+        self.rng = random.Random(options.seed * 100_003 + index)
+        self.project_id: int | None = None
+        self.lists: list[int] = []
+        self.cards: list[dict] = []
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        body=None,
+        query: dict | None = None,
+        form: dict | None = None,
+        **params,
+    ) -> httpx.Response | None:
+        """Faz a requisição e registra a latência com o rótulo ``MÉTODO /api/rota/{param}``."""
+        started = time.perf_counter()
+        try:
+            response = await self.client.request(
+                method, API + path.format(**params), json=body, params=query, data=form
+            )
+            status = response.status_code
+        except httpx.HTTPError:
+            response, status = None, 0
+        self.recorder.add(f"{method} {API}{path}", (time.perf_counter() - started) * 1000, status)
+        if response is None or status >= 400:
+            return None
+        return response
+
+    async def login(self) -> bool:
+        """Entra com o primeiro usuário do seu grupo que participa de algum projeto."""
+        pool = self.options.user_pool
+        for offset in range(self.index % pool, pool, self.options.concurrency):
+            email = self.options.email.format(n=self.options.first_user + offset)
+            response = await self.request(
+                "POST", "/users/login", form={"username": email, "password": self.options.password}
+            )
+            if response is None:
+                continue
+            token = response.json()["accessToken"]
+            self.client.headers["Authorization"] = f"Bearer {token}"
+            if await self.open_board():
+                return True
+        return False
+
+    async def open_board(self) -> bool:
+        response = await self.request("GET", "/projects/")
+        projects = response.json() if response is not None else []
+        if not projects:
+            return False
+        # Os primeiros projetos do usuário concentram o uso
+        self.project_id = projects[min(int(self.rng.expovariate(1.0)), len(projects) - 1)]["id"]
+        await self.request("GET", "/projects/{project_id}", project_id=self.project_id)
+        response = await self.request(
+            "GET", "/projects/{project_id}/lists/", project_id=self.project_id
+        )
+        self.lists = [lst["id"] for lst in response.json()] if response is not None else []
+        self.cards = []
+        for list_id in self.lists:
+            await self._load_cards(list_id, page=1)
+        return True
+
+    async def _load_cards(self, list_id: int, page: int) -> dict | None:
+        response = await self.request(
+            "GET",
+            "/projects/{project_id}/lists/{list_id}/cards",
+            query={"page": page, "limit": self.options.page_size},
+            project_id=self.project_id,
+            list_id=list_id,
+        )
+        if response is None:
+            return None
+        data = response.json()
+        known = {card["id"] for card in self.cards}
+        self.cards.extend(card for card in data["cards"] if card["id"] not in known)
+        return data
+
+    async def page_list(self) -> None:
+        if not self.lists:
+            return
+        list_id = self.rng.choice(self.lists)
+        page = 1
+        while page <= 1 + int(self.rng.expovariate(1.0)):
+            data = await self._load_cards(list_id, page)
+            if data is None or not data.get("hasMore"):
+                break
+            page += 1
+
+    async def open_card(self) -> None:
+        if not self.cards:
+            return
+        card = self.rng.choice(self.cards)
+        await self.request("GET", "/cards/{card_id}", card_id=card["id"])
+        if self.rng.random() < 0.3:
+            await self.request("GET", "/cards/{card_id}/history", card_id=card["id"])
+
+    async def drag_card(self) -> None:
+        if not self.cards or len(self.lists) < 2:
+            return
+        card = self.rng.choice(self.cards)
+        target = self.rng.choice([list_id for list_id in self.lists if list_id != card["listId"]])
+        response = await self.request(
+            "PUT", "/cards/{card_id}", {"listId": target, "sortOrder": 0}, card_id=card["id"]
+        )
+        if response is None:
+            return
+        card["listId"] = target
+        column = [c for c in self.cards if c["listId"] == target]
+        column.remove(card)
+        column.insert(0, card)
+        items = [{"cardId": c["id"], "sortOrder": order} for order, c in enumerate(column)]
+        await self.request("PUT", "/cards/reorder", {"items": items})
+
+    async def edit_card(self) -> None:
+        if not self.cards:
+            return
+        card = self.rng.choice(self.cards)
+        body = {"title": f"Card {card['id']} (carga {self.rng.randrange(10_000)})"}
+        if self.rng.random() < 0.5:
+            body["description"] = "Editado pelo teste de carga."
+        await self.request("PUT", "/cards/{card_id}", body, card_id=card["id"])
+
+    async def comment(self) -> None:
+        if not self.cards:
+            return
+        card = self.rng.choice(self.cards)
+        await self.request(
+            "POST", "/comments/card/{card_id}", {"description": "Comentário do teste de carga."},
+            card_id=card["id"],
+        )
+
+    async def poll_dashboard(self) -> None:
+        await self.request("GET", "/dashboard/my-cards")
+        await self.request("GET", "/dashboard/my-day")
+        if self.project_id is None:
+            return
+        for chart in ("stats", "burndown", "throughput"):
+            await self.request(
+                "GET", "/dashboard/project/{project_id}/" + chart, project_id=self.project_id
+            )
+
+    async def run(self, deadline: float) -> None:
+        await asyncio.sleep(self.options.ramp_up * self.index / max(self.options.concurrency, 1))
+        if time.monotonic() >= deadline or not await self.login():
+            return
+        steps = [s for s in STEPS if not self.options.read_only or s in READ_STEPS]
+        weights = [STEPS[s] for s in steps]
+        while time.monotonic() < deadline:
+            await getattr(self, self.rng.choices(steps, weights)[0])()
+            think = self.options.think_ms / 1000
+            await asyncio.sleep(self.rng.expovariate(1 / think) if think else 0)
+
+
+async def run_load(options: LoadOptions, transport: httpx.AsyncBaseTransport | None = None) -> dict:
+    recorder = Recorder()
+    limits = httpx.Limits(max_connections=options.concurrency * 2)
+    started = time.monotonic()
+    deadline = started + options.duration
+
+    async def virtual_user(index: int) -> None:
+        # Um cliente por usuário virtual: cada um tem seu token
+        async with httpx.AsyncClient(
+            base_url=options.base_url, transport=transport, limits=limits, timeout=30.0
+        ) as client:
+            await VirtualUser(client, recorder, options, index).run(deadline)
+
+    await asyncio.gather(*(virtual_user(i) for i in range(options.concurrency)))
+    return summarize(recorder, time.monotonic() - started)
+
+
+def main(options: LoadOptions, output: str | None, baseline: str | None) -> None:
+    print(
+        f"{options.concurrency} usuários virtuais por {options.duration:.0f}s"
+        f" contra {options.base_url}"
+        + (" (somente leitura)" if options.read_only else "")
+    )
+    summary = asyncio.run(run_load(options))
+    previous = None
+    if baseline:
+        with open(baseline, encoding="utf-8") as f:
+            previous = json.load(f)
+    print(format_report(summary, previous))
+    if any(r["statuses"].get("429") for r in summary["routes"].values()):
+        print("Aviso: respostas 429 — suba o servidor com RATE_LIMIT_ENABLED=False.")
+    if output:
+        with open(output, "w", encoding="utf-8") as f:
+            json.dump({"options": vars(options), **summary}, f, indent=2, ensure_ascii=False)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--base-url", default=LoadOptions.base_url)
+    parser.add_argument("--concurrency", type=int, default=LoadOptions.concurrency)
+    parser.add_argument("--duration", type=float, default=LoadOptions.duration, help="segundos")
+    parser.add_argument("--ramp-up", type=float, default=LoadOptions.ramp_up, help="segundos")
+    parser.add_argument(
+        "--think-ms", type=float, default=LoadOptions.think_ms, help="média entre passos"
+    )
+    parser.add_argument("--page-size", type=int, default=LoadOptions.page_size)
+    parser.add_argument("--email", default=LoadOptions.email, help="modelo com {n}")
+    parser.add_argument("--password", default=LoadOptions.password)
+    parser.add_argument("--first-user", type=int, default=LoadOptions.first_user)
+    parser.add_argument("--user-pool", type=int, default=LoadOptions.user_pool)
+    parser.add_argument("--read-only", action="store_true")
+    parser.add_argument("--seed", type=int, default=LoadOptions.seed)
+    parser.add_argument("--output", help="grava o resultado em JSON")
+    parser.add_argument("--baseline", help="JSON de uma execução anterior para comparar")
+    args = vars(parser.parse_args())
+    output, baseline = args.pop("output"), args.pop("baseline")
+
+    main(LoadOptions(**args), output, baseline)
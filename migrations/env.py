@@ -0,0 +1,63 @@
+"""
+Ambiente do Alembic: usa o mesmo DB_URL e os mesmos models da aplicação.
+
+Roda separado do servidor (a aplicação não faz DDL no startup):
+    alembic upgrade head
+"""
+import asyncio
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import create_async_engine
+
+import app.db.models.__all_models  # noqa: F401
+from app.core.configs import settings
+
+config = context.config
+
+if config.config_file_name is not None:
+    # Não silencia os loggers da aplicação quando rodado em processo (generate_table.py)
+    fileConfig(config.config_file_name, disable_existing_loggers=False)
+
+target_metadata = settings.DBBaseModel.metadata
+
+
+def run_migrations_offline() -> None:
+    """Gera o SQL sem conectar (``alembic upgrade head --sql``)."""
+    context.configure(
+        url=settings.DB_URL,
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def do_run_migrations(connection: Connection) -> None:
+    context.configure(connection=connection, target_metadata=target_metadata)
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+async def run_async_migrations() -> None:
+    engine = create_async_engine(settings.DB_URL, connect_args={"statement_cache_size": 0})
+    async with engine.connect() as connection:
+        await connection.run_sync(do_run_migrations)
+    await engine.dispose()
+
+
+def run_migrations_online() -> None:
+    # Conexão recebida de quem chamou (ex.: app.generate_table), já dentro de um event loop
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        do_run_migrations(connection)
+    else:
+        asyncio.run(run_async_migrations())
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
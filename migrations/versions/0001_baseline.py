@@ -0,0 +1,202 @@
+"""Baseline: esquema criado pelo startup da aplicação antes das migrações.
+
+Equivale ao antigo create_all + ALTER TABLE ... ADD COLUMN IF NOT EXISTS do
+startup. Bancos criados antes das migrações já estão neste ponto: marque-os com
+``alembic stamp 0001_baseline`` e rode ``alembic upgrade head`` para aplicar o
+restante. Tabelas e índices adicionados depois ficam nas revisões seguintes.
+
+Revision ID: 0001_baseline
+Revises:
+Create Date: 2026-10-19
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0001_baseline"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('categories',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('name', sa.String(length=100), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('name')
+    )
+    op.create_table('roles',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('name', sa.String(length=50), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('name')
+    )
+    op.create_table('users',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('firstName', sa.String(length=256), nullable=False),
+        sa.Column('lastName', sa.String(length=256), nullable=True),
+        sa.Column('email', sa.String(length=256), nullable=False),
+        sa.Column('username', sa.String(length=256), nullable=False),
+        sa.Column('password', sa.String(length=256), nullable=False),
+        sa.Column('isAdmin', sa.Boolean(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_users_email'), 'users', ['email'], unique=True)
+    op.create_index(op.f('ix_users_username'), 'users', ['username'], unique=True)
+    op.create_table('projects',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('title', sa.String(length=100), nullable=True),
+        sa.Column('description', sa.String(length=1000), nullable=True),
+        sa.Column('createdAt', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+        sa.Column('updatedAt', sa.DateTime(), nullable=True),
+        sa.Column('creatorId', sa.Integer(), nullable=True),
+        sa.ForeignKeyConstraint(['creatorId'], ['users.id'], ),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('user_notes',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('content', sa.Text(), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('user_id')
+    )
+    op.create_table('lists',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('name', sa.String(length=100), nullable=True),
+        sa.Column('order', sa.Integer(), nullable=True),
+        sa.Column('isFinal', sa.Boolean(), server_default='false', nullable=False),
+        sa.Column('projectId', sa.Integer(), nullable=True),
+        sa.ForeignKeyConstraint(['projectId'], ['projects.id'], ),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('projectUsers',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('projectId', sa.Integer(), nullable=True),
+        sa.Column('userId', sa.Integer(), nullable=True),
+        sa.Column('roleId', sa.Integer(), nullable=True),
+        sa.ForeignKeyConstraint(['projectId'], ['projects.id'], ),
+        sa.ForeignKeyConstraint(['roleId'], ['roles.id'], ),
+        sa.ForeignKeyConstraint(['userId'], ['users.id'], ),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('projectId', 'userId', name='uq_project_user')
+    )
+    op.create_table('tags',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('name', sa.String(length=100), nullable=True),
+        sa.Column('projectId', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['projectId'], ['projects.id'], ),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('cards',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('cardNumber', sa.Integer(), nullable=False),
+        sa.Column('title', sa.String(length=255), nullable=False),
+        sa.Column('createdAt', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+        sa.Column('updatedAt', sa.DateTime(), nullable=True),
+        sa.Column('listId', sa.Integer(), nullable=False),
+        sa.Column('userId', sa.Integer(), nullable=True),
+        sa.Column('date', sa.DateTime(), nullable=True),
+        sa.Column('startDate', sa.DateTime(), nullable=True),
+        sa.Column('endDate', sa.DateTime(), nullable=True),
+        sa.Column('completedAt', sa.DateTime(), nullable=True),
+        sa.Column('priority', sa.Integer(), nullable=True),
+        sa.Column('description', sa.String(length=1000), nullable=True),
+        sa.Column('plannedHours', sa.Integer(), nullable=True),
+        sa.Column('completedHours', sa.Integer(), nullable=True),
+        sa.Column('storyPoints', sa.Integer(), nullable=True),
+        sa.Column('blocked', sa.Boolean(), nullable=False),
+        sa.Column('sortOrder', sa.Integer(), nullable=True),
+        sa.Column('categoryId', sa.Integer(), nullable=True),
+        sa.ForeignKeyConstraint(['categoryId'], ['categories.id'], ),
+        sa.ForeignKeyConstraint(['listId'], ['lists.id'], ),
+        sa.ForeignKeyConstraint(['userId'], ['users.id'], ),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('approvers',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('environment', sa.String(length=100), nullable=True),
+        sa.Column('userId', sa.Integer(), nullable=True),
+        sa.Column('cardId', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['cardId'], ['cards.id'], ),
+        sa.ForeignKeyConstraint(['userId'], ['users.id'], ),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('card_dependencies',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('cardId', sa.Integer(), nullable=False),
+        sa.Column('relatedCardId', sa.Integer(), nullable=False),
+        sa.Column('createdAt', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+        sa.ForeignKeyConstraint(['cardId'], ['cards.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['relatedCardId'], ['cards.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('cardId', 'relatedCardId', name='uq_card_dependency')
+    )
+    op.create_index(op.f('ix_card_dependencies_cardId'), 'card_dependencies', ['cardId'], unique=False)
+    op.create_index(op.f('ix_card_dependencies_relatedCardId'), 'card_dependencies', ['relatedCardId'], unique=False)
+    op.create_table('card_history',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('cardId', sa.Integer(), nullable=False),
+        sa.Column('userId', sa.Integer(), nullable=True),
+        sa.Column('action', sa.String(length=50), nullable=False),
+        sa.Column('oldValue', sa.String(length=255), nullable=True),
+        sa.Column('newValue', sa.String(length=255), nullable=True),
+        sa.Column('createdAt', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+        sa.ForeignKeyConstraint(['cardId'], ['cards.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['userId'], ['users.id'], ),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_card_history_cardId'), 'card_history', ['cardId'], unique=False)
+    op.create_table('comments',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('description', sa.String(length=1000), nullable=True),
+        sa.Column('createdAt', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+        sa.Column('updatedAt', sa.DateTime(), nullable=True),
+        sa.Column('userId', sa.Integer(), nullable=False),
+        sa.Column('cardId', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['cardId'], ['cards.id'], ),
+        sa.ForeignKeyConstraint(['userId'], ['users.id'], ),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('tagCards',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('cardId', sa.Integer(), nullable=False),
+        sa.Column('tagId', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['cardId'], ['cards.id'], ),
+        sa.ForeignKeyConstraint(['tagId'], ['tags.id'], ),
+        sa.PrimaryKeyConstraint('id', 'cardId', 'tagId')
+    )
+    op.create_table('tasksCard',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('title', sa.String(length=255), nullable=True),
+        sa.Column('date', sa.String(length=50), nullable=True),
+        sa.Column('completed', sa.Boolean(), nullable=False),
+        sa.Column('userId', sa.Integer(), nullable=True),
+        sa.Column('cardId', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['cardId'], ['cards.id'], ),
+        sa.ForeignKeyConstraint(['userId'], ['users.id'], ),
+        sa.PrimaryKeyConstraint('id')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('tasksCard')
+    op.drop_table('tagCards')
+    op.drop_table('comments')
+    op.drop_index(op.f('ix_card_history_cardId'), table_name='card_history')
+    op.drop_table('card_history')
+    op.drop_index(op.f('ix_card_dependencies_relatedCardId'), table_name='card_dependencies')
+    op.drop_index(op.f('ix_card_dependencies_cardId'), table_name='card_dependencies')
+    op.drop_table('card_dependencies')
+    op.drop_table('approvers')
+    op.drop_table('cards')
+    op.drop_table('tags')
+    op.drop_table('projectUsers')
+    op.drop_table('lists')
+    op.drop_table('user_notes')
+    op.drop_table('projects')
+    op.drop_index(op.f('ix_users_username'), table_name='users')
+    op.drop_index(op.f('ix_users_email'), table_name='users')
+    op.drop_table('users')
+    op.drop_table('roles')
+    op.drop_table('categories')
@@ -0,0 +1,84 @@
+"""Tabelas e índices do dashboard, da outbox de e-mails e do rate limit.
+
+Objetos adicionados depois da baseline: project_stats e project_snapshots
+(estatísticas materializadas e fotos diárias), email_outbox, rate_limit_buckets,
+os ids de lista no histórico de movimentação e os índices usados pelas
+consultas de burndown, CFD e throughput.
+
+Revision ID: 0002_dashboard_outbox_rate_limit
+Revises: 0001_baseline
+Create Date: 2026-10-19
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0002_dashboard_outbox_rate_limit"
+down_revision = "0001_baseline"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('email_outbox',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('to', sa.String(length=255), nullable=False),
+        sa.Column('subject', sa.String(length=255), nullable=False),
+        sa.Column('body', sa.Text(), nullable=True),
+        sa.Column('status', sa.String(length=20), nullable=False),
+        sa.Column('attempts', sa.Integer(), nullable=False),
+        sa.Column('nextAttemptAt', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+        sa.Column('lastError', sa.String(length=500), nullable=True),
+        sa.Column('createdAt', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+        sa.Column('sentAt', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_email_outbox_status_next_attempt', 'email_outbox', ['status', 'nextAttemptAt'], unique=False)
+    op.create_table('rate_limit_buckets',
+        sa.Column('key', sa.String(length=255), nullable=False),
+        sa.Column('tokens', sa.Float(), nullable=False),
+        sa.Column('updatedAt', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('key')
+    )
+    op.create_table('project_snapshots',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('projectId', sa.Integer(), nullable=False),
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('remainingPoints', sa.Integer(), nullable=False),
+        sa.Column('totalPoints', sa.Integer(), nullable=False),
+        sa.Column('openCards', sa.Integer(), nullable=False),
+        sa.Column('closedCards', sa.Integer(), nullable=False),
+        sa.Column('byList', sa.JSON(), nullable=False),
+        sa.Column('createdAt', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+        sa.ForeignKeyConstraint(['projectId'], ['projects.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('projectId', 'day', name='uq_project_snapshot_day')
+    )
+    op.create_table('project_stats',
+        sa.Column('projectId', sa.Integer(), nullable=False),
+        sa.Column('byList', sa.JSON(), nullable=False),
+        sa.Column('byPriority', sa.JSON(), nullable=False),
+        sa.Column('byTag', sa.JSON(), nullable=False),
+        sa.Column('leadTimeSum', sa.Float(), nullable=False),
+        sa.Column('leadTimeCount', sa.Integer(), nullable=False),
+        sa.Column('cycleTimeSum', sa.Float(), nullable=False),
+        sa.Column('cycleTimeCount', sa.Integer(), nullable=False),
+        sa.Column('updatedAt', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+        sa.ForeignKeyConstraint(['projectId'], ['projects.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('projectId')
+    )
+    op.add_column('card_history', sa.Column('oldListId', sa.Integer(), nullable=True))
+    op.add_column('card_history', sa.Column('newListId', sa.Integer(), nullable=True))
+    op.create_index('ix_card_history_action_created_at', 'card_history', ['action', 'createdAt'], unique=False)
+    op.create_index(op.f('ix_cards_completedAt'), 'cards', ['completedAt'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_cards_completedAt'), table_name='cards')
+    op.drop_index('ix_card_history_action_created_at', table_name='card_history')
+    op.drop_column('card_history', 'newListId')
+    op.drop_column('card_history', 'oldListId')
+    op.drop_table('project_stats')
+    op.drop_table('project_snapshots')
+    op.drop_table('rate_limit_buckets')
+    op.drop_index('ix_email_outbox_status_next_attempt', table_name='email_outbox')
+    op.drop_table('email_outbox')
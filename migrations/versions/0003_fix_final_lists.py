@@ -0,0 +1,53 @@
+"""Dados: is_final só na última lista de cada projeto e completedAt coerente.
+
+Substitui o script avulso fix_final_lists.py. A última lista (maior "order")
+de cada projeto vira a final; cards fora dela perdem completedAt e cards nela
+sem completedAt recebem createdAt como data de conclusão. Idempotente.
+
+Revision ID: 0003_fix_final_lists
+Revises: 0002_dashboard_outbox_rate_limit
+Create Date: 2026-10-19
+"""
+from alembic import op
+
+revision = "0003_fix_final_lists"
+down_revision = "0002_dashboard_outbox_rate_limit"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        UPDATE lists l
+        SET "isFinal" = (l.id = last.id)
+        FROM (
+            SELECT DISTINCT ON ("projectId") "projectId", id
+            FROM lists
+            ORDER BY "projectId", "order" DESC NULLS LAST, id DESC
+        ) AS last
+        WHERE l."projectId" = last."projectId"
+          AND l."isFinal" IS DISTINCT FROM (l.id = last.id)
+        """
+    )
+    op.execute(
+        """
+        UPDATE cards c
+        SET "completedAt" = NULL
+        FROM lists l
+        WHERE l.id = c."listId" AND NOT l."isFinal" AND c."completedAt" IS NOT NULL
+        """
+    )
+    op.execute(
+        """
+        UPDATE cards c
+        SET "completedAt" = c."createdAt"
+        FROM lists l
+        WHERE l.id = c."listId" AND l."isFinal" AND c."completedAt" IS NULL
+        """
+    )
+
+
+def downgrade() -> None:
+    # Correção de dados: não há estado anterior a restaurar
+    pass